@@ -116,6 +116,16 @@ logger = setup_logging(logging_level, logging_stream)
     "--enabled-tools",
     help="Comma-separated list of tools to enable (enables all if not specified)",
 )
+@click.option(
+    "--json-format",
+    type=click.Choice(["pretty", "compact"]),
+    help="Format of JSON tool responses: indented (pretty) or minified (compact)",
+)
+@click.option(
+    "--profile-dir",
+    type=click.Path(file_okay=False),
+    help="Profile sampled tool calls and save the profiles of slow ones to this directory",
+)
 @click.option(
     "--oauth-client-id",
     help="OAuth 2.0 client ID for Atlassian Cloud",
@@ -163,6 +173,8 @@ def main(
     jira_projects_filter: str | None,
     read_only: bool,
     enabled_tools: str | None,
+    json_format: str | None,
+    profile_dir: str | None,
     oauth_client_id: str | None,
     oauth_client_secret: str | None,
     oauth_redirect_uri: str | None,
@@ -305,6 +317,10 @@ def main(
         os.environ["JIRA_SSL_VERIFY"] = str(jira_ssl_verify).lower()
     if click_ctx and was_option_provided(click_ctx, "jira_projects_filter"):
         os.environ["JIRA_PROJECTS_FILTER"] = jira_projects_filter
+    if click_ctx and was_option_provided(click_ctx, "json_format"):
+        os.environ["MCP_JSON_FORMAT"] = json_format
+    if click_ctx and was_option_provided(click_ctx, "profile_dir"):
+        os.environ["MCP_PROFILE_DIR"] = profile_dir
 
     from mcp_atlassian.servers import main_mcp
 
@@ -3,6 +3,7 @@
 This module provides access to Confluence content through the Model Context Protocol.
 """
 
+from ..utils.tracing import instrument_methods
 from .client import ConfluenceClient
 from .comments import CommentsMixin
 from .config import ConfluenceConfig
@@ -25,4 +26,7 @@ class ConfluenceFetcher(
     pass
 
 
+# Trace every fetcher method when tracing is enabled
+instrument_methods(ConfluenceFetcher, "confluence")
+
 __all__ = ["ConfluenceFetcher", "ConfluenceConfig", "ConfluenceClient"]
@@ -8,8 +8,10 @@ from requests import Session
 
 from ..exceptions import MCPAtlassianAuthenticationError
 from ..utils.logging import get_masked_session_headers, log_config_param, mask_sensitive
+from ..utils.metrics import instrument_rest_client
 from ..utils.oauth import configure_oauth_session
 from ..utils.ssl import configure_ssl_verification
+from ..utils.tracing import trace_rest_client
 from .config import ConfluenceConfig
 
 # Configure logging
@@ -120,6 +122,10 @@ class ConfluenceClient(AttachmentsMixin):
         if self.config.custom_headers:
             self._apply_custom_headers()
 
+        # Count and trace requests when metrics or tracing are enabled
+        instrument_rest_client(self.confluence, "confluence")
+        trace_rest_client(self.confluence, "confluence")
+
         # Import here to avoid circular imports
         from ..preprocessing.confluence import ConfluencePreprocessor
 
@@ -47,4 +47,12 @@ RESERVED_CQL_WORDS = {
     "update",
 }
 
+# Page fields that may be truncated to honour a response budget, highest
+# priority first. Paths are relative to the simplified page dictionary.
+BUDGETED_PAGE_FIELDS: tuple[str, ...] = (
+    "content.value",
+    "ancestors",
+    "attachments",
+)
+
 # Add other Confluence-specific constants here if needed in the future.
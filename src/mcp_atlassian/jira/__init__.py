@@ -8,8 +8,10 @@ This module provides various Jira API client implementations.
 # Re-export the Jira class for backward compatibility
 from atlassian.jira import Jira
 
+from ..utils.tracing import instrument_methods
 from .client import JiraClient
 from .comments import CommentsMixin
+from .cycle_time import CycleTimeMixin
 from .config import JiraConfig
 from .epics import EpicsMixin
 from .fields import FieldsMixin
@@ -18,6 +20,7 @@ from .issues import IssuesMixin
 from .links import LinksMixin
 from .projects import ProjectsMixin
 from .search import SearchMixin
+from .sprint_analytics import SprintAnalyticsMixin
 from .sprints import SprintsMixin
 from .transitions import TransitionsMixin
 from .users import UsersMixin
@@ -39,6 +42,8 @@ class JiraFetcher(
     UsersMixin,
     BoardsMixin,
     SprintsMixin,
+    SprintAnalyticsMixin,
+    CycleTimeMixin,
     AttachmentsMixin,
     LinksMixin,
 ):
@@ -58,6 +63,8 @@ class JiraFetcher(
     - UsersMixin: User operations
     - BoardsMixin: Board operations
     - SprintsMixin: Sprint operations
+    - SprintAnalyticsMixin: Sprint velocity, burndown and scope change reports
+    - CycleTimeMixin: Status dwell, cycle time and lead time metrics
     - AttachmentsMixin: Attachment download operations
     - LinksMixin: Issue link operations
 
@@ -68,4 +75,7 @@ class JiraFetcher(
     pass
 
 
+# Trace every fetcher method when tracing is enabled
+instrument_methods(JiraFetcher, "jira")
+
 __all__ = ["JiraFetcher", "JiraConfig", "JiraClient", "Jira"]
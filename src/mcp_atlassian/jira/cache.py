@@ -0,0 +1,55 @@
+"""Process-wide caches of Jira metadata.
+
+Keys start with the instance URL. Caches whose content depends on the
+permissions of the caller also include a fingerprint of the credentials (see
+JiraClient._cache_scope), so users never see each other's metadata.
+"""
+
+from typing import Any
+
+from ..utils.cache import SharedCache
+from .constants import (
+    CATALOG_CACHE_TTLS,
+    CREATEMETA_CACHE_TTL,
+    EPIC_SCHEMA_CACHE_TTL,
+    EPIC_STRATEGY_CACHE_TTL,
+    PROJECT_PERMISSION_CACHE_TTL,
+    SPRINT_ANALYTICS_CACHE_TTLS,
+)
+
+# Epic field IDs discovered per Jira instance, keyed by URL
+epic_schema_cache: SharedCache[dict[str, str]] = SharedCache(
+    "jira_epic_schema", ttl=EPIC_SCHEMA_CACHE_TTL
+)
+
+# Winning epic child query strategy, keyed by (url, credentials, project key)
+epic_strategy_cache: SharedCache[str] = SharedCache(
+    "jira_epic_strategy", ttl=EPIC_STRATEGY_CACHE_TTL
+)
+
+# Issue types and required create fields per project, keyed by
+# (url, credentials, kind, project key[, issue type])
+createmeta_cache: SharedCache[Any] = SharedCache(
+    "jira_createmeta", ttl=CREATEMETA_CACHE_TTL
+)
+
+# Whether a user may browse a project, keyed by
+# (url, credentials, username, project key)
+project_permission_cache: SharedCache[bool] = SharedCache(
+    "jira_project_permissions",
+    ttl=PROJECT_PERMISSION_CACHE_TTL,
+    maxsize=16384,
+)
+
+# Project catalog data per kind ("projects", "components", "versions"),
+# keyed by (url, credentials, ...). Entry TTLs come from the configuration.
+catalog_caches: dict[str, SharedCache[list[dict[str, Any]]]] = {
+    kind: SharedCache(f"jira_catalog_{kind}", ttl=ttl)
+    for kind, ttl in CATALOG_CACHE_TTLS.items()
+}
+
+# Sprint reports, keyed by (url, credentials, sprint ID, sprint state,
+# estimate field ID). Entry TTLs depend on the sprint state.
+sprint_analytics_cache: SharedCache[dict[str, Any]] = SharedCache(
+    "jira_sprint_analytics", ttl=SPRINT_ANALYTICS_CACHE_TTLS["active"]
+)
@@ -2,6 +2,8 @@
 
 import logging
 import os
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Literal
 
 from atlassian import Jira
@@ -9,15 +11,19 @@ from requests import Session
 
 from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError
 from mcp_atlassian.preprocessing import JiraPreprocessor
+from mcp_atlassian.utils.cache import credential_fingerprint
 from mcp_atlassian.utils.logging import (
     get_masked_session_headers,
     log_config_param,
     mask_sensitive,
 )
+from mcp_atlassian.utils.metrics import instrument_rest_client
 from mcp_atlassian.utils.oauth import configure_oauth_session
 from mcp_atlassian.utils.ssl import configure_ssl_verification
+from mcp_atlassian.utils.tracing import in_current_context, trace_rest_client
 
 from .config import JiraConfig
+from .constants import AGILE_PAGE_SIZE, AGILE_PAGE_WORKERS
 
 # Configure logging
 logger = logging.getLogger("mcp-jira")
@@ -132,6 +138,10 @@ class JiraClient:
         if self.config.custom_headers:
             self._apply_custom_headers()
 
+        # Count and trace requests when metrics or tracing are enabled
+        instrument_rest_client(self.jira, "jira")
+        trace_rest_client(self.jira, "jira")
+
         # Initialize the text preprocessor for text processing capabilities
         self.preprocessor = JiraPreprocessor(base_url=self.config.url)
         self._field_ids_cache = None
@@ -174,6 +184,26 @@ class JiraClient:
             )
             raise MCPAtlassianAuthenticationError(error_msg) from e
 
+    def _cache_scope(self) -> tuple[str, str]:
+        """Return the key prefix for shared caches of user-dependent data.
+
+        Returns:
+            The instance URL and a fingerprint of the configured credentials
+        """
+        oauth_token = (
+            self.config.oauth_config.access_token if self.config.oauth_config else None
+        )
+        return (
+            self.config.url,
+            credential_fingerprint(
+                self.config.auth_type,
+                self.config.username,
+                self.config.api_token,
+                self.config.personal_token,
+                oauth_token,
+            ),
+        )
+
     def _apply_custom_headers(self) -> None:
         """Apply custom headers to the Jira session."""
         if not self.config.custom_headers:
@@ -225,6 +255,18 @@ class JiraClient:
         _ = self.config.url if hasattr(self, "config") else ""
         return self.preprocessor.markdown_to_jira(markdown_text)
 
+    def _get_status_categories(self) -> dict[str, str]:
+        """Get the status category key of every status, by status ID."""
+        statuses = self.jira.get_all_statuses()
+        if not isinstance(statuses, list):
+            msg = f"Unexpected return value type from `jira.get_all_statuses`: {type(statuses)}"
+            logger.error(msg)
+            raise TypeError(msg)
+        return {
+            str(status.get("id")): (status.get("statusCategory") or {}).get("key", "")
+            for status in statuses
+        }
+
     def get_paged(
         self,
         method: Literal["get", "post"],
@@ -245,6 +287,34 @@ class JiraClient:
         Returns:
             List of requested json data
 
+        Raises:
+            ValueError: If using paged request on non-cloud Jira
+        """
+        return list(self.iter_paged(method, url, params_or_json, absolute=absolute))
+
+    def iter_paged(
+        self,
+        method: Literal["get", "post"],
+        url: str,
+        params_or_json: dict | None = None,
+        *,
+        absolute: bool = False,
+    ) -> Iterator[dict]:
+        """
+        Lazily fetch paged data from Jira API using `nextPageToken` to paginate.
+
+        The next page is only requested once the previous one has been
+        consumed, so callers can stop early without fetching the rest.
+
+        Args:
+            method: The HTTP method to use
+            url: The URL to retrieve data from
+            params_or_json: Optional query parameters or JSON data to send
+            absolute: Whether to use absolute URL
+
+        Yields:
+            The json data of each page
+
         Raises:
             ValueError: If using paged request on non-cloud Jira
         """
@@ -254,8 +324,7 @@ class JiraClient:
                 "Paged requests are only available for Jira Cloud platform"
             )
 
-        all_results: list[dict] = []
-        current_data = params_or_json or {}
+        current_data = dict(params_or_json or {})
 
         while True:
             if method == "get":
@@ -272,8 +341,7 @@ class JiraClient:
                 logger.error(error_message)
                 raise ValueError(error_message)
 
-            # Extract values from response
-            all_results.append(api_result)
+            yield api_result
 
             # Check if this is the last page
             if "nextPageToken" not in api_result:
@@ -282,7 +350,90 @@ class JiraClient:
             # Update for next iteration
             current_data["nextPageToken"] = api_result["nextPageToken"]
 
-        return all_results
+    def iter_offset_paged(
+        self,
+        fetch_page: Callable[[int, int], Any],
+        items_key: str,
+        start: int = 0,
+        limit: int | None = None,
+        page_size: int = AGILE_PAGE_SIZE,
+    ) -> Iterator[dict]:
+        """
+        Lazily fetch pages of an API paginated with ``startAt``/``maxResults``.
+
+        When the first page reports a ``total``, the offsets of the remaining
+        pages are known and they are fetched concurrently, still being yielded
+        in order. Otherwise pages are fetched one after another until the last
+        one. Pages that have not been consumed when the iterator is closed are
+        cancelled.
+
+        Args:
+            fetch_page: Called with a start index and a page size, returns the
+                raw page response
+            items_key: Key of the result list in each page (e.g. 'issues')
+            start: Index of the first result
+            limit: Maximum number of results to fetch, or None for all
+            page_size: Number of results requested per page
+
+        Yields:
+            The raw response of each page, in order
+
+        Raises:
+            TypeError: If a page is not a dictionary
+        """
+        end = None if limit is None else start + limit
+
+        def fetch(offset: int) -> dict:
+            count = page_size if end is None else min(page_size, end - offset)
+            page = fetch_page(offset, count)
+            if not isinstance(page, dict):
+                msg = f"Unexpected return value type from paged request: {type(page)}"
+                logger.error(msg)
+                raise TypeError(msg)
+            return page
+
+        def is_last(page: dict, offset: int) -> bool:
+            items = page.get(items_key) or []
+            # Jira may cap the page size, so compare with what it reports
+            served_page_size = page.get("maxResults") or page_size
+            return (
+                not items
+                or bool(page.get("isLast"))
+                or len(items) < min(served_page_size, page_size)
+                or (end is not None and offset >= end)
+            )
+
+        page = fetch(start)
+        yield page
+        offset = start + len(page.get(items_key) or [])
+        if is_last(page, offset):
+            return
+
+        total = page.get("total")
+        if isinstance(total, int):
+            stop = total if end is None else min(total, end)
+            step = len(page.get(items_key) or [])
+            executor = ThreadPoolExecutor(
+                max_workers=AGILE_PAGE_WORKERS, thread_name_prefix="agile-pages"
+            )
+            try:
+                fetch_in_worker = in_current_context(fetch)
+                futures = [
+                    executor.submit(fetch_in_worker, page_start)
+                    for page_start in range(offset, stop, step)
+                ]
+                for future in futures:
+                    yield future.result()
+            finally:
+                executor.shutdown(wait=False, cancel_futures=True)
+            return
+
+        while True:
+            page = fetch(offset)
+            yield page
+            offset += len(page.get(items_key) or [])
+            if is_last(page, offset):
+                return
 
     def create_version(
         self,
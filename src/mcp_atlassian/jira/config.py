@@ -5,7 +5,7 @@ import os
 from dataclasses import dataclass
 from typing import Literal
 
-from ..utils.env import get_custom_headers, is_env_ssl_verify
+from ..utils.env import get_cache_ttls, get_custom_headers, is_env_ssl_verify
 from ..utils.oauth import (
     BYOAccessTokenOAuthConfig,
     OAuthConfig,
@@ -36,6 +36,7 @@ class JiraConfig:
     no_proxy: str | None = None  # Comma-separated list of hosts to bypass proxy
     socks_proxy: str | None = None  # SOCKS proxy URL (optional)
     custom_headers: dict[str, str] | None = None  # Custom HTTP headers
+    catalog_cache_ttls: dict[str, int] | None = None  # Catalog TTLs per kind
 
     @property
     def is_cloud(self) -> bool:
@@ -127,6 +128,9 @@ class JiraConfig:
         # Custom headers - service-specific only
         custom_headers = get_custom_headers("JIRA_CUSTOM_HEADERS")
 
+        # Project catalog cache TTLs, e.g. "projects=600,versions=60"
+        catalog_cache_ttls = get_cache_ttls("JIRA_CATALOG_CACHE_TTLS")
+
         return cls(
             url=url,
             auth_type=auth_type,
@@ -141,6 +145,7 @@ class JiraConfig:
             no_proxy=no_proxy,
             socks_proxy=socks_proxy,
             custom_headers=custom_headers,
+            catalog_cache_ttls=catalog_cache_ttls or None,
         )
 
     def is_auth_configured(self) -> bool:
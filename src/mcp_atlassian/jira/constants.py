@@ -1,5 +1,12 @@
 """Constants specific to Jira operations."""
 
+from typing import Literal
+
+# What write operations return: the re-fetched issue ("full"), only the
+# fields that were written ("narrow"), or nothing beyond the write response
+# itself ("none").
+WriteResponseMode = Literal["full", "narrow", "none"]
+
 # Set of default fields returned by Jira read operations when no specific fields are requested.
 DEFAULT_READ_JIRA_FIELDS: set[str] = {
     "summary",
@@ -13,3 +20,70 @@ DEFAULT_READ_JIRA_FIELDS: set[str] = {
     "updated",
     "issuetype",
 }
+
+# Issue fields that may be truncated to honour a response budget, highest
+# priority first. All other fields are metadata and are always returned.
+BUDGETED_ISSUE_FIELDS: tuple[str, ...] = (
+    "description",
+    "comments",
+    "issuelinks",
+    "subtasks",
+    "attachments",
+    "changelogs",
+)
+
+# Epic Link custom field IDs common across Jira instances, tried when the
+# field cannot be discovered from field metadata.
+COMMON_EPIC_LINK_FIELD_IDS: tuple[str, ...] = (
+    "customfield_10014",  # Common in Jira Cloud
+    "customfield_10008",  # Common in Jira Server
+    "customfield_10100",
+    "customfield_10001",
+    "customfield_10002",
+    "customfield_10003",
+    "customfield_10004",
+    "customfield_10005",
+    "customfield_10006",
+    "customfield_10007",
+    "customfield_11703",
+)
+
+# Seconds the discovered epic field IDs of an instance are reused before they
+# are rediscovered.
+EPIC_SCHEMA_CACHE_TTL = 3600
+
+# Seconds the winning epic child query strategy of a project is reused before
+# the strategies are probed again.
+EPIC_STRATEGY_CACHE_TTL = 3600
+
+# Seconds the issue types and required create fields of a project are reused
+# before they are fetched again.
+CREATEMETA_CACHE_TTL = 900
+
+# Seconds a user's browse permission on a project is reused before it is
+# checked again.
+PROJECT_PERMISSION_CACHE_TTL = 300
+
+# Default seconds each kind of project catalog data is reused before it is
+# fetched again. Override per kind with JIRA_CATALOG_CACHE_TTLS.
+CATALOG_CACHE_TTLS: dict[str, int] = {
+    "projects": 600,
+    "components": 300,
+    "versions": 120,
+}
+
+# Number of results requested per page from the Agile (board and sprint) API.
+AGILE_PAGE_SIZE = 50
+
+# Number of Agile API pages fetched in parallel once the total is known.
+AGILE_PAGE_WORKERS = 4
+
+# Largest result budget accepted by the board and sprint listing tools.
+AGILE_MAX_RESULTS = 1000
+
+# Seconds a sprint report is reused, per sprint state. Closed sprints no
+# longer change, so their reports are kept for a day.
+SPRINT_ANALYTICS_CACHE_TTLS: dict[str, int] = {
+    "closed": 86400,
+    "active": 300,
+}
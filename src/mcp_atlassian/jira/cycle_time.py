@@ -0,0 +1,267 @@
+"""Module for Jira cycle time and lead time metrics."""
+
+import logging
+from array import array
+from collections import defaultdict
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Any
+
+from ..models.jira import JiraIssue
+from ..models.jira.common import JiraChangelog
+from ..utils import parse_date
+from .client import JiraClient
+
+logger = logging.getLogger("mcp-jira")
+
+# Percentiles reported for every duration distribution
+CYCLE_TIME_PERCENTILES = (50, 85, 95)
+
+# Page size used when collecting the issues of a report on Server/DC
+CYCLE_TIME_SEARCH_PAGE_SIZE = 50
+
+_SECONDS_PER_HOUR = 3600.0
+
+
+def _percentile(values: list[float], percentile: float) -> float:
+    """
+    Get a percentile of sorted values with linear interpolation.
+
+    Args:
+        values: Sorted, non-empty values
+        percentile: The percentile, between 0 and 100
+
+    Returns:
+        The interpolated percentile
+    """
+    position = (len(values) - 1) * percentile / 100
+    lower = int(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+def summarize_durations(durations: Iterable[float]) -> dict[str, float | int]:
+    """
+    Summarize durations with their count, mean, percentiles and maximum.
+
+    Args:
+        durations: Durations in hours
+
+    Returns:
+        Dictionary with ``count``, ``mean``, one ``p<N>`` entry per
+        percentile in CYCLE_TIME_PERCENTILES and ``max``, rounded to hours
+        with two decimals
+    """
+    values = sorted(durations)
+    if not values:
+        return {"count": 0}
+    summary: dict[str, float | int] = {
+        "count": len(values),
+        "mean": round(sum(values) / len(values), 2),
+    }
+    for percentile in CYCLE_TIME_PERCENTILES:
+        summary[f"p{percentile}"] = round(_percentile(values, percentile), 2)
+    summary["max"] = round(values[-1], 2)
+    return summary
+
+
+class CycleTimeCalculator:
+    """
+    Accumulate status dwell, cycle and lead times issue by issue.
+
+    Only one duration per issue and metric is kept, in ``array`` columns, so
+    the changelogs can be discarded as soon as an issue has been added.
+    """
+
+    def __init__(self, status_categories: dict[str, str]) -> None:
+        """
+        Create an empty calculator.
+
+        Args:
+            status_categories: Status category key ('new', 'indeterminate'
+                or 'done') per status ID
+        """
+        self.status_categories = status_categories
+        self.issue_count = 0
+        self.lead_times = array("d")
+        self.cycle_times = array("d")
+        self.dwell_times: defaultdict[str, array] = defaultdict(lambda: array("d"))
+
+    def add_issue(
+        self,
+        created: datetime | None,
+        status_id: str | None,
+        changelogs: list[JiraChangelog],
+    ) -> None:
+        """
+        Add the durations of one issue.
+
+        Dwell times only count the time spent in a status until the issue
+        left it; the time in the current status is still running. Cycle time
+        runs from the first move out of a 'new' status, lead time from the
+        creation, both until the last move into a 'done' status.
+
+        Args:
+            created: When the issue was created
+            status_id: ID of the current status
+            changelogs: Changelogs of the issue, at least the status changes
+        """
+        self.issue_count += 1
+        if created is None:
+            return
+        transitions = sorted(
+            (
+                (changelog.created, item)
+                for changelog in changelogs
+                if changelog.created is not None
+                for item in changelog.items
+                if item.field.lower() == "status"
+            ),
+            key=lambda transition: transition[0],
+        )
+
+        dwell: defaultdict[str, float] = defaultdict(float)
+        entered = created
+        started: datetime | None = None
+        finished: datetime | None = None
+        for moment, item in transitions:
+            name = item.from_string or item.from_id or "Unknown"
+            dwell[name] += max((moment - entered).total_seconds(), 0.0)
+            entered = moment
+            category = self.status_categories.get(str(item.to_id))
+            if started is None and category != "new":
+                started = moment
+            if category == "done":
+                finished = moment
+
+        for name, seconds in dwell.items():
+            self.dwell_times[name].append(seconds / _SECONDS_PER_HOUR)
+
+        if self.status_categories.get(str(status_id)) != "done":
+            return
+        if finished is None:
+            # Created directly in a done status
+            finished = created
+        self.lead_times.append(
+            max((finished - created).total_seconds(), 0.0) / _SECONDS_PER_HOUR
+        )
+        if started is not None:
+            self.cycle_times.append(
+                max((finished - started).total_seconds(), 0.0) / _SECONDS_PER_HOUR
+            )
+
+    def summary(self) -> dict[str, Any]:
+        """
+        Summarize the accumulated durations.
+
+        Returns:
+            Dictionary with the issue counts, the ``lead_time`` and
+            ``cycle_time`` summaries and a columnar ``statuses`` table with
+            one row per status, all in hours
+        """
+        statuses: dict[str, list[Any]] = {"status": []}
+        for name, durations in sorted(self.dwell_times.items()):
+            statuses["status"].append(name)
+            for column, value in summarize_durations(durations).items():
+                statuses.setdefault(column, []).append(value)
+        return {
+            "unit": "hours",
+            "issue_count": self.issue_count,
+            "completed_issues": len(self.lead_times),
+            "lead_time": summarize_durations(self.lead_times),
+            "cycle_time": summarize_durations(self.cycle_times),
+            "statuses": statuses,
+        }
+
+
+class CycleTimeMixin(JiraClient):
+    """Mixin for Jira cycle time and lead time metrics."""
+
+    def get_cycle_time_report(self, jql: str, max_issues: int = 1000) -> dict[str, Any]:
+        """
+        Report status dwell times, cycle times and lead times for a JQL query.
+
+        The status changes of the matching issues are streamed through the
+        bulk changelog path and folded into the calculator one issue at a
+        time, so only summary statistics are kept and returned.
+
+        Args:
+            jql: JQL query selecting the issues to analyse
+            max_issues: Maximum number of issues to include
+
+        Returns:
+            Dictionary with the JQL and the summary of CycleTimeCalculator
+        """
+        issues = {
+            issue.id: issue for issue in self._search_cycle_time_issues(jql, max_issues)
+        }
+        calculator = CycleTimeCalculator(self._get_status_categories())
+
+        # The bulk API may spread one issue over consecutive pages
+        current_id: str | None = None
+        current_changelogs: list[JiraChangelog] = []
+        stream = (
+            self.iter_changelogs(list(issues), fields=["status"])  # type: ignore[attr-defined]
+            if issues
+            else iter(())
+        )
+        for issue_id, changelogs in stream:
+            if issue_id != current_id:
+                if current_id in issues:
+                    self._add_cycle_time_issue(
+                        calculator, issues.pop(current_id), current_changelogs
+                    )
+                current_id, current_changelogs = issue_id, []
+            current_changelogs.extend(changelogs)
+        if current_id in issues:
+            self._add_cycle_time_issue(
+                calculator, issues.pop(current_id), current_changelogs
+            )
+        # Issues without any status change
+        for issue in issues.values():
+            self._add_cycle_time_issue(calculator, issue, [])
+
+        return {"jql": jql, **calculator.summary()}
+
+    @staticmethod
+    def _add_cycle_time_issue(
+        calculator: CycleTimeCalculator,
+        issue: JiraIssue,
+        changelogs: list[JiraChangelog],
+    ) -> None:
+        """Add a searched issue and its changelogs to a calculator."""
+        calculator.add_issue(
+            parse_date(issue.created) if issue.created else None,
+            issue.status.id if issue.status else None,
+            changelogs,
+        )
+
+    def _search_cycle_time_issues(self, jql: str, max_issues: int) -> list[JiraIssue]:
+        """
+        Collect the issues matching a JQL query with their creation and status.
+
+        Args:
+            jql: The JQL query
+            max_issues: Maximum number of issues to collect
+
+        Returns:
+            List of issues in search order
+        """
+        fields = "created,status"
+        if self.config.is_cloud:
+            # Cloud search pages through the results by itself
+            result = self.search_issues(jql, fields=fields, limit=max_issues)  # type: ignore[attr-defined]
+            return result.issues[:max_issues]
+
+        issues: list[JiraIssue] = []
+        while len(issues) < max_issues:
+            result = self.search_issues(  # type: ignore[attr-defined]
+                jql,
+                fields=fields,
+                start=len(issues),
+                limit=CYCLE_TIME_SEARCH_PAGE_SIZE,
+            )
+            issues.extend(result.issues)
+            if not result.issues or len(issues) >= result.total:
+                break
+        return issues[:max_issues]
@@ -1,10 +1,14 @@
 """Module for Jira epic operations."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from ..models.jira import JiraIssue
+from ..utils.tracing import in_current_context
+from .cache import epic_strategy_cache
 from .client import JiraClient
+from .constants import COMMON_EPIC_LINK_FIELD_IDS
 from .protocols import (
     FieldsOperationsProto,
     IssueOperationsProto,
@@ -14,6 +18,36 @@ from .protocols import (
 
 logger = logging.getLogger("mcp-jira")
 
+# Link types tried when children are attached to the epic with issue links
+EPIC_LINK_TYPES = ["relates to", "blocks", "is blocked by", "is part of"]
+
+# Maximum number of epic child queries probed at the same time
+EPIC_STRATEGY_PROBE_WORKERS = 4
+
+
+def _epic_child_jql(strategy: str, epic_key: str) -> str:
+    """
+    Build the JQL that finds the children of an epic for a strategy.
+
+    Args:
+        strategy: Strategy name, e.g. 'parent', 'field:customfield_10014'
+            or 'issueLink:relates to'
+        epic_key: The key of the epic
+
+    Returns:
+        The JQL query
+    """
+    kind, _, arg = strategy.partition(":")
+    if kind == "issueFunction":
+        return f'issueFunction in issuesScopedToEpic("{epic_key}")'
+    if kind == "parent":
+        return f'parent = "{epic_key}"'
+    if kind == "epicLinkName":
+        return f'"Epic Link" = "{epic_key}"'
+    if kind == "issueLink":
+        return f'issueLink = "{arg}" and issueLink = "{epic_key}"'
+    return f'"{arg}" = "{epic_key}"'
+
 
 class EpicsMixin(
     JiraClient,
@@ -306,9 +340,9 @@ class EpicsMixin(
             Exception: If there is an error linking the issue to the epic
         """
         try:
-            # Verify that both issue and epic exist
-            issue = self.jira.get_issue(issue_key)
-            epic = self.jira.get_issue(epic_key)
+            # Verify that both issue and epic exist (only the type is needed)
+            issue = self.jira.get_issue(issue_key, fields="issuetype")
+            epic = self.jira.get_issue(epic_key, fields="issuetype")
             if not isinstance(issue, dict):
                 msg = (
                     f"Unexpected return value type from `jira.get_issue`: {type(issue)}"
@@ -366,6 +400,8 @@ class EpicsMixin(
                     logger.info(
                         f"Couldn't link using discovered epic_link field: {str(e)}. Trying fallback methods..."
                     )
+                    # The cached epic schema may be stale; rediscover next time
+                    self.invalidate_epic_schema()
 
             # Fallback to common custom fields if dynamic discovery didn't work
             custom_field_attempts: list[dict[str, str]] = [
@@ -386,10 +422,9 @@ class EpicsMixin(
                         f"Successfully linked {issue_key} to {epic_key} using field: {field_id}"
                     )
 
-                    # If we get here, it worked - update our cached field ID
-                    if self._field_ids_cache is None:
-                        self._field_ids_cache = []
-                    self._field_ids_cache.append({"id": field_id, "name": "epic_link"})
+                    # If we get here, it worked - update the cached epic schema
+                    if field_id.startswith("customfield_"):
+                        self.remember_epic_field("epic_link", field_id)
                     return self.get_issue(issue_key)
                 except Exception as e:
                     logger.info(f"Couldn't link using fields {fields}: {str(e)}")
@@ -447,8 +482,8 @@ class EpicsMixin(
             Exception: If there is an error getting epic issues
         """
         try:
-            # First, check if the issue is an Epic
-            epic = self.jira.get_issue(epic_key)
+            # First, check if the issue is an Epic (only the type is needed)
+            epic = self.jira.get_issue(epic_key, fields="issuetype")
             if not isinstance(epic, dict):
                 msg = (
                     f"Unexpected return value type from `jira.get_issue`: {type(epic)}"
@@ -485,160 +520,56 @@ class EpicsMixin(
                     )
                     raise ValueError(error_msg)
 
-            # Track which methods we've tried
-            tried_methods = set()
-            issues = []
-
-            # Find the Epic Link field
-            field_ids = self.get_field_ids_to_epic()
-            epic_link_field = self._find_epic_link_field(field_ids)
-
-            # METHOD 1: Try with 'issueFunction in issuesScopedToEpic' - this works in many Jira instances
-            if "issueFunction" not in tried_methods:
-                tried_methods.add("issueFunction")
+            # Shared by all fetchers so later calls skip the probing
+            cache_key = (*self._cache_scope(), epic_key.split("-")[0])
+            cached_strategy = epic_strategy_cache.get(cache_key)
+            if cached_strategy:
+                jql = _epic_child_jql(cached_strategy, epic_key)
                 try:
-                    jql = f'issueFunction in issuesScopedToEpic("{epic_key}")'
-                    logger.info(f"Trying to get epic issues with issueFunction: {jql}")
-
-                    search_result = self.search_issues(jql, start=start, limit=limit)
-                    if search_result:
-                        logger.info(
-                            f"Successfully found {len(search_result.issues)} issues for epic {epic_key} using issueFunction"
-                        )
-                        return search_result.issues
+                    logger.info(f"Getting epic issues with cached strategy: {jql}")
+                    return self._get_epic_issues_by_jql(epic_key, jql, start, limit)
                 except Exception as e:
-                    # Log exception but continue with fallback
-                    logger.warning(
-                        f"Error searching epic issues with issueFunction: {str(e)}"
-                    )
-
-            # METHOD 2: Try using parent relationship - common in many Jira setups
-            if "parent" not in tried_methods:
-                tried_methods.add("parent")
-                try:
-                    jql = f'parent = "{epic_key}"'
-                    logger.info(
-                        f"Trying to get epic issues with parent relationship: {jql}"
-                    )
-                    issues = self._get_epic_issues_by_jql(epic_key, jql, start, limit)
-                    if issues:
-                        logger.info(
-                            f"Successfully found {len(issues)} issues for epic {epic_key} using parent relationship"
-                        )
-                        return issues
-                except Exception as parent_error:
                     logger.warning(
-                        f"Error with parent relationship approach: {str(parent_error)}"
+                        f"Cached epic strategy {cached_strategy} failed, "
+                        f"probing again: {str(e)}"
                     )
+                    epic_strategy_cache.invalidate(cache_key)
 
-            # METHOD 3: If we found an Epic Link field, try using it
-            if epic_link_field and "epicLinkField" not in tried_methods:
-                tried_methods.add("epicLinkField")
-                try:
-                    jql = f'"{epic_link_field}" = "{epic_key}"'
-                    logger.info(
-                        f"Trying to get epic issues with epic link field: {jql}"
-                    )
-                    issues = self._get_epic_issues_by_jql(epic_key, jql, start, limit)
-                    if issues:
-                        logger.info(
-                            f"Successfully found {len(issues)} issues for epic {epic_key} using epic link field {epic_link_field}"
-                        )
-                        return issues
-                except Exception as e:
-                    logger.warning(
-                        f"Error using epic link field {epic_link_field}: {str(e)}"
-                    )
+            # Find the Epic Link field
+            field_ids = self.get_field_ids_to_epic()
+            epic_link_field = self._find_epic_link_field(field_ids)
 
-            # METHOD 4: Try using 'Epic Link' as a textual field name
-            if "epicLinkName" not in tried_methods:
-                tried_methods.add("epicLinkName")
-                try:
-                    jql = f'"Epic Link" = "{epic_key}"'
-                    logger.info(
-                        f"Trying to get epic issues with 'Epic Link' field name: {jql}"
-                    )
-                    issues = self._get_epic_issues_by_jql(epic_key, jql, start, limit)
-                    if issues:
-                        logger.info(
-                            f"Successfully found {len(issues)} issues for epic {epic_key} using 'Epic Link' field name"
-                        )
-                        return issues
-                except Exception as e:
-                    logger.warning(f"Error using 'Epic Link' field name: {str(e)}")
+            strategies = ["issueFunction", "parent"]
+            if epic_link_field:
+                strategies.append(f"field:{epic_link_field}")
+            strategies.append("epicLinkName")
+            strategies.extend(f"issueLink:{link_type}" for link_type in EPIC_LINK_TYPES)
+            strategies.extend(
+                f"field:{field_id}"
+                for field_id in COMMON_EPIC_LINK_FIELD_IDS
+                if field_id != epic_link_field
+            )
 
-            # METHOD 5: Try using issue links with a specific link type
-            if "issueLinks" not in tried_methods:
-                tried_methods.add("issueLinks")
-                try:
-                    # Try to find issues linked to this epic with standard link types
-                    link_types = ["relates to", "blocks", "is blocked by", "is part of"]
-                    for link_type in link_types:
-                        jql = f'issueLink = "{link_type}" and issueLink = "{epic_key}"'
-                        logger.info(
-                            f"Trying to get epic issues with issue links: {jql}"
-                        )
-                        try:
-                            issues = self._get_epic_issues_by_jql(
-                                epic_key, jql, start, limit
-                            )
-                            if issues:
-                                logger.info(
-                                    f"Successfully found {len(issues)} issues for epic {epic_key} using issue links with type '{link_type}'"
-                                )
-                                return issues
-                        except Exception:
-                            # Just try the next link type
-                            continue
-                except Exception as e:
-                    logger.warning(f"Error using issue links approach: {str(e)}")
-
-            # METHOD 6: Last resort - try each common Epic Link field ID directly
-            if "commonFields" not in tried_methods:
-                tried_methods.add("commonFields")
-                common_epic_fields = [
-                    "customfield_10014",
-                    "customfield_10008",
-                    "customfield_10100",
-                    "customfield_10001",
-                    "customfield_10002",
-                    "customfield_10003",
-                    "customfield_10004",
-                    "customfield_10005",
-                    "customfield_10006",
-                    "customfield_10007",
-                    "customfield_11703",
-                ]
-
-                for field_id in common_epic_fields:
-                    try:
-                        jql = f'"{field_id}" = "{epic_key}"'
-                        logger.info(
-                            f"Trying to get epic issues with common field ID: {jql}"
-                        )
-                        issues = self._get_epic_issues_by_jql(
-                            epic_key, jql, start, limit
-                        )
-                        if issues:
-                            logger.info(
-                                f"Successfully found {len(issues)} issues for epic {epic_key} using field ID {field_id}"
-                            )
-                            # Cache this successful field ID for future use
-                            if self._field_ids_cache is None:
-                                self._field_ids_cache = []
-                            self._field_ids_cache.append(
-                                {"id": field_id, "name": "epic_link"}
-                            )
-                            return issues
-                    except Exception:
-                        # Just try the next field ID
-                        continue
+            winner, issues = self._probe_epic_child_strategies(
+                epic_key, strategies, start, limit
+            )
+            if winner is None:
+                # If we've tried everything and found no issues, return an empty list
+                logger.warning(
+                    f"No issues found for epic {epic_key} after trying multiple approaches"
+                )
+                return []
 
-            # If we've tried everything and found no issues, return an empty list
-            logger.warning(
-                f"No issues found for epic {epic_key} after trying multiple approaches"
+            logger.info(
+                f"Successfully found {len(issues)} issues for epic {epic_key} "
+                f"using strategy {winner}"
             )
-            return []
+            epic_strategy_cache.set(cache_key, winner)
+            field_id = winner.removeprefix("field:")
+            if winner.startswith("field:") and field_id != epic_link_field:
+                # Cache this successful field ID for future use
+                self.remember_epic_field("epic_link", field_id)
+            return issues
 
         except ValueError:
             # Re-raise ValueError (like "not an Epic") as is
@@ -680,23 +611,9 @@ class EpicsMixin(
                 return field_id
 
         # Look for any customfield that might be an epic link
-        # Common epic link field IDs across different Jira instances
-        known_epic_fields = [
-            "customfield_10014",  # Common in Jira Cloud
-            "customfield_10008",  # Common in Jira Server
-            "customfield_10100",
-            "customfield_10001",
-            "customfield_10002",
-            "customfield_10003",
-            "customfield_10004",
-            "customfield_10005",
-            "customfield_10006",
-            "customfield_10007",
-            "customfield_11703",  # Added based on error message
-        ]
-
+        # using the epic link field IDs common across Jira instances
         # Check if any of these known fields exist in our field IDs values
-        for field_id in known_epic_fields:
+        for field_id in COMMON_EPIC_LINK_FIELD_IDS:
             if field_id in field_ids.values():
                 logger.info(f"Using known epic link field ID: {field_id}")
                 return field_id
@@ -735,6 +652,7 @@ class EpicsMixin(
                             logger.info(
                                 f"Detected epic link field {field_id} from linked issue"
                             )
+                            self.remember_epic_field("epic_link", field_id)
                             return field_id
         except Exception as e:
             logger.warning(f"Error detecting epic link field from issues: {str(e)}")
@@ -742,11 +660,7 @@ class EpicsMixin(
         # As a last resort, look for any customfield that starts with customfield_
         # and has "epic" in its schema name or description
         try:
-            all_fields = self.jira.get_all_fields()
-            if not isinstance(all_fields, list):
-                msg = f"Unexpected return value type from `jira.get_all_fields`: {type(all_fields)}"
-                logger.error(msg)
-                raise TypeError(msg)
+            all_fields = self.get_fields()
 
             for field in all_fields:
                 field_id = field.get("id", "")
@@ -760,6 +674,7 @@ class EpicsMixin(
                     logger.info(
                         f"Found potential Epic Link field by schema inspection: {field_id}"
                     )
+                    self.remember_epic_field("epic_link", field_id)
                     return field_id
         except Exception as e:
             logger.warning(
@@ -844,8 +759,55 @@ class EpicsMixin(
         search_result = self.search_issues(jql, start=start, limit=limit)
         if not search_result:
             logger.warning(f"No issues found for epic {epic_key} with query: {jql}")
+            return []
         return search_result.issues
 
+    def _probe_epic_child_strategies(
+        self, epic_key: str, strategies: list[str], start: int, limit: int
+    ) -> tuple[str | None, list[JiraIssue]]:
+        """
+        Run the epic child queries concurrently and pick the best one.
+
+        The winner is the highest-priority strategy that returns issues. Once
+        it is known, queries that have not started yet are cancelled.
+
+        Args:
+            epic_key: The key of the epic
+            strategies: Strategy names in priority order
+            start: Starting index for pagination
+            limit: Maximum number of issues to return
+
+        Returns:
+            Tuple of (winning strategy or None, issues found)
+        """
+        executor = ThreadPoolExecutor(
+            max_workers=EPIC_STRATEGY_PROBE_WORKERS,
+            thread_name_prefix="epic-probe",
+        )
+        search = in_current_context(self._get_epic_issues_by_jql)
+        try:
+            futures = [
+                executor.submit(
+                    search,
+                    epic_key,
+                    _epic_child_jql(strategy, epic_key),
+                    start,
+                    limit,
+                )
+                for strategy in strategies
+            ]
+            for strategy, future in zip(strategies, futures, strict=True):
+                try:
+                    issues = future.result()
+                except Exception as e:
+                    logger.debug(f"Epic strategy {strategy} failed: {str(e)}")
+                    continue
+                if issues:
+                    return strategy, issues
+            return None, []
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
     def update_epic_fields(self, issue_key: str, kwargs: dict[str, Any]) -> JiraIssue:
         """
         Update Epic-specific fields after Epic creation.
@@ -913,6 +875,8 @@ class EpicsMixin(
                     logger.warning(
                         f"Error updating Epic with primary method: {str(update_error)}"
                     )
+                    # The field IDs may come from a stale epic schema
+                    self.invalidate_epic_schema()
 
                     # Try updating fields one by one as fallback
                     success = False
@@ -5,6 +5,7 @@ from typing import Any
 
 from thefuzz import fuzz
 
+from .cache import createmeta_cache, epic_schema_cache
 from .client import JiraClient
 from .protocols import EpicOperationsProto, UsersOperationsProto
 
@@ -185,20 +186,25 @@ class FieldsMixin(JiraClient, EpicOperationsProto, UsersOperationsProto):
             issue_type: The issue type (e.g., 'Bug', 'Story', 'Epic')
             project_key: The project key (e.g., 'PROJ')
 
+        Results are cached process-wide for CREATEMETA_CACHE_TTL seconds per
+        instance and credentials, so they survive the per-request fetchers.
+
         Returns:
             Dictionary mapping required field names to their definitions
         """
-        # Initialize cache if it doesn't exist
-        if not hasattr(self, "_required_fields_cache"):
-            self._required_fields_cache = {}
-
         # Check cache first
-        cache_key = (project_key, issue_type)
-        if cache_key in self._required_fields_cache:
+        cache_key = (
+            *self._cache_scope(),
+            "required_fields",
+            project_key,
+            issue_type.lower(),
+        )
+        cached = createmeta_cache.get(cache_key)
+        if cached is not None:
             logger.debug(
                 f"Returning cached required fields for {issue_type} in {project_key}"
             )
-            return self._required_fields_cache[cache_key]
+            return dict(cached)
 
         try:
             # Step 1: Get the ID for the given issue type name within the project
@@ -249,7 +255,7 @@ class FieldsMixin(JiraClient, EpicOperationsProto, UsersOperationsProto):
                 )
 
             # Cache the result before returning
-            self._required_fields_cache[cache_key] = required_fields
+            createmeta_cache.set(cache_key, dict(required_fields))
             logger.debug(
                 f"Cached required fields for {issue_type} in {project_key}: "
                 f"{len(required_fields)} fields"
@@ -264,16 +270,85 @@ class FieldsMixin(JiraClient, EpicOperationsProto, UsersOperationsProto):
             )
             return {}
 
-    def get_field_ids_to_epic(self) -> dict[str, str]:
+    def prefetch_create_metadata(self, project_keys: list[str]) -> None:
+        """
+        Warm the create-metadata cache for a set of projects.
+
+        Loads the issue types of each project and the required fields of each
+        issue type, so later issue creation finds them in the cache. Errors
+        are logged by the underlying lookups and never raised.
+
+        Args:
+            project_keys: The project keys to prefetch
+        """
+        if not hasattr(self, "get_project_issue_types"):
+            logger.debug("Project operations unavailable, skipping prefetch")
+            return
+
+        for project_key in project_keys:
+            issue_types = self.get_project_issue_types(project_key)
+            for issue_type in issue_types:
+                name = issue_type.get("name")
+                if name:
+                    self.get_required_fields(name, project_key)
+            logger.debug(
+                f"Prefetched create metadata for {len(issue_types)} issue types "
+                f"in project {project_key}"
+            )
+
+    def get_field_ids_to_epic(self, refresh: bool = False) -> dict[str, str]:
         """
         Dynamically discover Jira field IDs relevant to Epic linking.
         This method queries the Jira API to find the correct custom field IDs
         for Epic-related fields, which can vary between different Jira instances.
 
+        The result (the instance's "epic schema") is cached process-wide per
+        Jira URL for EPIC_SCHEMA_CACHE_TTL seconds, so discovery, including
+        sampling an existing Epic, runs once instead of on every call.
+
+        Args:
+            refresh: When True, rediscover the fields instead of using the cache
+
         Returns:
             Dictionary mapping field names to their IDs
             (e.g., {'epic_link': 'customfield_10014', 'epic_name': 'customfield_10011'})
         """
+        if not refresh:
+            cached = epic_schema_cache.get(self.config.url)
+            if cached is not None:
+                return dict(cached)
+
+        field_ids = self._discover_field_ids_to_epic()
+        if field_ids:
+            epic_schema_cache.set(self.config.url, dict(field_ids))
+        return field_ids
+
+    def invalidate_epic_schema(self) -> None:
+        """Drop the cached epic schema so the next lookup rediscovers it."""
+        logger.debug(f"Invalidating cached epic schema for {self.config.url}")
+        epic_schema_cache.invalidate(self.config.url)
+
+    def remember_epic_field(self, name: str, field_id: str) -> None:
+        """
+        Record an epic field found by a fallback in the cached epic schema.
+
+        When the schema is not cached (e.g. it was just invalidated because the
+        discovered field failed), it is discovered again and the working field
+        overrides the discovered one, so later calls skip the fallback.
+
+        Args:
+            name: The epic schema key (e.g. 'epic_link')
+            field_id: The field ID that worked
+        """
+        cached = epic_schema_cache.get(self.config.url)
+        if cached is None:
+            cached = self._discover_field_ids_to_epic()
+        elif cached.get(name) == field_id:
+            return
+        epic_schema_cache.set(self.config.url, {**cached, name: field_id})
+
+    def _discover_field_ids_to_epic(self) -> dict[str, str]:
+        """Discover the epic field IDs from the field definitions."""
         try:
             # Ensure field list and map are cached/generated
             self._generate_field_map()  # Generates map and ensures fields are cached
@@ -1,7 +1,8 @@
 """Module for Jira issue operations."""
 
 import logging
-from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from requests.exceptions import HTTPError
@@ -10,8 +11,9 @@ from ..exceptions import MCPAtlassianAuthenticationError
 from ..models.jira import JiraIssue
 from ..models.jira.common import JiraChangelog
 from ..utils import parse_date
+from ..utils.tracing import in_current_context
 from .client import JiraClient
-from .constants import DEFAULT_READ_JIRA_FIELDS
+from .constants import DEFAULT_READ_JIRA_FIELDS, WriteResponseMode
 from .protocols import (
     AttachmentsOperationsProto,
     EpicOperationsProto,
@@ -23,6 +25,23 @@ from .protocols import (
 
 logger = logging.getLogger("mcp-jira")
 
+# Number of issues whose changelogs are searched per request on Server/DC
+CHANGELOG_BATCH_SIZE = 50
+
+# Number of changelog searches run in parallel on Server/DC
+CHANGELOG_FETCH_WORKERS = 4
+
+# Maximum number of issues per request of the Cloud bulk changelog API
+CHANGELOG_BULKFETCH_BATCH_SIZE = 1000
+
+# API field IDs whose simplified issue dictionary key differs
+_SIMPLIFIED_FIELD_NAMES = {"issuetype": "issue_type", "fixVersions": "fix_versions"}
+
+
+def _simplified_field_names(field_ids: Iterable[str]) -> list[str]:
+    """Map API field IDs to the names used by JiraIssue.to_simplified_dict."""
+    return [_SIMPLIFIED_FIELD_NAMES.get(field_id, field_id) for field_id in field_ids]
+
 
 class IssuesMixin(
     JiraClient,
@@ -507,6 +526,7 @@ class IssuesMixin(
         description: str = "",
         assignee: str | None = None,
         components: list[str] | None = None,
+        response_mode: WriteResponseMode = "full",
         **kwargs: Any,  # noqa: ANN401 - Dynamic field types are necessary for Jira API
     ) -> JiraIssue:
         """
@@ -519,6 +539,9 @@ class IssuesMixin(
             description: The issue description
             assignee: The username or account ID of the assignee
             components: List of component names to assign (e.g., ["Frontend", "API"])
+            response_mode: 'full' to return the re-fetched issue, 'narrow' to
+                fetch only the fields that were set, 'none' to return only the
+                ID and key from the create response
             **kwargs: Additional fields to set on the issue
 
         Returns:
@@ -639,13 +662,16 @@ class IssuesMixin(
                             "Continuing with the original Epic that was successfully created"
                         )
 
-            # Get the full issue data and convert to JiraIssue model
-            issue_data = self.jira.get_issue(issue_key)
-            if not isinstance(issue_data, dict):
-                msg = f"Unexpected return value type from `jira.get_issue`: {type(issue_data)}"
-                logger.error(msg)
-                raise TypeError(msg)
-            return JiraIssue.from_api_response(issue_data)
+            if response_mode == "none":
+                # The create response already carries the ID and key
+                return JiraIssue.from_api_response(response, requested_fields=[])
+
+            # Get the issue data and convert to JiraIssue model
+            issue = self._get_written_issue(issue_key, response_mode, fields)
+            if issue is None:
+                error_msg = f"Could not retrieve created issue {issue_key}"
+                raise ValueError(error_msg)
+            return issue
 
         except Exception as e:
             self._handle_create_issue_error(e, issue_type)
@@ -985,21 +1011,27 @@ class IssuesMixin(
         self,
         issue_key: str,
         fields: dict[str, Any] | None = None,
+        response_mode: WriteResponseMode = "full",
         **kwargs: Any,  # noqa: ANN401 - Dynamic field types are necessary for Jira API
-    ) -> JiraIssue:
+    ) -> JiraIssue | None:
         """
         Update a Jira issue.
 
         Args:
             issue_key: The key of the issue to update
             fields: Dictionary of fields to update
+            response_mode: 'full' to return the re-fetched issue, 'narrow' to
+                return only the updated fields (from the edit response on
+                Cloud, with a narrow fetch elsewhere), 'none' to return None
             **kwargs: Additional fields to update. Special fields include:
                 - attachments: List of file paths to upload as attachments
                 - status: New status for the issue (handled via transitions)
                 - assignee: New assignee for the issue
 
         Returns:
-            JiraIssue model representing the updated issue
+            JiraIssue model representing the updated issue. When response_mode
+            is 'none', None, or a key-only issue carrying the attachment
+            results if attachments were uploaded
 
         Raises:
             Exception: If there is an error updating the issue
@@ -1024,7 +1056,9 @@ class IssuesMixin(
                     # Status changes are handled separately via transitions
                     # Add status to fields so _update_issue_with_status can find it
                     update_fields["status"] = value
-                    return self._update_issue_with_status(issue_key, update_fields)
+                    return self._update_issue_with_status(
+                        issue_key, update_fields, response_mode
+                    )
 
                 elif key == "attachments":
                     # Handle attachments separately - they're not part of fields update
@@ -1054,7 +1088,16 @@ class IssuesMixin(
                     self._process_additional_fields(update_fields, field_kwargs)
 
             # Update the issue fields
-            if update_fields:
+            edited_issue_data = None
+            if update_fields and response_mode == "narrow" and self.config.is_cloud:
+                # Jira Cloud can return the edited fields in the edit response
+                base_url = self.jira.resource_url("issue")
+                edited_issue_data = self.jira.put(
+                    f"{base_url}/{issue_key}",
+                    data={"fields": update_fields},
+                    params={"returnIssue": "true"},
+                )
+            elif update_fields:
                 self.jira.update_issue(
                     issue_key=issue_key, update={"fields": update_fields}
                 )
@@ -1075,12 +1118,18 @@ class IssuesMixin(
                     # Continue with the update even if attachments fail
 
             # Get the updated issue data and convert to JiraIssue model
-            issue_data = self.jira.get_issue(issue_key)
-            if not isinstance(issue_data, dict):
-                msg = f"Unexpected return value type from `jira.get_issue`: {type(issue_data)}"
-                logger.error(msg)
-                raise TypeError(msg)
-            issue = JiraIssue.from_api_response(issue_data)
+            if isinstance(edited_issue_data, dict) and edited_issue_data.get("key"):
+                issue = JiraIssue.from_api_response(
+                    edited_issue_data,
+                    requested_fields=_simplified_field_names(update_fields),
+                )
+            else:
+                issue = self._get_written_issue(issue_key, response_mode, update_fields)
+            if issue is None:
+                if not attachments_result:
+                    return None
+                # Carry the upload results on a key-only issue
+                issue = JiraIssue(key=issue_key)
 
             # Add attachment results to the response if available
             if attachments_result:
@@ -1094,17 +1143,24 @@ class IssuesMixin(
             raise ValueError(f"Failed to update issue {issue_key}: {error_msg}") from e
 
     def _update_issue_with_status(
-        self, issue_key: str, fields: dict[str, Any]
-    ) -> JiraIssue:
+        self,
+        issue_key: str,
+        fields: dict[str, Any],
+        response_mode: WriteResponseMode = "full",
+    ) -> JiraIssue | None:
         """
         Update an issue with a status change.
 
         Args:
             issue_key: The key of the issue to update
             fields: Dictionary of fields to update
+            response_mode: 'full' to return the re-fetched issue, 'narrow' to
+                fetch only the updated fields and the status, 'none' to skip
+                the re-fetch and return None
 
         Returns:
-            JiraIssue model representing the updated issue
+            JiraIssue model representing the updated issue, or None when
+            response_mode is 'none'
 
         Raises:
             Exception: If there is an error updating the issue
@@ -1118,12 +1174,7 @@ class IssuesMixin(
 
         # If no status change is requested, return the issue
         if not status:
-            issue_data = self.jira.get_issue(issue_key)
-            if not isinstance(issue_data, dict):
-                msg = f"Unexpected return value type from `jira.get_issue`: {type(issue_data)}"
-                logger.error(msg)
-                raise TypeError(msg)
-            return JiraIssue.from_api_response(issue_data)
+            return self._get_written_issue(issue_key, response_mode, fields)
 
         # Get available transitions (uses TransitionsMixin's normalized implementation)
         transitions = self.get_available_transitions(issue_key)  # type: ignore[attr-defined]
@@ -1207,21 +1258,48 @@ class IssuesMixin(
 
         # Perform the transition
         logger.info(f"Performing transition with ID {transition_id}")
-        self.jira.set_issue_status_by_transition_id(
-            issue_key=issue_key,
-            transition_id=(
-                int(transition_id)
-                if isinstance(transition_id, str) and transition_id.isdigit()
-                else transition_id
-            ),
-        )
+        self._perform_transition(issue_key, transition_id)  # type: ignore[attr-defined]
 
         # Get the updated issue data
-        issue_data = self.jira.get_issue(issue_key)
+        return self._get_written_issue(issue_key, response_mode, [*fields, "status"])
+
+    def _get_written_issue(
+        self,
+        issue_key: str,
+        response_mode: WriteResponseMode,
+        written_fields: Iterable[str] = (),
+    ) -> JiraIssue | None:
+        """
+        Fetch the issue to return from a write operation.
+
+        Args:
+            issue_key: The key of the written issue
+            response_mode: 'full' fetches the whole issue, 'narrow' only the
+                written fields, and 'none' fetches nothing
+            written_fields: IDs of the fields that were written
+
+        Returns:
+            JiraIssue model, or None when response_mode is 'none'
+        """
+        if response_mode == "none":
+            return None
+
+        if response_mode == "narrow":
+            field_ids = sorted(set(written_fields)) or ["summary"]
+            issue_data = self.jira.get_issue(
+                issue_key, fields=",".join(field_ids), update_history=False
+            )
+        else:
+            issue_data = self.jira.get_issue(issue_key)
         if not isinstance(issue_data, dict):
             msg = f"Unexpected return value type from `jira.get_issue`: {type(issue_data)}"
             logger.error(msg)
             raise TypeError(msg)
+
+        if response_mode == "narrow":
+            return JiraIssue.from_api_response(
+                issue_data, requested_fields=_simplified_field_names(field_ids)
+            )
         return JiraIssue.from_api_response(issue_data)
 
     def delete_issue(self, issue_key: str) -> bool:
@@ -1486,55 +1564,198 @@ class IssuesMixin(
             raise
 
     def batch_get_changelogs(
-        self, issue_ids_or_keys: list[str], fields: list[str] | None = None
+        self,
+        issue_ids_or_keys: list[str],
+        fields: list[str] | None = None,
+        limit: int | None = None,
     ) -> list[JiraIssue]:
         """
         Get changelogs for multiple issues in a batch. Repeatly fetch data if necessary.
 
-        Warning:
-            This function is only avaiable on Jira Cloud.
+        Changelogs are consumed lazily from iter_changelogs, so no more pages
+        are fetched once every requested issue has reached ``limit``.
 
         Args:
             issue_ids_or_keys: List of issue IDs or keys
             fields: Filter the changelogs by fields, e.g. ['status', 'assignee']. Default to None for all fields.
+            limit: Maximum number of changelogs to keep per issue, or None
+                for all of them
 
         Returns:
             List of JiraIssue objects that only contain changelogs and id
         """
+        issue_changelog_results: dict[str, list[JiraChangelog]] = {}
+        if limit is not None and limit <= 0:
+            return []
 
-        if not self.config.is_cloud:
-            error_msg = "Batch get issue changelogs is only available on Jira Cloud."
-            logger.error(error_msg)
-            raise NotImplementedError(error_msg)
-
-        # Get paged api results
-        paged_api_results = self.get_paged(
-            method="post",
-            url=self.jira.resource_url("changelog/bulkfetch"),
-            params_or_json={
-                "fieldIds": fields,
-                "issueIdsOrKeys": issue_ids_or_keys,
-            },
-        )
+        remaining_issues = len(set(issue_ids_or_keys))
+        changelog_stream = self.iter_changelogs(issue_ids_or_keys, fields)
+        for issue_id, new_changelogs in changelog_stream:
+            changelogs = issue_changelog_results.setdefault(issue_id, [])
+            if limit is None:
+                changelogs.extend(new_changelogs)
+                continue
+            if len(changelogs) >= limit:
+                continue
+            changelogs.extend(new_changelogs[: limit - len(changelogs)])
+            if len(changelogs) == limit:
+                remaining_issues -= 1
+                if remaining_issues <= 0:
+                    # Stop paging: every issue has all the changelogs it needs
+                    changelog_stream.close()
+                    break
+
+        return [
+            JiraIssue(id=issue_id, changelogs=changelogs)
+            for issue_id, changelogs in issue_changelog_results.items()
+        ]
 
-        # Save (issue_id, changelogs)
-        issue_changelog_results: defaultdict[str, list[JiraChangelog]] = defaultdict(
-            list
-        )
+    def iter_changelogs(
+        self, issue_ids_or_keys: list[str], fields: list[str] | None = None
+    ) -> Iterator[tuple[str, list[JiraChangelog]]]:
+        """
+        Stream the changelogs of multiple issues.
 
-        for api_result in paged_api_results:
-            for data in api_result.get("issueChangeLogs", []):
-                issue_id = data.get("issueId", "")
-                changelogs = [
-                    JiraChangelog.from_api_response(changelog_data)
-                    for changelog_data in data.get("changeHistories", [])
+        Jira Cloud uses the bulk changelog API, in chunks of at most
+        CHANGELOG_BULKFETCH_BATCH_SIZE issues, and filters by field on the
+        server. Jira Server/Data Center has no bulk API, so the issues are
+        searched with ``expand=changelog`` in chunks of keys, several chunks at
+        a time, and the same field filter is applied to the change items.
+        Both backends yield the changelogs of each issue as soon as its page
+        has been fetched; an issue may appear in several consecutive pages.
+
+        Args:
+            issue_ids_or_keys: List of issue IDs or keys
+            fields: Field IDs (or names on Server/DC) to keep changes for, or
+                None for all fields
+
+        Yields:
+            Tuples of issue ID and a list of its changelogs
+        """
+        if not self.config.is_cloud:
+            yield from self._iter_changelogs_server(issue_ids_or_keys, fields)
+            return
+
+        for i in range(0, len(issue_ids_or_keys), CHANGELOG_BULKFETCH_BATCH_SIZE):
+            request: dict[str, Any] = {
+                "issueIdsOrKeys": issue_ids_or_keys[
+                    i : i + CHANGELOG_BULKFETCH_BATCH_SIZE
                 ]
+            }
+            if fields:
+                request["fieldIds"] = fields
 
-                issue_changelog_results[issue_id].extend(changelogs)
+            for api_result in self.iter_paged(
+                method="post",
+                url=self.jira.resource_url("changelog/bulkfetch"),
+                params_or_json=request,
+            ):
+                for data in api_result.get("issueChangeLogs", []):
+                    yield (
+                        data.get("issueId", ""),
+                        [
+                            JiraChangelog.from_api_response(changelog_data)
+                            for changelog_data in data.get("changeHistories", [])
+                        ],
+                    )
 
-        issues = [
-            JiraIssue(id=issue_id, changelogs=changelogs)
-            for issue_id, changelogs in issue_changelog_results.items()
+    def _iter_changelogs_server(
+        self, issue_ids_or_keys: list[str], fields: list[str] | None = None
+    ) -> Iterator[tuple[str, list[JiraChangelog]]]:
+        """
+        Stream the changelogs of multiple issues on Jira Server/Data Center.
+
+        Args:
+            issue_ids_or_keys: List of issue IDs or keys
+            fields: Field IDs or names to keep changes for, or None for all
+
+        Yields:
+            Tuples of issue ID and a list of its changelogs, in the order the
+            issues were requested
+        """
+        chunks = [
+            issue_ids_or_keys[i : i + CHANGELOG_BATCH_SIZE]
+            for i in range(0, len(issue_ids_or_keys), CHANGELOG_BATCH_SIZE)
         ]
+        field_filter = set(fields) if fields else None
+        seen_ids: set[str] = set()
+        executor = ThreadPoolExecutor(
+            max_workers=CHANGELOG_FETCH_WORKERS, thread_name_prefix="changelog-fetch"
+        )
+        try:
+            chunk_results = executor.map(
+                in_current_context(self._search_changelog_chunk), chunks
+            )
+            for chunk, issues_data in zip(chunks, chunk_results, strict=True):
+                # Index the results by both ID and key to keep the requested order
+                issues_by_ref: dict[str, dict[str, Any]] = {}
+                for issue_data in issues_data:
+                    issues_by_ref[str(issue_data.get("id"))] = issue_data
+                    issues_by_ref[str(issue_data.get("key"))] = issue_data
+
+                for issue_ref in chunk:
+                    issue_data = issues_by_ref.get(issue_ref)
+                    if issue_data is None:
+                        continue
+                    issue_id = str(issue_data.get("id"))
+                    if issue_id in seen_ids:
+                        continue
+                    seen_ids.add(issue_id)
+                    changelogs = []
+                    changelog = issue_data.get("changelog") or {}
+                    for history in changelog.get("histories", []):
+                        if field_filter is not None:
+                            items = [
+                                item
+                                for item in history.get("items", [])
+                                if item.get("fieldId") in field_filter
+                                or item.get("field") in field_filter
+                            ]
+                            if not items:
+                                continue
+                            history = {**history, "items": items}
+                        changelogs.append(JiraChangelog.from_api_response(history))
+                    yield issue_id, changelogs
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _search_changelog_chunk(self, issue_ids_or_keys: list[str]) -> list[dict]:
+        """
+        Search a chunk of issues with their changelogs expanded.
+
+        Jira rejects the whole query with HTTP 400 when one of the keys does
+        not exist or is not visible, so the chunk is then searched one issue
+        at a time and the rejected issues are left out.
+
+        Args:
+            issue_ids_or_keys: Issue IDs or keys, at most CHANGELOG_BATCH_SIZE
 
-        return issues
+        Returns:
+            Raw issue data including the ``changelog`` expansion
+        """
+        refs = ", ".join(f'"{issue_ref}"' for issue_ref in issue_ids_or_keys)
+        try:
+            response = self.jira.jql(
+                f"issuekey in ({refs})",
+                fields="key",
+                limit=len(issue_ids_or_keys),
+                expand="changelog",
+            )
+        except HTTPError as http_err:
+            if http_err.response is None or http_err.response.status_code != 400:
+                raise
+            if len(issue_ids_or_keys) == 1:
+                logger.warning(
+                    f"Skipping changelog of {issue_ids_or_keys[0]}: {http_err}"
+                )
+                return []
+            return [
+                issue_data
+                for issue_ref in issue_ids_or_keys
+                for issue_data in self._search_changelog_chunk([issue_ref])
+            ]
+        if not isinstance(response, dict):
+            msg = f"Unexpected return value type from `jira.jql`: {type(response)}"
+            logger.error(msg)
+            raise TypeError(msg)
+        return response.get("issues", [])
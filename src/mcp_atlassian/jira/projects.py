@@ -1,16 +1,24 @@
 """Module for Jira project operations."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from ..models import JiraProject
 from ..models.jira.search import JiraSearchResult
 from ..models.jira.version import JiraVersion
+from ..utils.tracing import in_current_context
+from .cache import catalog_caches, createmeta_cache, project_permission_cache
 from .client import JiraClient
 from .protocols import SearchOperationsProto
 
 logger = logging.getLogger("mcp-jira")
 
+# Concurrent browse permission checks when no bulk check is available
+PERMISSION_SCAN_WORKERS = 8
+# Projects per request to the bulk permission check endpoint
+PERMISSION_CHECK_BATCH_SIZE = 100
+
 
 class ProjectsMixin(JiraClient, SearchOperationsProto):
     """Mixin for Jira project operations.
@@ -29,13 +37,20 @@ class ProjectsMixin(JiraClient, SearchOperationsProto):
         Returns:
             List of project data dictionaries
         """
+        cached = self._get_catalog("projects", include_archived)
+        if cached is not None:
+            return cached
+
         try:
             params = {}
             if include_archived:
                 params["includeArchived"] = "true"
 
             projects = self.jira.projects(included_archived=include_archived)
-            return projects if isinstance(projects, list) else []
+            if not isinstance(projects, list):
+                return []
+            self._set_catalog("projects", projects, include_archived)
+            return projects
 
         except Exception as e:
             logger.error(f"Error getting all projects: {str(e)}")
@@ -105,9 +120,16 @@ class ProjectsMixin(JiraClient, SearchOperationsProto):
         Returns:
             List of component data dictionaries
         """
+        cached = self._get_catalog("components", project_key)
+        if cached is not None:
+            return cached
+
         try:
             components = self.jira.get_project_components(key=project_key)
-            return components if isinstance(components, list) else []
+            if not isinstance(components, list):
+                return []
+            self._set_catalog("components", components, project_key)
+            return components
 
         except Exception as e:
             logger.error(
@@ -125,6 +147,10 @@ class ProjectsMixin(JiraClient, SearchOperationsProto):
         Returns:
             List of version data dictionaries
         """
+        cached = self._get_catalog("versions", project_key)
+        if cached is not None:
+            return cached
+
         try:
             raw_versions = self.jira.get_project_versions(key=project_key)
             if not isinstance(raw_versions, list):
@@ -133,6 +159,7 @@ class ProjectsMixin(JiraClient, SearchOperationsProto):
             for v in raw_versions:
                 ver = JiraVersion.from_api_response(v)
                 versions.append(ver.to_simplified_dict())
+            self._set_catalog("versions", versions, project_key)
             return versions
         except Exception as e:
             logger.error(f"Error getting versions for project {project_key}: {str(e)}")
@@ -243,12 +270,20 @@ class ProjectsMixin(JiraClient, SearchOperationsProto):
         """
         Get all issue types available for a project.
 
+        Results are cached process-wide for CREATEMETA_CACHE_TTL seconds per
+        instance and credentials. Empty results and errors are not cached.
+
         Args:
             project_key: The project key
 
         Returns:
             List of issue type data dictionaries
         """
+        cache_key = (*self._cache_scope(), "issue_types", project_key)
+        cached = createmeta_cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
+
         try:
             meta = self.jira.issue_createmeta(project=project_key)
             if not isinstance(meta, dict):
@@ -263,6 +298,8 @@ class ProjectsMixin(JiraClient, SearchOperationsProto):
                 if "issuetypes" in project_data:
                     issue_types = project_data["issuetypes"]
 
+            if issue_types:
+                createmeta_cache.set(cache_key, list(issue_types))
             return issue_types
 
         except Exception as e:
@@ -382,12 +419,20 @@ class ProjectsMixin(JiraClient, SearchOperationsProto):
             logger.error(f"Error getting project leads: {str(e)}")
             return {}
 
-    def get_user_accessible_projects(self, username: str) -> list[dict[str, Any]]:
+    def get_user_accessible_projects(
+        self, username: str, limit: int | None = None
+    ) -> list[dict[str, Any]]:
         """
         Get projects that a specific user can access.
 
+        On Jira Cloud the browse permission of all projects is checked with
+        the bulk permission endpoint. Otherwise (or if the bulk check fails)
+        projects are checked concurrently. Results are cached per user and
+        project for PROJECT_PERMISSION_CACHE_TTL seconds.
+
         Args:
             username: The username to check access for
+            limit: Stop once this many accessible projects are found
 
         Returns:
             List of accessible project data dictionaries
@@ -395,44 +440,181 @@ class ProjectsMixin(JiraClient, SearchOperationsProto):
         try:
             # This requires admin permissions
             # For non-admins, a different approach might be needed
-            all_projects = self.get_all_projects()
-            accessible_projects = []
-
+            all_projects = [
+                project for project in self.get_all_projects() if project.get("key")
+            ]
+            scope = self._cache_scope()
+            access: dict[str, bool] = {}
             for project in all_projects:
-                project_key = project.get("key")
-                if not project_key:
-                    continue
-
-                try:
-                    # Check if user has browse permission for this project
-                    browse_users = (
-                        self.jira.get_users_with_browse_permission_to_a_project(
-                            username=username, project_key=project_key, limit=1
-                        )
-                    )
+                cached = project_permission_cache.get(
+                    (*scope, username, project["key"])
+                )
+                if cached is not None:
+                    access[project["key"]] = cached
+
+            unknown = [p for p in all_projects if p["key"] not in access]
+            if unknown and self.config.is_cloud:
+                bulk = self._check_browse_permissions_bulk(username, unknown)
+                if bulk is not None:
+                    access.update(bulk)
+                    unknown = []
+
+            return self._scan_browse_permissions(
+                username, all_projects, access, unknown, limit
+            )
+
+        except Exception as e:
+            logger.error(
+                f"Error getting accessible projects for user {username}: {str(e)}"
+            )
+            return []
 
-                    # If the user is in the list, they have access
-                    user_has_access = False
-                    if isinstance(browse_users, list):
-                        for user in browse_users:
-                            if isinstance(user, dict) and user.get("name") == username:
-                                user_has_access = True
-                                break
+    def _scan_browse_permissions(
+        self,
+        username: str,
+        projects: list[dict[str, Any]],
+        known: dict[str, bool],
+        unknown: list[dict[str, Any]],
+        limit: int | None,
+    ) -> list[dict[str, Any]]:
+        """
+        Check the unknown projects concurrently and collect accessible ones.
 
-                    if user_has_access:
-                        accessible_projects.append(project)
+        Projects are returned in their original order. Once ``limit``
+        accessible projects are found, checks that have not started yet are
+        cancelled.
 
-                except Exception:
-                    # Skip projects that cause errors
-                    continue
+        Args:
+            username: The username to check access for
+            projects: All projects, in result order
+            known: Access already known per project key
+            unknown: Projects whose access still has to be checked
+            limit: Maximum number of accessible projects to return
 
+        Returns:
+            List of accessible project data dictionaries
+        """
+        executor = ThreadPoolExecutor(
+            max_workers=PERMISSION_SCAN_WORKERS,
+            thread_name_prefix="permission-scan",
+        )
+        try:
+            check_permission = in_current_context(self._check_browse_permission)
+            futures = {
+                project["key"]: executor.submit(
+                    check_permission, username, project["key"]
+                )
+                for project in unknown
+            }
+            accessible_projects = []
+            for project in projects:
+                if limit is not None and len(accessible_projects) >= limit:
+                    break
+                project_key = project["key"]
+                if project_key in known:
+                    has_access = known[project_key]
+                else:
+                    try:
+                        has_access = futures[project_key].result()
+                    except Exception as e:
+                        # Skip projects that cause errors
+                        logger.debug(
+                            f"Browse permission check failed for {project_key}: "
+                            f"{str(e)}"
+                        )
+                        continue
+                if has_access:
+                    accessible_projects.append(project)
             return accessible_projects
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _check_browse_permission(self, username: str, project_key: str) -> bool:
+        """
+        Check whether a user may browse a project, caching the answer.
+
+        Args:
+            username: The username to check access for
+            project_key: The project key
 
+        Returns:
+            True if the user has browse permission
+        """
+        browse_users = self.jira.get_users_with_browse_permission_to_a_project(
+            username=username, project_key=project_key, limit=1
+        )
+
+        # If the user is in the list, they have access
+        user_has_access = isinstance(browse_users, list) and any(
+            isinstance(user, dict) and user.get("name") == username
+            for user in browse_users
+        )
+        project_permission_cache.set(
+            (*self._cache_scope(), username, project_key), user_has_access
+        )
+        return user_has_access
+
+    def _check_browse_permissions_bulk(
+        self, username: str, projects: list[dict[str, Any]]
+    ) -> dict[str, bool] | None:
+        """
+        Check browse permission for many projects with the bulk endpoint.
+
+        Uses ``POST /rest/api/3/permissions/check`` (Cloud only), in batches
+        of PERMISSION_CHECK_BATCH_SIZE projects.
+
+        Args:
+            username: The username or account ID to check access for
+            projects: The projects to check; each needs an 'id'
+
+        Returns:
+            Access per project key, or None if the bulk check is unavailable
+        """
+        if not hasattr(self, "_get_account_id"):
+            return None
+        try:
+            account_id = self._get_account_id(username)
+            ids_to_keys = {str(p["id"]): p["key"] for p in projects if p.get("id")}
+            if len(ids_to_keys) != len(projects):
+                return None
+
+            project_ids = list(ids_to_keys)
+            allowed: set[str] = set()
+            for offset in range(0, len(project_ids), PERMISSION_CHECK_BATCH_SIZE):
+                batch = project_ids[offset : offset + PERMISSION_CHECK_BATCH_SIZE]
+                response = self.jira.post(
+                    "rest/api/3/permissions/check",
+                    json={
+                        "accountId": account_id,
+                        "projectPermissions": [
+                            {
+                                "permissions": ["BROWSE_PROJECTS"],
+                                "projects": [int(pid) for pid in batch],
+                            }
+                        ],
+                    },
+                )
+                if not isinstance(response, dict):
+                    msg = f"Unexpected return value type from permissions check: {type(response)}"
+                    raise TypeError(msg)
+                for grant in response.get("projectPermissions", []):
+                    if grant.get("permission") == "BROWSE_PROJECTS":
+                        allowed.update(str(pid) for pid in grant.get("projects", []))
         except Exception as e:
-            logger.error(
-                f"Error getting accessible projects for user {username}: {str(e)}"
+            logger.debug(
+                f"Bulk permission check unavailable, checking projects "
+                f"individually: {str(e)}"
             )
-            return []
+            return None
+
+        scope = self._cache_scope()
+        access = {}
+        for project_id, project_key in ids_to_keys.items():
+            access[project_key] = project_id in allowed
+            project_permission_cache.set(
+                (*scope, username, project_key), access[project_key]
+            )
+        return access
 
     def create_project_version(
         self,
@@ -455,10 +637,65 @@ class ProjectsMixin(JiraClient, SearchOperationsProto):
         Returns:
             The created version object as returned by Jira
         """
-        return self.create_version(
-            project=project_key,
-            name=name,
-            start_date=start_date,
-            release_date=release_date,
-            description=description,
-        )
+        try:
+            return self.create_version(
+                project=project_key,
+                name=name,
+                start_date=start_date,
+                release_date=release_date,
+                description=description,
+            )
+        finally:
+            # Even a failed request may have created the version
+            self.invalidate_project_catalog(project_key)
+
+    def invalidate_project_catalog(self, project_key: str | None = None) -> None:
+        """
+        Drop cached project catalog data after a write.
+
+        Entries of all users of the instance are dropped, since the write
+        changes what every user sees.
+
+        Args:
+            project_key: Drop only the components and versions of this
+                project; when None, drop the whole catalog of the instance
+        """
+        url = self.config.url
+        for kind, cache in catalog_caches.items():
+            if project_key is None:
+                cache.invalidate_matching(lambda key: key[0] == url)
+            elif kind != "projects":
+                cache.invalidate_matching(
+                    lambda key: key[0] == url and key[2] == project_key
+                )
+
+    def _get_catalog(self, kind: str, *key: Any) -> list[dict[str, Any]] | None:
+        """
+        Get cached project catalog data.
+
+        Args:
+            kind: The kind of data ('projects', 'components' or 'versions')
+            key: The rest of the cache key, e.g. the project key
+
+        Returns:
+            A copy of the cached list, or None on a miss
+        """
+        cached = catalog_caches[kind].get((*self._cache_scope(), *key))
+        return list(cached) if cached is not None else None
+
+    def _set_catalog(self, kind: str, value: list[dict[str, Any]], *key: Any) -> None:
+        """
+        Cache project catalog data with the TTL configured for its kind.
+
+        Empty lists are not cached, since they are also returned on errors.
+
+        Args:
+            kind: The kind of data ('projects', 'components' or 'versions')
+            value: The data to cache
+            key: The rest of the cache key, e.g. the project key
+        """
+        if not value:
+            return
+        ttls = self.config.catalog_cache_ttls
+        ttl = ttls.get(kind) if isinstance(ttls, dict) else None
+        catalog_caches[kind].set((*self._cache_scope(), *key), list(value), ttl)
@@ -137,6 +137,12 @@ class FieldsOperationsProto(Protocol):
             A dictionary mapping lowercase field names and field IDs to actual field IDs.
         """
 
+    @abstractmethod
+    def get_fields(self, refresh: bool = False) -> list[dict[str, Any]]:
+        """
+        Get all available fields from Jira, using the field cache.
+        """
+
     @abstractmethod
     def get_field_by_id(
         self, field_id: str, refresh: bool = False
@@ -146,17 +152,34 @@ class FieldsOperationsProto(Protocol):
         """
 
     @abstractmethod
-    def get_field_ids_to_epic(self) -> dict[str, str]:
+    def get_field_ids_to_epic(self, refresh: bool = False) -> dict[str, str]:
         """
         Dynamically discover Jira field IDs relevant to Epic linking.
         This method queries the Jira API to find the correct custom field IDs
         for Epic-related fields, which can vary between different Jira instances.
 
+        Args:
+            refresh: When True, rediscover the fields instead of using the cache
+
         Returns:
             Dictionary mapping field names to their IDs
             (e.g., {'epic_link': 'customfield_10014', 'epic_name': 'customfield_10011'})
         """
 
+    @abstractmethod
+    def invalidate_epic_schema(self) -> None:
+        """Drop the cached epic schema so the next lookup rediscovers it."""
+
+    @abstractmethod
+    def remember_epic_field(self, name: str, field_id: str) -> None:
+        """
+        Record an epic field found by a fallback in the cached epic schema.
+
+        Args:
+            name: The epic schema key (e.g. 'epic_link')
+            field_id: The field ID that worked
+        """
+
     @abstractmethod
     def get_required_fields(self, issue_type: str, project_key: str) -> dict[str, Any]:
         """
@@ -1,6 +1,8 @@
 """Module for Jira search operations."""
 
 import logging
+from collections.abc import Callable
+from typing import Any
 
 import requests
 from requests.exceptions import HTTPError
@@ -132,6 +134,7 @@ class SearchMixin(JiraClient, IssueOperationsProto):
                     response_dict_for_model,
                     base_url=self.config.url,
                     requested_fields=fields_param,
+                    field_metadata=self._field_ids_cache,
                 )
 
                 # Return the full search result object
@@ -148,7 +151,10 @@ class SearchMixin(JiraClient, IssueOperationsProto):
 
                 # Convert the response to a search result model
                 search_result = JiraSearchResult.from_api_response(
-                    response, base_url=self.config.url, requested_fields=fields_param
+                    response,
+                    base_url=self.config.url,
+                    requested_fields=fields_param,
+                    field_metadata=self._field_ids_cache,
                 )
 
                 # Return the full search result object
@@ -184,6 +190,9 @@ class SearchMixin(JiraClient, IssueOperationsProto):
         """
         Get all issues linked to a specific board.
 
+        Results beyond one page are fetched automatically, concurrently once
+        the total is known, until ``limit`` issues have been collected.
+
         Args:
             board_id: The ID of the board
             jql: JQL query string
@@ -204,22 +213,25 @@ class SearchMixin(JiraClient, IssueOperationsProto):
             if fields_param is None:
                 fields_param = ",".join(DEFAULT_READ_JIRA_FIELDS)
 
-            response = self.jira.get_issues_for_board(
-                board_id=board_id,
-                jql=jql,
-                fields=fields_param,
-                start=start,
-                limit=limit,
-                expand=expand,
+            response = self._collect_issue_pages(
+                lambda page_start, page_size: self.jira.get_issues_for_board(
+                    board_id=board_id,
+                    jql=jql,
+                    fields=fields_param,
+                    start=page_start,
+                    limit=page_size,
+                    expand=expand,
+                ),
+                start,
+                limit,
             )
-            if not isinstance(response, dict):
-                msg = f"Unexpected return value type from `jira.get_issues_for_board`: {type(response)}"
-                logger.error(msg)
-                raise TypeError(msg)
 
             # Convert the response to a search result model
             search_result = JiraSearchResult.from_api_response(
-                response, base_url=self.config.url, requested_fields=fields_param
+                response,
+                base_url=self.config.url,
+                requested_fields=fields_param,
+                field_metadata=self._field_ids_cache,
             )
             return search_result
         except requests.HTTPError as e:
@@ -245,6 +257,9 @@ class SearchMixin(JiraClient, IssueOperationsProto):
         """
         Get all issues linked to a specific sprint.
 
+        Results beyond one page are fetched automatically, concurrently once
+        the total is known, until ``limit`` issues have been collected.
+
         Args:
             sprint_id: The ID of the sprint
             fields: Fields to return (comma-separated string or "*all")
@@ -263,19 +278,22 @@ class SearchMixin(JiraClient, IssueOperationsProto):
             if fields_param is None:
                 fields_param = ",".join(DEFAULT_READ_JIRA_FIELDS)
 
-            response = self.jira.get_sprint_issues(
-                sprint_id=sprint_id,
-                start=start,
-                limit=limit,
+            response = self._collect_issue_pages(
+                lambda page_start, page_size: self.jira.get_sprint_issues(
+                    sprint_id=sprint_id,
+                    start=page_start,
+                    limit=page_size,
+                ),
+                start,
+                limit,
             )
-            if not isinstance(response, dict):
-                msg = f"Unexpected return value type from `jira.get_sprint_issues`: {type(response)}"
-                logger.error(msg)
-                raise TypeError(msg)
 
             # Convert the response to a search result model
             search_result = JiraSearchResult.from_api_response(
-                response, base_url=self.config.url, requested_fields=fields_param
+                response,
+                base_url=self.config.url,
+                requested_fields=fields_param,
+                field_metadata=self._field_ids_cache,
             )
             return search_result
         except requests.HTTPError as e:
@@ -288,3 +306,29 @@ class SearchMixin(JiraClient, IssueOperationsProto):
         except Exception as e:
             logger.error(f"Error searching issues for sprint: {sprint_id}': {str(e)}")
             raise Exception(f"Error searching issues for sprint: {str(e)}") from e
+
+    def _collect_issue_pages(
+        self,
+        fetch_page: Callable[[int, int], Any],
+        start: int,
+        limit: int,
+    ) -> dict[str, Any]:
+        """
+        Collect up to ``limit`` issues from a paginated Agile API listing.
+
+        Args:
+            fetch_page: Called with a start index and a page size, returns the
+                raw page response
+            start: Index of the first issue
+            limit: Maximum number of issues to collect
+
+        Returns:
+            The first page response with the issues of all pages
+        """
+        first_page: dict[str, Any] | None = None
+        issues: list[dict[str, Any]] = []
+        for page in self.iter_offset_paged(fetch_page, "issues", start, limit):
+            if first_page is None:
+                first_page = page
+            issues.extend(page.get("issues") or [])
+        return {**(first_page or {}), "issues": issues[:limit]}
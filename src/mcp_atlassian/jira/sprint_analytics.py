@@ -0,0 +1,447 @@
+"""Module for Jira sprint analytics."""
+
+import logging
+from bisect import bisect_right
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from ..models.jira.common import JiraChangelog
+from ..utils import parse_date
+from ..utils.tracing import in_current_context
+from .cache import sprint_analytics_cache
+from .client import JiraClient
+from .constants import AGILE_MAX_RESULTS, SPRINT_ANALYTICS_CACHE_TTLS
+
+logger = logging.getLogger("mcp-jira")
+
+# Field names tried, in order, when no estimate field is given
+DEFAULT_ESTIMATE_FIELD_NAMES = ("Story Points", "Story point estimate")
+
+# Number of sprints analysed in parallel for a velocity report
+SPRINT_ANALYTICS_WORKERS = 4
+
+
+@dataclass
+class _Timeline:
+    """Values of one issue attribute over time, as parallel sorted arrays."""
+
+    initial: Any
+    times: list[datetime] = field(default_factory=list)
+    values: list[Any] = field(default_factory=list)
+
+    def at(self, moment: datetime) -> Any:
+        """Get the value in effect at a moment."""
+        index = bisect_right(self.times, moment)
+        return self.values[index - 1] if index else self.initial
+
+
+def _to_float(value: Any) -> float:
+    """Convert an estimate value to a number, treating blanks as zero."""
+    try:
+        return float(value) if value not in (None, "") else 0.0
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _sprint_ids(value: str | None) -> set[str]:
+    """Split the comma-separated sprint IDs of a Sprint field change."""
+    return {part.strip() for part in (value or "").split(",") if part.strip()}
+
+
+def _timeline(changes: list[tuple[datetime, Any, Any]], *, current: Any) -> _Timeline:
+    """
+    Build a timeline from (time, old value, new value) changes.
+
+    Args:
+        changes: Changes sorted by time
+        current: The current value, used when there are no changes
+
+    Returns:
+        The timeline of the value
+    """
+    if not changes:
+        return _Timeline(initial=current)
+    return _Timeline(
+        initial=changes[0][1],
+        times=[moment for moment, _, _ in changes],
+        values=[new for _, _, new in changes],
+    )
+
+
+def build_sprint_report(
+    sprint: dict[str, Any],
+    issues: list[dict[str, Any]],
+    changelogs: dict[str, list[JiraChangelog]],
+    done_status_ids: set[str],
+    estimate_field: str | None = None,
+    estimate_field_name: str | None = None,
+    now: datetime | None = None,
+) -> dict[str, Any]:
+    """
+    Compute velocity, burndown, carry-over and scope changes of a sprint.
+
+    The status, sprint membership and estimate of every issue are rebuilt
+    as timelines from its changelog and then sampled at the sprint start,
+    at the end of each sprint day and at the sprint end.
+
+    Args:
+        sprint: Raw sprint data from the Agile API
+        issues: Raw sprint issues including ``status`` and the estimate field
+        changelogs: Changelogs per issue ID
+        done_status_ids: IDs of the statuses in the 'done' category
+        estimate_field: ID of the estimate field, or None to count issues
+        estimate_field_name: Name of the estimate field in changelogs
+        now: Current time, used as the end of active sprints
+
+    Returns:
+        Dictionary with the sprint summary, the burndown series as columns,
+        the carried over issues and the scope change events
+    """
+    now = now or datetime.now(timezone.utc)
+    sprint_id = str(sprint.get("id", ""))
+    start = parse_date(sprint.get("startDate"))
+    planned_end = parse_date(sprint.get("endDate"))
+    end = parse_date(sprint.get("completeDate")) or (
+        min(planned_end, now) if planned_end else now
+    )
+    if start is None:
+        start = end
+
+    committed = completed = remaining_at_end = 0.0
+    committed_count = completed_count = 0
+    carry_over: list[dict[str, Any]] = []
+    scope_changes: list[dict[str, Any]] = []
+    timelines: list[tuple[_Timeline, _Timeline, _Timeline]] = []
+
+    for issue in issues:
+        issue_key = issue.get("key", "")
+        fields = issue.get("fields") or {}
+        status_changes: list[tuple[datetime, Any, Any]] = []
+        sprint_changes: list[tuple[datetime, Any, Any]] = []
+        estimate_changes: list[tuple[datetime, Any, Any]] = []
+        for changelog in sorted(
+            changelogs.get(str(issue.get("id")), []),
+            key=lambda changelog: changelog.created or start,
+        ):
+            if changelog.created is None:
+                continue
+            for item in changelog.items:
+                if item.field.lower() == "status":
+                    status_changes.append((changelog.created, item.from_id, item.to_id))
+                elif item.field.lower() == "sprint":
+                    sprint_changes.append(
+                        (
+                            changelog.created,
+                            sprint_id in _sprint_ids(item.from_id),
+                            sprint_id in _sprint_ids(item.to_id),
+                        )
+                    )
+                elif estimate_field_name and item.field == estimate_field_name:
+                    estimate_changes.append(
+                        (
+                            changelog.created,
+                            _to_float(item.from_string),
+                            _to_float(item.to_string),
+                        )
+                    )
+
+        status = _timeline(
+            status_changes, current=(fields.get("status") or {}).get("id")
+        )
+        # Issues returned by the sprint search are members of the sprint now
+        membership = _timeline(sprint_changes, current=True)
+        estimate = _timeline(
+            estimate_changes,
+            current=_to_float(fields.get(estimate_field)) if estimate_field else 1.0,
+        )
+        timelines.append((status, membership, estimate))
+
+        if membership.at(start):
+            committed += estimate.at(start)
+            committed_count += 1
+
+        for moment, was_member, is_member in sprint_changes:
+            if start < moment <= end and was_member != is_member:
+                scope_changes.append(
+                    {
+                        "issue_key": issue_key,
+                        "type": "added" if is_member else "removed",
+                        "at": moment.isoformat(),
+                        "points": estimate.at(moment),
+                    }
+                )
+        for moment, old_value, new_value in estimate_changes:
+            if start < moment <= end and membership.at(moment):
+                scope_changes.append(
+                    {
+                        "issue_key": issue_key,
+                        "type": "estimate_changed",
+                        "at": moment.isoformat(),
+                        "points": new_value - old_value,
+                    }
+                )
+
+        if membership.at(end):
+            points = estimate.at(end)
+            if str(status.at(end)) in done_status_ids:
+                completed += points
+                completed_count += 1
+            else:
+                remaining_at_end += points
+                carry_over.append({"issue_key": issue_key, "points": points})
+
+    # Sample the remaining work at the end of every sprint day
+    samples: list[datetime] = []
+    day_end = datetime.combine(start.date(), datetime.max.time(), tzinfo=start.tzinfo)
+    while day_end < end:
+        samples.append(day_end)
+        day_end += timedelta(days=1)
+    samples.append(end)
+
+    remaining = [
+        sum(
+            estimate.at(moment)
+            for status, membership, estimate in timelines
+            if membership.at(moment) and str(status.at(moment)) not in done_status_ids
+        )
+        for moment in samples
+    ]
+    span = (end - start).total_seconds() or 1.0
+    ideal = [
+        max(committed * (1 - (moment - start).total_seconds() / span), 0.0)
+        for moment in samples
+    ]
+
+    return {
+        "sprint": {
+            "id": sprint_id,
+            "name": sprint.get("name", ""),
+            "state": sprint.get("state", ""),
+            "start_date": sprint.get("startDate"),
+            "end_date": sprint.get("endDate"),
+            "complete_date": sprint.get("completeDate"),
+        },
+        "estimate_field": estimate_field,
+        "committed": committed,
+        "committed_issues": committed_count,
+        "completed": completed,
+        "completed_issues": completed_count,
+        "added": sum(c["points"] for c in scope_changes if c["type"] == "added"),
+        "removed": sum(c["points"] for c in scope_changes if c["type"] == "removed"),
+        "carry_over": carry_over,
+        "carry_over_points": remaining_at_end,
+        "burndown": {
+            "date": [moment.date().isoformat() for moment in samples],
+            "remaining": remaining,
+            "ideal": ideal,
+        },
+        "scope_changes": sorted(scope_changes, key=lambda change: change["at"]),
+    }
+
+
+class SprintAnalyticsMixin(JiraClient):
+    """Mixin for Jira sprint analytics."""
+
+    def get_sprint_report(
+        self, sprint_id: str, estimate_field: str | None = None
+    ) -> dict[str, Any]:
+        """
+        Get velocity, burndown, carry-over and scope changes of a sprint.
+
+        Args:
+            sprint_id: The sprint ID
+            estimate_field: Name or ID of the estimate field (defaults to the
+                story points field; issues are counted when there is none)
+
+        Returns:
+            The sprint report (see build_sprint_report)
+
+        Raises:
+            ValueError: If the sprint cannot be found
+        """
+        sprint = self.jira.get_sprint(sprint_id)
+        if not isinstance(sprint, dict):
+            error_msg = f"Sprint {sprint_id} not found"
+            raise ValueError(error_msg)
+        return self._get_sprint_report(
+            sprint, *self._resolve_estimate_field(estimate_field)
+        )
+
+    def get_board_velocity(
+        self,
+        board_id: str,
+        sprint_count: int = 5,
+        estimate_field: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Get the committed and completed work of the last closed sprints.
+
+        Args:
+            board_id: The board ID
+            sprint_count: Number of most recent closed sprints to include
+            estimate_field: Name or ID of the estimate field
+
+        Returns:
+            Dictionary with per-sprint columns and the average velocity
+        """
+        sprints = self.get_all_sprints_from_board(  # type: ignore[attr-defined]
+            board_id=board_id, state="closed", limit=AGILE_MAX_RESULTS
+        )
+        sprints = sorted(sprints, key=lambda sprint: sprint.get("completeDate") or "")[
+            -sprint_count:
+        ]
+        estimate = self._resolve_estimate_field(estimate_field)
+        done_status_ids = self._get_done_status_ids()
+
+        with ThreadPoolExecutor(
+            max_workers=SPRINT_ANALYTICS_WORKERS, thread_name_prefix="sprint-analytics"
+        ) as executor:
+            reports = list(
+                executor.map(
+                    in_current_context(
+                        lambda sprint: self._get_sprint_report(
+                            sprint, *estimate, done_status_ids=done_status_ids
+                        )
+                    ),
+                    sprints,
+                )
+            )
+
+        completed = [report["completed"] for report in reports]
+        return {
+            "board_id": board_id,
+            "estimate_field": estimate[0],
+            "sprint_id": [report["sprint"]["id"] for report in reports],
+            "sprint_name": [report["sprint"]["name"] for report in reports],
+            "committed": [report["committed"] for report in reports],
+            "completed": completed,
+            "carry_over_points": [report["carry_over_points"] for report in reports],
+            "average_velocity": sum(completed) / len(completed) if completed else 0.0,
+        }
+
+    def _get_sprint_report(
+        self,
+        sprint: dict[str, Any],
+        estimate_field: str | None,
+        estimate_field_name: str | None,
+        done_status_ids: set[str] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Build a sprint report, reusing a cached one for the same sprint state.
+
+        Closed sprints never change, so their reports are kept much longer
+        than those of active sprints.
+
+        Args:
+            sprint: Raw sprint data from the Agile API
+            estimate_field: ID of the estimate field, or None to count issues
+            estimate_field_name: Name of the estimate field in changelogs
+            done_status_ids: IDs of the 'done' statuses, fetched if None
+
+        Returns:
+            The sprint report
+        """
+        state = str(sprint.get("state", ""))
+        key = (*self._cache_scope(), str(sprint.get("id")), state, estimate_field)
+        cached = sprint_analytics_cache.get(key)
+        if cached is not None:
+            return cached
+
+        issues = self._get_sprint_report_issues(str(sprint.get("id")), estimate_field)
+        changelog_fields = None
+        if self.config.is_cloud:
+            # Cloud filters by field ID on the server
+            sprint_field = self.get_field_id("Sprint")  # type: ignore[attr-defined]
+            changelog_fields = [
+                "status",
+                *(field_id for field_id in (sprint_field, estimate_field) if field_id),
+            ]
+        changelogs = {
+            issue.id: issue.changelogs
+            for issue in (
+                self.batch_get_changelogs(  # type: ignore[attr-defined]
+                    [issue["key"] for issue in issues], fields=changelog_fields
+                )
+                if issues
+                else []
+            )
+        }
+        report = build_sprint_report(
+            sprint,
+            issues,
+            changelogs,
+            done_status_ids
+            if done_status_ids is not None
+            else self._get_done_status_ids(),
+            estimate_field=estimate_field,
+            estimate_field_name=estimate_field_name,
+        )
+        sprint_analytics_cache.set(
+            key,
+            report,
+            ttl=SPRINT_ANALYTICS_CACHE_TTLS.get(
+                state, SPRINT_ANALYTICS_CACHE_TTLS["active"]
+            ),
+        )
+        return report
+
+    def _get_sprint_report_issues(
+        self, sprint_id: str, estimate_field: str | None
+    ) -> list[dict[str, Any]]:
+        """
+        Get the issues of a sprint with only the fields a report needs.
+
+        Args:
+            sprint_id: The sprint ID
+            estimate_field: ID of the estimate field, or None
+
+        Returns:
+            Raw issue data
+        """
+        fields = ",".join(filter(None, ("status", estimate_field)))
+        url = f"rest/agile/1.0/sprint/{sprint_id}/issue"
+        issues: list[dict[str, Any]] = []
+        for page in self.iter_offset_paged(
+            lambda start, limit: self.jira.get(
+                url, params={"startAt": start, "maxResults": limit, "fields": fields}
+            ),
+            "issues",
+        ):
+            issues.extend(page.get("issues") or [])
+        return issues
+
+    def _resolve_estimate_field(
+        self, estimate_field: str | None
+    ) -> tuple[str | None, str | None]:
+        """
+        Resolve the ID and name of the estimate field.
+
+        Args:
+            estimate_field: Name or ID of the field, or None for the default
+
+        Returns:
+            Tuple of field ID and name, or (None, None) to count issues
+        """
+        candidates: Iterable[str] = (
+            (estimate_field,) if estimate_field else DEFAULT_ESTIMATE_FIELD_NAMES
+        )
+        for candidate in candidates:
+            field_id = self.get_field_id(candidate)  # type: ignore[attr-defined]
+            if field_id:
+                field = self.get_field_by_id(field_id) or {}  # type: ignore[attr-defined]
+                return field_id, field.get("name", candidate)
+        if estimate_field:
+            error_msg = f"Estimate field '{estimate_field}' not found"
+            raise ValueError(error_msg)
+        return None, None
+
+    def _get_done_status_ids(self) -> set[str]:
+        """Get the IDs of all statuses in the 'done' status category."""
+        return {
+            status_id
+            for status_id, category in self._get_status_categories().items()
+            if category == "done"
+        }
@@ -22,6 +22,9 @@ class SprintsMixin(JiraClient):
         """
         Get all sprints from a board.
 
+        Results beyond one page are fetched automatically until ``limit``
+        sprints have been collected.
+
         Args:
             board_id: Board ID
             state: Sprint state (e.g., active, future, closed) if None, return all state sprints
@@ -32,13 +35,20 @@ class SprintsMixin(JiraClient):
             List of sprints
         """
         try:
-            sprints = self.jira.get_all_sprints_from_board(
-                board_id=board_id,
-                state=state,
-                start=start,
-                limit=limit,
-            )
-            return sprints.get("values", []) if isinstance(sprints, dict) else []
+            sprints: list[dict[str, Any]] = []
+            for page in self.iter_offset_paged(
+                lambda page_start, page_size: self.jira.get_all_sprints_from_board(
+                    board_id=board_id,
+                    state=state,
+                    start=page_start,
+                    limit=page_size,
+                ),
+                "values",
+                start,
+                limit,
+            ):
+                sprints.extend(page.get("values") or [])
+            return sprints[:limit]
         except requests.HTTPError as e:
             logger.error(
                 f"Error getting all sprints from board: {str(e.response.content)}"
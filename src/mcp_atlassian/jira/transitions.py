@@ -8,6 +8,7 @@ from requests.exceptions import HTTPError
 from ..exceptions import MCPAtlassianAuthenticationError
 from ..models import JiraIssue, JiraTransition
 from .client import JiraClient
+from .constants import WriteResponseMode
 from .protocols import IssueOperationsProto, UsersOperationsProto
 
 logger = logging.getLogger("mcp-jira")
@@ -50,6 +51,9 @@ class TransitionsMixin(JiraClient, IssueOperationsProto, UsersOperationsProto):
                 # Option 1: 'to' field with sub-fields
                 if "to" in transition and isinstance(transition["to"], dict):
                     to_status = transition["to"].get("name")
+                # Option 1b: 'to' as the status name (atlassian-python-api)
+                elif isinstance(transition.get("to"), str):
+                    to_status = transition["to"]
                 # Option 2: 'to_status' field directly
                 elif "to_status" in transition:
                     to_status = transition.get("to_status")
@@ -120,18 +124,27 @@ class TransitionsMixin(JiraClient, IssueOperationsProto, UsersOperationsProto):
         transition_id: str | int,
         fields: dict[str, Any] | None = None,
         comment: str | None = None,
-    ) -> JiraIssue:
+        response_mode: WriteResponseMode = "full",
+    ) -> JiraIssue | None:
         """
         Transition a Jira issue to a new status.
 
+        The transition, its fields and comment are sent in a single request.
+        Available transitions are only looked up when Jira rejects it, to
+        explain the failure.
+
         Args:
             issue_key: The key of the issue to transition
             transition_id: The ID of the transition to perform (integer preferred, string accepted)
             fields: Optional fields to set during the transition
             comment: Optional comment to add during the transition
+            response_mode: 'full' to return the re-fetched issue, 'narrow' to
+                fetch only the transitioned fields and the status, 'none' to
+                skip the re-fetch and return None
 
         Returns:
-            JiraIssue model representing the transitioned issue
+            JiraIssue model representing the transitioned issue, or None when
+            response_mode is 'none'
 
         Raises:
             MCPAtlassianAuthenticationError: If authentication fails with the Jira API (401/403)
@@ -141,38 +154,6 @@ class TransitionsMixin(JiraClient, IssueOperationsProto, UsersOperationsProto):
             # Normalize transition_id to an integer when possible, or string otherwise
             normalized_transition_id = self._normalize_transition_id(transition_id)
 
-            # Validate that this is a valid transition ID
-            valid_transitions = self.get_transitions_models(issue_key)
-            valid_ids = [t.id for t in valid_transitions]
-
-            # Convert string IDs to integers for proper comparison if normalized_transition_id is an integer
-            if isinstance(normalized_transition_id, int):
-                valid_ids = [
-                    int(id_val)
-                    if isinstance(id_val, str) and id_val.isdigit()
-                    else id_val
-                    for id_val in valid_ids
-                ]
-
-            # Check if the normalized_transition_id is in the list of valid IDs
-            id_to_check = normalized_transition_id
-            if id_to_check not in valid_ids:
-                available_transitions = ", ".join(
-                    f"{t.id} ({t.name})" for t in valid_transitions
-                )
-                logger.warning(
-                    f"Transition ID {id_to_check} not in available transitions: {available_transitions}"
-                )
-                # Continue anyway as Jira will validate
-
-            # Find the target status name corresponding to the transition ID
-            target_status_name = None
-            for transition in valid_transitions:
-                if str(transition.id) == str(normalized_transition_id):
-                    if transition.to_status and transition.to_status.name:
-                        target_status_name = transition.to_status.name
-                        break
-
             # Sanitize fields if provided
             fields_for_api = None
             if fields:
@@ -194,44 +175,14 @@ class TransitionsMixin(JiraClient, IssueOperationsProto, UsersOperationsProto):
             )
             logger.debug(f"Fields: {fields_for_api}, Update: {update_for_api}")
 
-            # Attempt to transition the issue using the appropriate method
-            if target_status_name:
-                # If we have a status name, use set_issue_status
-                logger.info(f"Using status name '{target_status_name}' for transition")
-                self.jira.set_issue_status(
-                    issue_key=issue_key,
-                    status_name=target_status_name,
-                    fields=fields_for_api,
-                    update=update_for_api,
-                )
-            else:
-                # If no status name is found, try direct transition ID method
-                logger.info(f"Using direct transition ID {normalized_transition_id}")
-                # Convert to integer if it's a string that looks like an integer
-                if (
-                    isinstance(normalized_transition_id, str)
-                    and normalized_transition_id.isdigit()
-                ):
-                    normalized_transition_id = int(normalized_transition_id)
-
-                # Use set_issue_status_by_transition_id for direct ID transition
-                self.jira.set_issue_status_by_transition_id(
-                    issue_key=issue_key, transition_id=normalized_transition_id
-                )
-
-                # Apply fields and comments separately if needed
-                if fields_for_api or update_for_api:
-                    payload = {}
-                    if fields_for_api:
-                        payload["fields"] = fields_for_api
-                    if update_for_api:
-                        payload["update"] = update_for_api
-
-                    if payload:
-                        base_url = self.jira.resource_url("issue")
-                        url = f"{base_url}/{issue_key}"
-                        self.jira.put(url, data=payload)
+            self._perform_transition(
+                issue_key, normalized_transition_id, fields_for_api, update_for_api
+            )
 
+            if response_mode != "full":
+                return self._get_written_issue(  # type: ignore[attr-defined]
+                    issue_key, response_mode, [*(fields_for_api or {}), "status"]
+                )
             # Return the updated issue
             return self.get_issue(issue_key)
         except HTTPError as http_err:
@@ -259,6 +210,54 @@ class TransitionsMixin(JiraClient, IssueOperationsProto, UsersOperationsProto):
             logger.error(error_msg)
             raise ValueError(error_msg) from e
 
+    def _perform_transition(
+        self,
+        issue_key: str,
+        transition_id: str | int,
+        fields: dict[str, Any] | None = None,
+        update: dict[str, Any] | None = None,
+    ) -> None:
+        """
+        Post a transition, with its fields and update data, in one request.
+
+        Args:
+            issue_key: The key of the issue to transition
+            transition_id: The ID of the transition to perform
+            fields: Optional fields to set during the transition
+            update: Optional update operations (e.g. a comment)
+
+        Raises:
+            ValueError: If Jira rejects the transition; the message lists the
+                transitions that are available
+            HTTPError: For other HTTP errors
+        """
+        if isinstance(transition_id, str) and transition_id.isdigit():
+            transition_id = int(transition_id)
+        data: dict[str, Any] = {"transition": {"id": transition_id}}
+        if fields:
+            data["fields"] = fields
+        if update:
+            data["update"] = update
+
+        base_url = self.jira.resource_url("issue")
+        try:
+            self.jira.post(f"{base_url}/{issue_key}/transitions", data=data)
+        except HTTPError as http_err:
+            if http_err.response is None or http_err.response.status_code != 400:
+                raise
+            # The transition is invalid or misses required fields
+            try:
+                available = ", ".join(
+                    f"{t.id} ({t.name})" for t in self.get_transitions_models(issue_key)
+                )
+            except Exception:  # noqa: BLE001 - Only used to enrich the error
+                available = "unknown"
+            error_msg = (
+                f"Jira rejected transition {transition_id} for {issue_key}: "
+                f"{http_err}. Available transitions: {available or 'None found'}"
+            )
+            raise ValueError(error_msg) from http_err
+
     def _normalize_transition_id(self, transition_id: str | int | dict) -> str | int:
         """
         Normalize the transition ID to a common format.
@@ -2,14 +2,30 @@
 
 import logging
 import re
+from collections import defaultdict
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timezone
 from typing import Any
 
 from ..models import JiraWorklog
 from ..utils import parse_date
+from ..utils.tracing import in_current_context
 from .client import JiraClient
 
 logger = logging.getLogger("mcp-jira")
 
+# Number of worklogs requested per page
+WORKLOG_PAGE_SIZE = 1000
+
+# Number of issues whose worklogs are fetched in parallel for a report
+WORKLOG_REPORT_WORKERS = 8
+
+# Page size used when collecting the issues of a report on Server/DC
+WORKLOG_REPORT_SEARCH_PAGE_SIZE = 50
+
+_ORDER_BY_PATTERN = re.compile(r"\border\s+by\b", re.IGNORECASE)
+
 
 class WorklogMixin(JiraClient):
     """Mixin for Jira worklog operations."""
@@ -154,6 +170,306 @@ class WorklogMixin(JiraClient):
             logger.error(f"Error adding worklog to issue {issue_key}: {str(e)}")
             raise Exception(f"Error adding worklog: {str(e)}") from e
 
+    def iter_worklogs(
+        self,
+        issue_key: str,
+        started_after: datetime | str | int | None = None,
+        page_size: int = WORKLOG_PAGE_SIZE,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Stream the raw worklog entries of an issue page by page.
+
+        Only one page is held in memory at a time, so issues with thousands
+        of worklogs are neither truncated nor fully materialized.
+
+        Args:
+            issue_key: The issue key (e.g. 'PROJ-123')
+            started_after: Only return worklogs started at or after this time,
+                given as a datetime, a date string or epoch milliseconds
+            page_size: Number of worklogs to request per page
+
+        Yields:
+            Raw worklog entries from the API
+
+        Raises:
+            TypeError: If the API returns an unexpected response type
+        """
+        started_after_ms = self._to_epoch_millis(started_after)
+        url = f"{self.jira.resource_url('issue')}/{issue_key}/worklog"
+        start_at = 0
+        while True:
+            params: dict[str, Any] = {"startAt": start_at, "maxResults": page_size}
+            if started_after_ms is not None:
+                params["startedAfter"] = started_after_ms
+            result = self.jira.get(url, params=params)
+            if not result:
+                return
+            if not isinstance(result, dict):
+                msg = f"Unexpected return value type from `jira.get`: {type(result)}"
+                logger.error(msg)
+                raise TypeError(msg)
+
+            worklogs = result.get("worklogs") or []
+            for worklog in worklogs:
+                # Older Jira Server versions ignore startedAfter
+                if started_after_ms is not None:
+                    started = parse_date(worklog.get("started"))
+                    if started and self._to_epoch_millis(started) < started_after_ms:
+                        continue
+                yield worklog
+
+            start_at += len(worklogs)
+            total = result.get("total")
+            if not worklogs or not isinstance(total, int) or start_at >= total:
+                return
+
+    @staticmethod
+    def _to_epoch_millis(value: datetime | str | int | None) -> int | None:
+        """Convert a datetime, date string or epoch milliseconds to milliseconds."""
+        if value is None or value == "":
+            return None
+        if isinstance(value, int):
+            return value
+        if not isinstance(value, datetime):
+            value = parse_date(value)
+            if value is None:
+                return None
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return int(value.timestamp() * 1000)
+
+    def aggregate_worklogs(
+        self,
+        issue_key: str,
+        started_after: datetime | str | int | None = None,
+    ) -> dict[str, Any]:
+        """
+        Total the time logged on an issue per author and day.
+
+        Totals are computed while the worklogs are streamed, so individual
+        entries are never collected.
+
+        Args:
+            issue_key: The issue key (e.g. 'PROJ-123')
+            started_after: Only count worklogs started at or after this time
+
+        Returns:
+            Dictionary with the overall total, the number of worklogs and the
+            seconds logged per author, per day and per author and day
+        """
+        total_seconds = 0
+        worklog_count = 0
+        by_author: defaultdict[str, int] = defaultdict(int)
+        by_day: defaultdict[str, int] = defaultdict(int)
+        by_author_day: defaultdict[str, defaultdict[str, int]] = defaultdict(
+            lambda: defaultdict(int)
+        )
+
+        for worklog in self.iter_worklogs(issue_key, started_after=started_after):
+            seconds = self._worklog_seconds(worklog)
+            author = (worklog.get("author") or {}).get("displayName", "Unknown")
+            started = parse_date(worklog.get("started"))
+            day = started.date().isoformat() if started else "unknown"
+
+            total_seconds += seconds
+            worklog_count += 1
+            by_author[author] += seconds
+            by_day[day] += seconds
+            by_author_day[author][day] += seconds
+
+        return {
+            "issue_key": issue_key,
+            "total_seconds": total_seconds,
+            "worklog_count": worklog_count,
+            "by_author": dict(by_author),
+            "by_day": dict(sorted(by_day.items())),
+            "by_author_day": {
+                author: dict(sorted(days.items()))
+                for author, days in by_author_day.items()
+            },
+        }
+
+    @staticmethod
+    def _worklog_seconds(worklog: dict[str, Any]) -> int:
+        """Get the time spent of a raw worklog entry in seconds."""
+        try:
+            return int(worklog.get("timeSpentSeconds") or 0)
+        except (TypeError, ValueError):
+            return 0
+
+    def get_worklog_report(
+        self,
+        jql: str,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        max_issues: int = 1000,
+    ) -> dict[str, Any]:
+        """
+        Report the time logged on the issues matching a JQL query.
+
+        The JQL is narrowed with ``worklogDate`` so that only issues with work
+        logged in the date range are searched. Their worklogs are then
+        streamed concurrently and totalled per author, issue and day. The
+        table is returned as columns of equal length to keep it compact.
+        Issues whose worklogs cannot be read are left out and listed in
+        ``skipped_issue_keys``.
+
+        Args:
+            jql: JQL query selecting the issues to report on
+            start_date: First day to include (YYYY-MM-DD), inclusive
+            end_date: Last day to include (YYYY-MM-DD), inclusive
+            max_issues: Maximum number of issues to include
+
+        Returns:
+            Dictionary with the report totals and a columnar ``table`` with
+            ``author``, ``issue_key``, ``day`` and ``seconds`` columns
+
+        Raises:
+            ValueError: If a date is not in the YYYY-MM-DD format
+        """
+        start = self._parse_report_date(start_date, "start_date")
+        end = self._parse_report_date(end_date, "end_date")
+
+        issue_keys = self._search_worklog_issue_keys(
+            self._worklog_report_jql(jql, start, end), max_issues
+        )
+
+        totals: defaultdict[tuple[str, str, str], int] = defaultdict(int)
+        worklog_count = 0
+        skipped_issue_keys: list[str] = []
+        with ThreadPoolExecutor(
+            max_workers=WORKLOG_REPORT_WORKERS, thread_name_prefix="worklog-report"
+        ) as executor:
+            issue_totals = executor.map(
+                in_current_context(
+                    lambda key: self._aggregate_issue_worklogs(key, start, end)
+                ),
+                issue_keys,
+            )
+            for issue_key, issue_total in zip(issue_keys, issue_totals, strict=True):
+                if issue_total is None:
+                    skipped_issue_keys.append(issue_key)
+                    continue
+                count, by_author_day = issue_total
+                worklog_count += count
+                for (author, day), seconds in by_author_day.items():
+                    totals[(author, issue_key, day)] += seconds
+
+        table: dict[str, list[Any]] = {
+            "author": [],
+            "issue_key": [],
+            "day": [],
+            "seconds": [],
+        }
+        for (author, issue_key, day), seconds in sorted(
+            totals.items(), key=lambda item: (item[0][2], item[0][0], item[0][1])
+        ):
+            table["author"].append(author)
+            table["issue_key"].append(issue_key)
+            table["day"].append(day)
+            table["seconds"].append(seconds)
+
+        return {
+            "jql": jql,
+            "start_date": start.isoformat() if start else None,
+            "end_date": end.isoformat() if end else None,
+            "issue_count": len(issue_keys),
+            "worklog_count": worklog_count,
+            "total_seconds": sum(table["seconds"]),
+            "skipped_issue_keys": skipped_issue_keys,
+            "table": table,
+        }
+
+    @staticmethod
+    def _parse_report_date(value: str | None, name: str) -> date | None:
+        """Parse an optional YYYY-MM-DD report date."""
+        if not value:
+            return None
+        try:
+            return date.fromisoformat(value)
+        except ValueError as e:
+            error_msg = f"{name} must be a date in YYYY-MM-DD format, got {value!r}"
+            raise ValueError(error_msg) from e
+
+    @staticmethod
+    def _worklog_report_jql(jql: str, start: date | None, end: date | None) -> str:
+        """Restrict a JQL query to issues with work logged in a date range."""
+        # Ordering does not matter for a report and would break the AND below
+        query = _ORDER_BY_PATTERN.split(jql, maxsplit=1)[0].strip()
+        clauses = [f"({query})"] if query else []
+        if start:
+            clauses.append(f'worklogDate >= "{start.isoformat()}"')
+        if end:
+            clauses.append(f'worklogDate <= "{end.isoformat()}"')
+        return " AND ".join(clauses)
+
+    def _search_worklog_issue_keys(self, jql: str, max_issues: int) -> list[str]:
+        """
+        Collect the keys of the issues matching a JQL query.
+
+        Args:
+            jql: The JQL query
+            max_issues: Maximum number of keys to collect
+
+        Returns:
+            List of issue keys in search order
+        """
+        if self.config.is_cloud:
+            # Cloud search pages through the results by itself
+            result = self.search_issues(jql, fields="key", limit=max_issues)  # type: ignore[attr-defined]
+            return [issue.key for issue in result.issues][:max_issues]
+
+        issue_keys: list[str] = []
+        while len(issue_keys) < max_issues:
+            result = self.search_issues(  # type: ignore[attr-defined]
+                jql,
+                fields="key",
+                start=len(issue_keys),
+                limit=WORKLOG_REPORT_SEARCH_PAGE_SIZE,
+            )
+            issue_keys.extend(issue.key for issue in result.issues)
+            if not result.issues or len(issue_keys) >= result.total:
+                break
+        return issue_keys[:max_issues]
+
+    def _aggregate_issue_worklogs(
+        self, issue_key: str, start: date | None, end: date | None
+    ) -> tuple[int, dict[tuple[str, str], int]] | None:
+        """
+        Total the worklogs of one issue per author and day within a range.
+
+        Args:
+            issue_key: The issue key
+            start: First day to include, or None
+            end: Last day to include, or None
+
+        Returns:
+            Tuple of the number of worklogs counted and the seconds logged
+            per (author, day), or None if the worklogs could not be read
+        """
+        started_after = (
+            datetime.combine(start, datetime.min.time(), tzinfo=timezone.utc)
+            if start
+            else None
+        )
+        count = 0
+        by_author_day: defaultdict[tuple[str, str], int] = defaultdict(int)
+        try:
+            for worklog in self.iter_worklogs(issue_key, started_after=started_after):
+                started = parse_date(worklog.get("started"))
+                day = started.date() if started else None
+                if day and ((start and day < start) or (end and day > end)):
+                    continue
+                author = (worklog.get("author") or {}).get("displayName", "Unknown")
+                count += 1
+                by_author_day[(author, day.isoformat() if day else "unknown")] += (
+                    self._worklog_seconds(worklog)
+                )
+        except Exception as e:
+            logger.warning(f"Skipping worklogs of {issue_key} in the report: {e}")
+            return None
+        return count, dict(by_author_day)
+
     def get_worklog(self, issue_key: str) -> dict[str, Any]:
         """
         Get the worklog data for an issue.
@@ -162,40 +478,51 @@ class WorklogMixin(JiraClient):
             issue_key: The issue key (e.g. 'PROJ-123')
 
         Returns:
-            Raw worklog data from the API
+            Raw worklog data with every page of worklogs
         """
         try:
-            return self.jira.worklog(issue_key)  # type: ignore[attr-defined]
+            return {"worklogs": list(self.iter_worklogs(issue_key))}
         except Exception as e:
             logger.warning(f"Error getting worklog for {issue_key}: {e}")
             return {"worklogs": []}
 
-    def get_worklog_models(self, issue_key: str) -> list[JiraWorklog]:
+    def get_worklog_models(
+        self,
+        issue_key: str,
+        started_after: datetime | str | int | None = None,
+    ) -> list[JiraWorklog]:
         """
         Get all worklog entries for an issue as JiraWorklog models.
 
         Args:
             issue_key: The issue key (e.g. 'PROJ-123')
+            started_after: Only return worklogs started at or after this time
 
         Returns:
             List of JiraWorklog models
         """
-        worklog_data = self.get_worklog(issue_key)
-        result: list[JiraWorklog] = []
-
-        if "worklogs" in worklog_data and worklog_data["worklogs"]:
-            for log_data in worklog_data["worklogs"]:
-                worklog = JiraWorklog.from_api_response(log_data)
-                result.append(worklog)
-
-        return result
+        try:
+            return [
+                JiraWorklog.from_api_response(log_data)
+                for log_data in self.iter_worklogs(
+                    issue_key, started_after=started_after
+                )
+            ]
+        except Exception as e:
+            logger.warning(f"Error getting worklog for {issue_key}: {e}")
+            return []
 
-    def get_worklogs(self, issue_key: str) -> list[dict[str, Any]]:
+    def get_worklogs(
+        self,
+        issue_key: str,
+        started_after: datetime | str | int | None = None,
+    ) -> list[dict[str, Any]]:
         """
         Get all worklog entries for an issue.
 
         Args:
             issue_key: The issue key (e.g. 'PROJ-123')
+            started_after: Only return worklogs started at or after this time
 
         Returns:
             List of worklog entries
@@ -204,15 +531,9 @@ class WorklogMixin(JiraClient):
             Exception: If there's an error getting the worklogs
         """
         try:
-            result = self.jira.issue_get_worklog(issue_key)
-            if not isinstance(result, dict):
-                msg = f"Unexpected return value type from `jira.issue_get_worklog`: {type(result)}"
-                logger.error(msg)
-                raise TypeError(msg)
-
             # Process the worklogs
             worklogs = []
-            for worklog in result.get("worklogs", []):
+            for worklog in self.iter_worklogs(issue_key, started_after=started_after):
                 worklogs.append(
                     {
                         "id": worklog.get("id"),
@@ -17,6 +17,7 @@ from .common import (
     JiraTimetracking,
     JiraUser,
 )
+from .field_context import JiraFieldContext
 from .issue import JiraIssue
 from .link import (
     JiraIssueLink,
@@ -47,6 +48,7 @@ __all__ = [
     "JiraBoard",
     "JiraSprint",
     "JiraIssue",
+    "JiraFieldContext",
     "JiraSearchResult",
     "JiraIssueLinkType",
     "JiraIssueLink",
@@ -0,0 +1,207 @@
+"""
+Jira custom field resolution context.
+
+This module provides a lookup table for custom field names that is built once
+per API response (for example a whole search result) and shared by every issue
+parsed from it, so name resolution does not have to be repeated per issue.
+"""
+
+import logging
+import re
+from collections.abc import Iterable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+def _normalize_field_name(name: str) -> str:
+    """Lowercase a field name and strip separators for pattern matching."""
+    return re.sub(r"[_\-\s]", "", name.lower())
+
+
+class JiraFieldContext:
+    """
+    Custom field name resolution shared across a Jira result set.
+
+    The context maps field IDs to display names and back, using the ``names``
+    map of an API response (``expand=names``) and, when available, the field
+    metadata returned by ``/rest/api/2/field``. Results of pattern searches and
+    projection lookups are memoized, so each issue only performs dictionary
+    lookups.
+    """
+
+    def __init__(
+        self,
+        names: dict[str, Any] | None = None,
+        field_metadata: Iterable[dict[str, Any]] | None = None,
+        schema_fields: dict[str, Any] | None = None,
+    ) -> None:
+        """
+        Initialize the context.
+
+        Args:
+            names: Mapping of field ID to display name from an API response
+            field_metadata: Field definitions as returned by the field API
+            schema_fields: Mapping of field ID to schema info containing a name
+        """
+        # Names from the response take priority over metadata and schema
+        self.id_to_name: dict[str, str] = {}
+        if isinstance(names, dict):
+            for field_id, field_name in names.items():
+                if field_name:
+                    self.id_to_name[str(field_id)] = str(field_name)
+        if isinstance(schema_fields, dict):
+            for field_id, field_info in schema_fields.items():
+                if (
+                    str(field_id).startswith("customfield_")
+                    and isinstance(field_info, dict)
+                    and field_info.get("name")
+                ):
+                    self.id_to_name.setdefault(str(field_id), str(field_info["name"]))
+        for field in field_metadata or ():
+            if isinstance(field, dict) and field.get("id") and field.get("name"):
+                self.id_to_name.setdefault(str(field["id"]), str(field["name"]))
+
+        self._name_to_id: dict[str, str] = {}
+        for field_id, field_name in self.id_to_name.items():
+            self._name_to_id.setdefault(field_name.lower(), field_id)
+
+        self._pattern_cache: dict[tuple[str, ...], str | None] = {}
+        self._projection_cache: dict[frozenset[str], frozenset[str]] = {}
+
+    @classmethod
+    def from_api_response(
+        cls,
+        data: dict[str, Any],
+        field_metadata: Iterable[dict[str, Any]] | None = None,
+    ) -> "JiraFieldContext":
+        """
+        Build a context from an issue or search response.
+
+        Args:
+            data: The issue or search response from the Jira API
+            field_metadata: Optional field definitions from the field API
+
+        Returns:
+            A JiraFieldContext instance
+        """
+        if not isinstance(data, dict):
+            return cls(field_metadata=field_metadata)
+
+        names = data.get("names")
+        schema_fields = None
+        fields = data.get("fields")
+        if isinstance(fields, dict):
+            # Some responses carry the metadata inside the fields dictionary
+            fields_names = fields.get("names")
+            if isinstance(fields_names, dict):
+                names = (
+                    {**fields_names, **names}
+                    if isinstance(names, dict)
+                    else fields_names
+                )
+            schema = fields.get("schema")
+            if isinstance(schema, dict):
+                schema_fields = schema.get("fields")
+
+        return cls(
+            names=names, field_metadata=field_metadata, schema_fields=schema_fields
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, JiraFieldContext):
+            return NotImplemented
+        return self.id_to_name == other.id_to_name
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def get_name(self, field_id: str) -> str | None:
+        """
+        Get the display name of a field.
+
+        Args:
+            field_id: The field ID (e.g. 'customfield_10010')
+
+        Returns:
+            The display name or None if unknown
+        """
+        return self.id_to_name.get(field_id)
+
+    def resolve_field_id(self, field_id_or_name: str) -> str | None:
+        """
+        Resolve a field ID, 'cf_' short ID or display name to a field ID.
+
+        Args:
+            field_id_or_name: The identifier to resolve (names are case-insensitive)
+
+        Returns:
+            The field ID or None if it cannot be resolved
+        """
+        if field_id_or_name.startswith("customfield_"):
+            return field_id_or_name
+        field_id = self._name_to_id.get(field_id_or_name.lower())
+        if field_id:
+            return field_id
+        if field_id_or_name.startswith("cf_"):
+            return "customfield_" + field_id_or_name[3:]
+        return None
+
+    def find_field_id(self, name_patterns: Iterable[str]) -> str | None:
+        """
+        Find the first field whose name contains one of the patterns.
+
+        Matching ignores case, spaces, dashes and underscores.
+
+        Args:
+            name_patterns: Field name patterns to search for
+
+        Returns:
+            The matching field ID or None if no known name matches
+        """
+        key = tuple(name_patterns)
+        if key in self._pattern_cache:
+            return self._pattern_cache[key]
+
+        normalized_patterns = [_normalize_field_name(p) for p in key]
+        field_id = next(
+            (
+                candidate_id
+                for candidate_id, field_name in self.id_to_name.items()
+                if any(
+                    pattern in _normalize_field_name(field_name)
+                    for pattern in normalized_patterns
+                )
+            ),
+            None,
+        )
+        self._pattern_cache[key] = field_id
+        return field_id
+
+    def requested_field_ids(self, requested_fields: Iterable[str]) -> frozenset[str]:
+        """
+        Get the custom field IDs selected by a field projection.
+
+        Args:
+            requested_fields: Requested field IDs, 'cf_' short IDs or names
+
+        Returns:
+            The set of custom field IDs the projection refers to
+        """
+        key = frozenset(requested_fields)
+        cached = self._projection_cache.get(key)
+        if cached is not None:
+            return cached
+
+        requested_lower = {field.lower() for field in key}
+        field_ids = {field for field in key if field.startswith("customfield_")}
+        field_ids.update(
+            "customfield_" + field[3:] for field in key if field.startswith("cf_")
+        )
+        field_ids.update(
+            field_id
+            for field_id, field_name in self.id_to_name.items()
+            if field_name.lower() in requested_lower
+        )
+        result = frozenset(field_ids)
+        self._projection_cache[key] = result
+        return result
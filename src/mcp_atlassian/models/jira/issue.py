@@ -8,7 +8,7 @@ import logging
 import re
 from typing import Any, Literal
 
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 
 from ..base import ApiModel, TimestampMixin
 from ..constants import (
@@ -27,6 +27,7 @@ from .common import (
     JiraTimetracking,
     JiraUser,
 )
+from .field_context import JiraFieldContext
 from .link import JiraIssueLink
 from .project import JiraProject
 
@@ -88,34 +89,64 @@ class JiraIssue(ApiModel, TimestampMixin):
     worklog: dict | None = None
     changelogs: list[JiraChangelog] = Field(default_factory=list)
     issuelinks: list[JiraIssueLink] = Field(default_factory=list)
+    _field_context: JiraFieldContext | None = PrivateAttr(default=None)
 
-    def __getattribute__(self, name: str) -> Any:
+    def __getattr__(self, name: str) -> Any:
         """
-        Custom attribute access to handle custom field access.
+        Fallback attribute access for custom fields.
 
-        This allows accessing custom fields by their name as if they were
+        Python only calls this after normal attribute lookup has failed, so
+        regular field access (including pydantic internals) pays no extra cost.
+        This allows accessing custom fields by their ID as if they were
         regular attributes of the JiraIssue class.
 
         Args:
             name: The attribute name to access
 
         Returns:
-            The attribute value or custom field value
+            The custom field value
+
+        Raises:
+            AttributeError: If the name is neither an attribute nor a custom field
         """
-        # First try to get the attribute normally
         try:
-            return super().__getattribute__(name)
+            return super().__getattr__(name)  # type: ignore[misc]
         except AttributeError:
-            # If the attribute doesn't exist, check if it's a custom field
-            try:
-                custom_fields = super().__getattribute__("custom_fields")
-                if name in custom_fields:
-                    return custom_fields[name]
-            except AttributeError:
-                pass
-            # Re-raise the original AttributeError
+            custom_fields = self.__dict__.get("custom_fields")
+            if custom_fields and name in custom_fields:
+                return custom_fields[name]
             raise
 
+    def get_custom_field(self, field_id_or_name: str, default: Any = None) -> Any:
+        """
+        Get a stored custom field by its ID, 'cf_' short ID or display name.
+
+        Args:
+            field_id_or_name: A field ID (e.g. 'customfield_10010'), a short ID
+                (e.g. 'cf_10010') or the field's display name (case-insensitive)
+            default: Value returned when the field is not present
+
+        Returns:
+            The stored custom field object ({'value': ..., 'name': ...}) or default
+        """
+        if field_id_or_name in self.custom_fields:
+            return self.custom_fields[field_id_or_name]
+
+        if field_id_or_name.startswith("cf_"):
+            full_id = "customfield_" + field_id_or_name[3:]
+            if full_id in self.custom_fields:
+                return self.custom_fields[full_id]
+
+        name_lower = field_id_or_name.lower()
+        for field_data in self.custom_fields.values():
+            if (
+                isinstance(field_data, dict)
+                and str(field_data.get("name", "")).lower() == name_lower
+            ):
+                return field_data
+
+        return default
+
     @property
     def page_content(self) -> str | None:
         """
@@ -239,6 +270,32 @@ class JiraIssue(ApiModel, TimestampMixin):
 
         return None
 
+    @classmethod
+    def _find_custom_field_with_context(
+        cls,
+        fields: dict[str, Any],
+        field_context: JiraFieldContext,
+        name_patterns: tuple[str, ...],
+    ) -> Any:
+        """
+        Find a custom field value, resolving its ID through the field context.
+
+        Falls back to scanning the raw fields when the context does not know
+        a field matching the patterns.
+
+        Args:
+            fields: The fields dictionary from the Jira API
+            field_context: The field resolution context for the response
+            name_patterns: Field name patterns to search for
+
+        Returns:
+            The custom field value or None
+        """
+        field_id = field_context.find_field_id(name_patterns)
+        if field_id is not None:
+            return fields.get(field_id)
+        return cls._find_custom_field_in_api_response(fields, list(name_patterns))
+
     @classmethod
     def from_api_response(cls, data: dict[str, Any], **kwargs: Any) -> "JiraIssue":
         """
@@ -246,7 +303,9 @@ class JiraIssue(ApiModel, TimestampMixin):
 
         Args:
             data: The issue data from the Jira API
-            **kwargs: Additional arguments to pass to the constructor
+            **kwargs: Additional arguments to pass to the constructor. Pass
+                ``field_context`` to share one JiraFieldContext across a
+                result set.
 
         Returns:
             A JiraIssue instance
@@ -263,6 +322,31 @@ class JiraIssue(ApiModel, TimestampMixin):
         if not isinstance(fields, dict):
             fields = {}
 
+        # Handle requested_fields parameter
+        requested_fields_param = kwargs.get("requested_fields")
+
+        # Convert string requested_fields to list (except "*all")
+        if isinstance(requested_fields_param, str) and requested_fields_param != "*all":
+            requested_fields_param = requested_fields_param.split(",")
+            # Strip whitespace from each field name
+            requested_fields_param = [field.strip() for field in requested_fields_param]
+
+        # Only build the expensive structures that to_simplified_dict will emit.
+        # Mirrors should_include_field there: no projection means everything.
+        projection = (
+            set(requested_fields_param)
+            if isinstance(requested_fields_param, list)
+            else None
+        )
+
+        def is_requested(field_name: str) -> bool:
+            return projection is None or field_name in projection
+
+        # Shared by all issues of a search result; built here for single issues
+        field_context = kwargs.get("field_context")
+        if field_context is None:
+            field_context = JiraFieldContext.from_api_response(data)
+
         # Get required simple fields
         issue_id = str(data.get("id", JIRA_DEFAULT_ID))
         key = str(data.get("key", JIRA_DEFAULT_KEY))
@@ -367,7 +451,7 @@ class JiraIssue(ApiModel, TimestampMixin):
 
         # Handling comments
         comments = []
-        comments_field = fields.get("comment", {})
+        comments_field = fields.get("comment", {}) if is_requested("comment") else {}
         if isinstance(comments_field, dict) and "comments" in comments_field:
             comments_data = comments_field["comments"]
             if isinstance(comments_data, list):
@@ -388,7 +472,9 @@ class JiraIssue(ApiModel, TimestampMixin):
 
         # Handling attachments
         attachments = []
-        attachments_data = fields.get("attachment", [])
+        attachments_data = (
+            fields.get("attachment", []) if is_requested("attachment") else []
+        )
         if isinstance(attachments_data, list):
             attachments = [
                 JiraAttachment.from_api_response(attachment)
@@ -410,39 +496,40 @@ class JiraIssue(ApiModel, TimestampMixin):
         epic_name = None
 
         # Check for "Epic Link" field
-        epic_link = cls._find_custom_field_in_api_response(
-            fields, ["epic link", "parent epic"]
-        )
-        if isinstance(epic_link, str):
-            epic_key = epic_link
+        if is_requested("epic_key"):
+            epic_link = cls._find_custom_field_with_context(
+                fields, field_context, ("epic link", "parent epic")
+            )
+            if isinstance(epic_link, str):
+                epic_key = epic_link
 
         # Check for "Epic Name" field
-        epic_name_value = cls._find_custom_field_in_api_response(fields, ["epic name"])
-        if isinstance(epic_name_value, str):
-            epic_name = epic_name_value
+        if is_requested("epic_name"):
+            epic_name_value = cls._find_custom_field_with_context(
+                fields, field_context, ("epic name",)
+            )
+            if isinstance(epic_name_value, str):
+                epic_name = epic_name_value
 
-        # Store custom fields
+        # Store custom fields (only the requested ones under a projection)
         custom_fields = {}
-        fields_name_map = data.get("names", {})
+        requested_ids = (
+            field_context.requested_field_ids(projection)
+            if projection is not None
+            else None
+        )
         for orig_field_id, orig_field_value in fields.items():
             if orig_field_id.startswith("customfield_"):
+                if requested_ids is not None and orig_field_id not in requested_ids:
+                    continue
                 value_obj_to_store = {"value": orig_field_value}
-                human_readable_name = fields_name_map.get(orig_field_id)
+                human_readable_name = field_context.get_name(orig_field_id)
                 if human_readable_name:
                     value_obj_to_store["name"] = human_readable_name
                 custom_fields[orig_field_id] = value_obj_to_store
 
-        # Handle requested_fields parameter
-        requested_fields_param = kwargs.get("requested_fields")
-
-        # Convert string requested_fields to list (except "*all")
-        if isinstance(requested_fields_param, str) and requested_fields_param != "*all":
-            requested_fields_param = requested_fields_param.split(",")
-            # Strip whitespace from each field name
-            requested_fields_param = [field.strip() for field in requested_fields_param]
-
         # Create the issue instance with all the extracted data
-        return cls(
+        issue = cls(
             id=issue_id,
             key=key,
             summary=summary,
@@ -474,8 +561,12 @@ class JiraIssue(ApiModel, TimestampMixin):
             custom_fields=custom_fields,
             requested_fields=requested_fields_param,
             changelogs=changelogs,
-            issuelinks=cls._extract_issue_links(fields),
+            issuelinks=(
+                cls._extract_issue_links(fields) if is_requested("issuelinks") else []
+            ),
         )
+        issue._field_context = field_context
+        return issue
 
     def to_simplified_dict(self) -> dict[str, Any]:
         """Convert to simplified dictionary for API response."""
@@ -621,51 +712,26 @@ class JiraIssue(ApiModel, TimestampMixin):
                         output_value_obj["name"] = field_data_obj["name"]
                     result[internal_id] = output_value_obj
             elif isinstance(self.requested_fields, list):
+                field_context = self._field_context or JiraFieldContext(
+                    names={
+                        field_id: field_data_obj.get("name")
+                        for field_id, field_data_obj in self.custom_fields.items()
+                        if isinstance(field_data_obj, dict)
+                    }
+                )
                 for requested_key_or_name in self.requested_fields:
-                    found_by_id_or_name = False
-                    if (
-                        requested_key_or_name.startswith("customfield_")
-                        and requested_key_or_name in self.custom_fields
-                    ):
-                        field_data_obj = self.custom_fields[requested_key_or_name]
-                        output_value_obj = {
-                            "value": self._process_custom_field_value(
-                                field_data_obj.get("value")
-                            )
-                        }
-                        if "name" in field_data_obj:
-                            output_value_obj["name"] = field_data_obj["name"]
-                        result[requested_key_or_name] = output_value_obj
-                        found_by_id_or_name = True
-                    else:
-                        for internal_id, field_data_obj in self.custom_fields.items():
-                            if (
-                                field_data_obj.get("name", "").lower()
-                                == requested_key_or_name.lower()
-                            ):
-                                output_value_obj = {
-                                    "value": self._process_custom_field_value(
-                                        field_data_obj.get("value")
-                                    )
-                                }
-                                output_value_obj["name"] = field_data_obj["name"]
-                                result[internal_id] = output_value_obj
-                                found_by_id_or_name = True
-                                break
-                    if not found_by_id_or_name and requested_key_or_name.startswith(
-                        "cf_"
-                    ):
-                        full_id = "customfield_" + requested_key_or_name[3:]
-                        if full_id in self.custom_fields:
-                            field_data_obj = self.custom_fields[full_id]
-                            output_value_obj = {
-                                "value": self._process_custom_field_value(
-                                    field_data_obj.get("value")
-                                )
-                            }
-                            if "name" in field_data_obj:
-                                output_value_obj["name"] = field_data_obj["name"]
-                            result[full_id] = output_value_obj
+                    field_id = field_context.resolve_field_id(requested_key_or_name)
+                    if field_id is None or field_id not in self.custom_fields:
+                        continue
+                    field_data_obj = self.custom_fields[field_id]
+                    output_value_obj = {
+                        "value": self._process_custom_field_value(
+                            field_data_obj.get("value")
+                        )
+                    }
+                    if "name" in field_data_obj:
+                        output_value_obj["name"] = field_data_obj["name"]
+                    result[field_id] = output_value_obj
 
         return {k: v for k, v in result.items() if v is not None}
 
@@ -10,6 +10,7 @@ from typing import Any
 from pydantic import Field, model_validator
 
 from ..base import ApiModel
+from .field_context import JiraFieldContext
 from .issue import JiraIssue
 
 logger = logging.getLogger(__name__)
@@ -34,7 +35,9 @@ class JiraSearchResult(ApiModel):
 
         Args:
             data: The search result data from the Jira API
-            **kwargs: Additional arguments to pass to the constructor
+            **kwargs: Additional arguments to pass to the constructor. Accepts
+                ``requested_fields``, ``field_context`` and ``field_metadata``
+                (field definitions used to resolve custom field names).
 
         Returns:
             A JiraSearchResult instance
@@ -46,15 +49,24 @@ class JiraSearchResult(ApiModel):
             logger.debug("Received non-dictionary data, returning default instance")
             return cls()
 
+        # Resolve custom field names once for the whole result set
+        field_context = kwargs.get("field_context")
+        if field_context is None:
+            field_context = JiraFieldContext.from_api_response(
+                data, field_metadata=kwargs.get("field_metadata")
+            )
+
         issues = []
         issues_data = data.get("issues", [])
         if isinstance(issues_data, list):
+            requested_fields = kwargs.get("requested_fields")
             for issue_data in issues_data:
                 if issue_data:
-                    requested_fields = kwargs.get("requested_fields")
                     issues.append(
                         JiraIssue.from_api_response(
-                            issue_data, requested_fields=requested_fields
+                            issue_data,
+                            requested_fields=requested_fields,
+                            field_context=field_context,
                         )
                     )
 
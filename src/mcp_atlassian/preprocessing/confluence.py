@@ -13,6 +13,7 @@ from md2conf.converter import (
     markdown_to_html,
 )
 
+from ..utils.tracing import instrument_methods
 from .base import BasePreprocessor
 
 logger = logging.getLogger("mcp-atlassian")
@@ -94,3 +95,6 @@ class ConfluencePreprocessor(BasePreprocessor):
             return str(storage_format)
 
     # Confluence-specific methods can be added here
+
+
+instrument_methods(ConfluencePreprocessor, "confluence.preprocessing")
@@ -4,6 +4,7 @@ import logging
 import re
 from typing import Any
 
+from ..utils.tracing import instrument_methods
 from .base import BasePreprocessor
 
 logger = logging.getLogger("mcp-atlassian")
@@ -401,3 +402,6 @@ class JiraPreprocessor(BasePreprocessor):
         prefix = "1." if last_char == "#" else "-"
 
         return f"{indent}{prefix} {content}"
+
+
+instrument_methods(JiraPreprocessor, "jira.preprocessing")
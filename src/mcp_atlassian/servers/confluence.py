@@ -1,17 +1,23 @@
 """Confluence FastMCP server instance and tool definitions."""
 
-import json
 import logging
 from typing import Annotated
 
 from fastmcp import Context, FastMCP
 from pydantic import BeforeValidator, Field
 
+from mcp_atlassian.confluence.constants import BUDGETED_PAGE_FIELDS
 from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError
 from mcp_atlassian.servers.dependencies import get_confluence_fetcher
+from mcp_atlassian.utils.budget import (
+    MIN_RESPONSE_CHARS,
+    apply_response_budget,
+    get_continuation_chunk,
+)
 from mcp_atlassian.utils.decorators import (
     check_write_access,
 )
+from mcp_atlassian.utils.serialization import dumps_response
 
 logger = logging.getLogger(__name__)
 
@@ -107,7 +113,7 @@ async def search(
             query, limit=limit, spaces_filter=spaces_filter
         )
     search_results = [page.to_simplified_dict() for page in pages]
-    return json.dumps(search_results, indent=2, ensure_ascii=False)
+    return dumps_response(search_results)
 
 
 @confluence_mcp.tool(tags={"confluence", "read"})
@@ -161,6 +167,30 @@ async def get_page(
             default=True,
         ),
     ] = True,
+    max_response_chars: Annotated[
+        int | None,
+        Field(
+            description=(
+                "(Optional) Approximate maximum size of the response in characters "
+                "(roughly 4 characters per token). Page metadata is always returned; "
+                "the page body and other long fields are truncated and listed under "
+                "'truncated_fields' with a 'next_cursor'."
+            ),
+            default=None,
+            ge=MIN_RESPONSE_CHARS,
+        ),
+    ] = None,
+    continuation_cursor: Annotated[
+        str | None,
+        Field(
+            description=(
+                "(Optional) A 'next_cursor' value from a previous truncated response "
+                "(e.g., 'metadata.content.value:8000'). Returns only the next chunk of "
+                "that field, sized by max_response_chars."
+            ),
+            default=None,
+        ),
+    ] = None,
 ) -> str:
     """Get content of a specific Confluence page by its ID, or by its title and space key.
 
@@ -171,6 +201,8 @@ async def get_page(
         space_key: The key of the space. Must be used with 'title'.
         include_metadata: Whether to include page metadata.
         convert_to_markdown: Convert content to markdown (true) or keep raw HTML (false).
+        max_response_chars: Approximate response size budget in characters.
+        continuation_cursor: Cursor of a truncated field to continue.
 
     Returns:
         JSON string representing the page content and/or metadata, or an error if not found or parameters are invalid.
@@ -189,22 +221,18 @@ async def get_page(
             )
         except Exception as e:
             logger.error(f"Error fetching page by ID '{page_id}': {e}")
-            return json.dumps(
-                {"error": f"Failed to retrieve page by ID '{page_id}': {e}"},
-                indent=2,
-                ensure_ascii=False,
+            return dumps_response(
+                {"error": f"Failed to retrieve page by ID '{page_id}': {e}"}
             )
     elif title and space_key:
         page_object = confluence_fetcher.get_page_by_title(
             space_key, title, convert_to_markdown=convert_to_markdown
         )
         if not page_object:
-            return json.dumps(
+            return dumps_response(
                 {
                     "error": f"Page with title '{title}' not found in space '{space_key}'."
-                },
-                indent=2,
-                ensure_ascii=False,
+                }
             )
     else:
         raise ValueError(
@@ -212,18 +240,24 @@ async def get_page(
         )
 
     if not page_object:
-        return json.dumps(
-            {"error": "Page not found with the provided identifiers."},
-            indent=2,
-            ensure_ascii=False,
+        return dumps_response(
+            {"error": "Page not found with the provided identifiers."}
         )
 
     if include_metadata:
         result = {"metadata": page_object.to_simplified_dict()}
+        budget_fields = tuple(f"metadata.{f}" for f in BUDGETED_PAGE_FIELDS)
     else:
         result = {"content": {"value": page_object.content}}
+        budget_fields = ("content.value",)
 
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    if continuation_cursor:
+        chunk = get_continuation_chunk(
+            result, continuation_cursor, max_response_chars, budget_fields
+        )
+        return dumps_response({"page_id": page_object.id, **chunk})
+    result = apply_response_budget(result, max_response_chars, budget_fields)
+    return dumps_response(result)
 
 
 @confluence_mcp.tool(tags={"confluence", "read"})
@@ -311,7 +345,7 @@ async def get_page_children(
         )
         result = {"error": f"Failed to get child pages: {e}"}
 
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return dumps_response(result)
 
 
 @confluence_mcp.tool(tags={"confluence", "read"})
@@ -340,7 +374,7 @@ async def get_comments(
     confluence_fetcher = await get_confluence_fetcher(ctx)
     comments = confluence_fetcher.get_page_comments(page_id)
     formatted_comments = [comment.to_simplified_dict() for comment in comments]
-    return json.dumps(formatted_comments, indent=2, ensure_ascii=False)
+    return dumps_response(formatted_comments)
 
 
 @confluence_mcp.tool(tags={"confluence", "read"})
@@ -348,11 +382,15 @@ async def download_attachments(
     ctx: Context,
     page_id: Annotated[
         str,
-        Field(description="The ID of the Confluence page whose attachments you want to download")
+        Field(
+            description="The ID of the Confluence page whose attachments you want to download"
+        ),
     ],
     target_dir: Annotated[
         str,
-        Field(description="Directory where attachments should be saved (will be created if it doesn't exist)")
+        Field(
+            description="Directory where attachments should be saved (will be created if it doesn't exist)"
+        ),
     ],
 ) -> str:
     """Download all attachments for a Confluence page to a local directory.
@@ -366,8 +404,11 @@ async def download_attachments(
         JSON string indicating the result of the download operation.
     """
     confluence_fetcher = await get_confluence_fetcher(ctx)
-    result = confluence_fetcher.download_page_attachments(page_id=page_id, target_dir=target_dir)
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    result = confluence_fetcher.download_page_attachments(
+        page_id=page_id, target_dir=target_dir
+    )
+    return dumps_response(result)
+
 
 @confluence_mcp.tool(tags={"confluence", "read"})
 async def get_labels(
@@ -395,7 +436,7 @@ async def get_labels(
     confluence_fetcher = await get_confluence_fetcher(ctx)
     labels = confluence_fetcher.get_page_labels(page_id)
     formatted_labels = [label.to_simplified_dict() for label in labels]
-    return json.dumps(formatted_labels, indent=2, ensure_ascii=False)
+    return dumps_response(formatted_labels)
 
 
 @confluence_mcp.tool(tags={"confluence", "write"})
@@ -421,7 +462,7 @@ async def add_label(
     confluence_fetcher = await get_confluence_fetcher(ctx)
     labels = confluence_fetcher.add_page_label(page_id, name)
     formatted_labels = [label.to_simplified_dict() for label in labels]
-    return json.dumps(formatted_labels, indent=2, ensure_ascii=False)
+    return dumps_response(formatted_labels)
 
 
 @confluence_mcp.tool(tags={"confluence", "write"})
@@ -509,11 +550,7 @@ async def create_page(
         content_representation=content_representation,
     )
     result = page.to_simplified_dict()
-    return json.dumps(
-        {"message": "Page created successfully", "page": result},
-        indent=2,
-        ensure_ascii=False,
-    )
+    return dumps_response({"message": "Page created successfully", "page": result})
 
 
 @confluence_mcp.tool(tags={"confluence", "write"})
@@ -603,11 +640,7 @@ async def update_page(
         content_representation=content_representation,
     )
     page_data = updated_page.to_simplified_dict()
-    return json.dumps(
-        {"message": "Page updated successfully", "page": page_data},
-        indent=2,
-        ensure_ascii=False,
-    )
+    return dumps_response({"message": "Page updated successfully", "page": page_data})
 
 
 @confluence_mcp.tool(tags={"confluence", "write"})
@@ -649,7 +682,7 @@ async def delete_page(
             "error": str(e),
         }
 
-    return json.dumps(response, indent=2, ensure_ascii=False)
+    return dumps_response(response)
 
 
 @confluence_mcp.tool(tags={"confluence", "write"})
@@ -699,7 +732,7 @@ async def add_comment(
             "error": str(e),
         }
 
-    return json.dumps(response, indent=2, ensure_ascii=False)
+    return dumps_response(response)
 
 
 @confluence_mcp.tool(tags={"confluence", "read"})
@@ -750,23 +783,19 @@ async def search_user(
     try:
         user_results = confluence_fetcher.search_user(query, limit=limit)
         search_results = [user.to_simplified_dict() for user in user_results]
-        return json.dumps(search_results, indent=2, ensure_ascii=False)
+        return dumps_response(search_results)
     except MCPAtlassianAuthenticationError as e:
         logger.error(f"Authentication error during user search: {e}", exc_info=False)
-        return json.dumps(
+        return dumps_response(
             {
                 "error": "Authentication failed. Please check your credentials.",
                 "details": str(e),
-            },
-            indent=2,
-            ensure_ascii=False,
+            }
         )
     except Exception as e:
         logger.error(f"Error searching users: {str(e)}")
-        return json.dumps(
+        return dumps_response(
             {
                 "error": f"An unexpected error occurred while searching for users: {str(e)}"
-            },
-            indent=2,
-            ensure_ascii=False,
+            }
         )
@@ -2,17 +2,27 @@
 
 import json
 import logging
-from typing import Annotated, Any
+from typing import Annotated, Any, Literal
 
 from fastmcp import Context, FastMCP
 from pydantic import Field
 from requests.exceptions import HTTPError
 
 from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError
-from mcp_atlassian.jira.constants import DEFAULT_READ_JIRA_FIELDS
+from mcp_atlassian.jira.constants import (
+    AGILE_MAX_RESULTS,
+    BUDGETED_ISSUE_FIELDS,
+    DEFAULT_READ_JIRA_FIELDS,
+)
 from mcp_atlassian.models.jira.common import JiraUser
 from mcp_atlassian.servers.dependencies import get_jira_fetcher
+from mcp_atlassian.utils.budget import (
+    MIN_RESPONSE_CHARS,
+    apply_response_budget,
+    get_continuation_chunk,
+)
 from mcp_atlassian.utils.decorators import check_write_access
+from mcp_atlassian.utils.serialization import dumps_response
 
 logger = logging.getLogger(__name__)
 
@@ -77,7 +87,7 @@ async def get_user_profile(
             f"get_user_profile failed for '{user_identifier}': {error_message}",
         )
         response_data = error_result
-    return json.dumps(response_data, indent=2, ensure_ascii=False)
+    return dumps_response(response_data)
 
 
 @jira_mcp.tool(tags={"jira", "read"})
@@ -128,6 +138,30 @@ async def get_issue(
             default=True,
         ),
     ] = True,
+    max_response_chars: Annotated[
+        int | None,
+        Field(
+            description=(
+                "(Optional) Approximate maximum size of the response in characters "
+                "(roughly 4 characters per token). Metadata is always returned; long "
+                "fields (description, comments, links, ...) are truncated and listed "
+                "under 'truncated_fields' with a 'next_cursor'."
+            ),
+            default=None,
+            ge=MIN_RESPONSE_CHARS,
+        ),
+    ] = None,
+    continuation_cursor: Annotated[
+        str | None,
+        Field(
+            description=(
+                "(Optional) A 'next_cursor' value from a previous truncated response "
+                "(e.g., 'description:4000'). Returns only the next chunk of that field, "
+                "sized by max_response_chars."
+            ),
+            default=None,
+        ),
+    ] = None,
 ) -> str:
     """Get details of a specific Jira issue including its Epic links and relationship information.
 
@@ -139,6 +173,8 @@ async def get_issue(
         comment_limit: Maximum number of comments.
         properties: Issue properties to return.
         update_history: Whether to update issue view history.
+        max_response_chars: Approximate response size budget in characters.
+        continuation_cursor: Cursor of a truncated field to continue.
 
     Returns:
         JSON string representing the Jira issue object.
@@ -160,7 +196,13 @@ async def get_issue(
         update_history=update_history,
     )
     result = issue.to_simplified_dict()
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    if continuation_cursor:
+        chunk = get_continuation_chunk(
+            result, continuation_cursor, max_response_chars, BUDGETED_ISSUE_FIELDS
+        )
+        return dumps_response({"key": result.get("key"), **chunk})
+    result = apply_response_budget(result, max_response_chars, BUDGETED_ISSUE_FIELDS)
+    return dumps_response(result)
 
 
 @jira_mcp.tool(tags={"jira", "read"})
@@ -247,7 +289,7 @@ async def search(
         projects_filter=projects_filter,
     )
     result = search_result.to_simplified_dict()
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return dumps_response(result)
 
 
 @jira_mcp.tool(tags={"jira", "read"})
@@ -281,7 +323,7 @@ async def search_fields(
     """
     jira = await get_jira_fetcher(ctx)
     result = jira.search_fields(keyword, limit=limit, refresh=refresh)
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return dumps_response(result)
 
 
 @jira_mcp.tool(tags={"jira", "read"})
@@ -313,7 +355,7 @@ async def get_project_issues(
         project_key=project_key, start=start_at, limit=limit
     )
     result = search_result.to_simplified_dict()
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return dumps_response(result)
 
 
 @jira_mcp.tool(tags={"jira", "read"})
@@ -333,27 +375,150 @@ async def get_transitions(
     jira = await get_jira_fetcher(ctx)
     # Underlying method returns list[dict] in the desired format
     transitions = jira.get_available_transitions(issue_key)
-    return json.dumps(transitions, indent=2, ensure_ascii=False)
+    return dumps_response(transitions)
 
 
 @jira_mcp.tool(tags={"jira", "read"})
 async def get_worklog(
     ctx: Context,
     issue_key: Annotated[str, Field(description="Jira issue key (e.g., 'PROJ-123')")],
+    started_after: Annotated[
+        str | None,
+        Field(
+            description=(
+                "(Optional) Only include worklogs started on or after this "
+                "date or date-time (e.g., '2024-01-01' or "
+                "'2024-01-01T09:00:00.000+0000')"
+            ),
+            default=None,
+        ),
+    ] = None,
+    aggregate: Annotated[
+        bool,
+        Field(
+            description=(
+                "(Optional) Return the seconds logged per author and day "
+                "instead of the individual worklog entries"
+            ),
+            default=False,
+        ),
+    ] = False,
 ) -> str:
     """Get worklog entries for a Jira issue.
 
     Args:
         ctx: The FastMCP context.
         issue_key: Jira issue key.
+        started_after: Optional lower bound for the worklog start time.
+        aggregate: Whether to return totals instead of the entries.
 
     Returns:
-        JSON string representing the worklog entries.
+        JSON string representing the worklog entries or their totals.
     """
     jira = await get_jira_fetcher(ctx)
-    worklogs = jira.get_worklogs(issue_key)
+    if aggregate:
+        return dumps_response(
+            jira.aggregate_worklogs(issue_key, started_after=started_after)
+        )
+    worklogs = jira.get_worklogs(issue_key, started_after=started_after)
     result = {"worklogs": worklogs}
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return dumps_response(result)
+
+
+@jira_mcp.tool(tags={"jira", "read"})
+async def get_worklog_report(
+    ctx: Context,
+    jql: Annotated[
+        str,
+        Field(
+            description=(
+                "JQL query selecting the issues to report on "
+                "(e.g., 'project = PROJ', 'sprint = 42')"
+            )
+        ),
+    ],
+    start_date: Annotated[
+        str | None,
+        Field(
+            description="(Optional) First day to include (YYYY-MM-DD)",
+            default=None,
+        ),
+    ] = None,
+    end_date: Annotated[
+        str | None,
+        Field(
+            description="(Optional) Last day to include (YYYY-MM-DD)",
+            default=None,
+        ),
+    ] = None,
+    limit: Annotated[
+        int,
+        Field(
+            description="Maximum number of issues to include (1-5000)",
+            default=1000,
+            ge=1,
+            le=5000,
+        ),
+    ] = 1000,
+) -> str:
+    """Report the time logged on all issues matching a JQL query.
+
+    Args:
+        ctx: The FastMCP context.
+        jql: JQL query selecting the issues.
+        start_date: Optional first day to include.
+        end_date: Optional last day to include.
+        limit: Maximum number of issues to include.
+
+    Returns:
+        JSON string with the totals and a columnar table of seconds logged
+        per author, issue and day.
+    """
+    jira = await get_jira_fetcher(ctx)
+    report = jira.get_worklog_report(
+        jql, start_date=start_date, end_date=end_date, max_issues=limit
+    )
+    return dumps_response(report)
+
+
+@jira_mcp.tool(tags={"jira", "read"})
+async def get_cycle_time_report(
+    ctx: Context,
+    jql: Annotated[
+        str,
+        Field(
+            description=(
+                "JQL query selecting the issues to analyse "
+                "(e.g., 'project = PROJ AND resolved >= -30d')"
+            )
+        ),
+    ],
+    limit: Annotated[
+        int,
+        Field(
+            description="Maximum number of issues to include (1-10000)",
+            default=1000,
+            ge=1,
+            le=10000,
+        ),
+    ] = 1000,
+) -> str:
+    """Get status dwell time, cycle time and lead time statistics for a JQL query.
+
+    Only summary statistics are returned, not the issue histories.
+
+    Args:
+        ctx: The FastMCP context.
+        jql: JQL query selecting the issues.
+        limit: Maximum number of issues to include.
+
+    Returns:
+        JSON string with the lead and cycle time percentiles and a columnar
+        table of dwell time percentiles per status, in hours.
+    """
+    jira = await get_jira_fetcher(ctx)
+    report = jira.get_cycle_time_report(jql, max_issues=limit)
+    return dumps_response(report)
 
 
 @jira_mcp.tool(tags={"jira", "read"})
@@ -376,7 +541,7 @@ async def download_attachments(
     """
     jira = await get_jira_fetcher(ctx)
     result = jira.download_issue_attachments(issue_key=issue_key, target_dir=target_dir)
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return dumps_response(result)
 
 
 @jira_mcp.tool(tags={"jira", "read"})
@@ -426,7 +591,7 @@ async def get_agile_boards(
         limit=limit,
     )
     result = [board.to_simplified_dict() for board in boards]
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return dumps_response(result)
 
 
 @jira_mcp.tool(tags={"jira", "read"})
@@ -465,7 +630,15 @@ async def get_board_issues(
     ] = 0,
     limit: Annotated[
         int,
-        Field(description="Maximum number of results (1-50)", default=10, ge=1, le=50),
+        Field(
+            description=(
+                f"Maximum number of results (1-{AGILE_MAX_RESULTS}). "
+                "Pages are fetched automatically up to this budget."
+            ),
+            default=10,
+            ge=1,
+            le=AGILE_MAX_RESULTS,
+        ),
     ] = 10,
     expand: Annotated[
         str,
@@ -503,7 +676,7 @@ async def get_board_issues(
         expand=expand,
     )
     result = search_result.to_simplified_dict()
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return dumps_response(result)
 
 
 @jira_mcp.tool(tags={"jira", "read"})
@@ -520,7 +693,15 @@ async def get_sprints_from_board(
     ] = 0,
     limit: Annotated[
         int,
-        Field(description="Maximum number of results (1-50)", default=10, ge=1, le=50),
+        Field(
+            description=(
+                f"Maximum number of results (1-{AGILE_MAX_RESULTS}). "
+                "Pages are fetched automatically up to this budget."
+            ),
+            default=10,
+            ge=1,
+            le=AGILE_MAX_RESULTS,
+        ),
     ] = 10,
 ) -> str:
     """Get jira sprints from board by state.
@@ -540,7 +721,7 @@ async def get_sprints_from_board(
         board_id=board_id, state=state, start=start_at, limit=limit
     )
     result = [sprint.to_simplified_dict() for sprint in sprints]
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return dumps_response(result)
 
 
 @jira_mcp.tool(tags={"jira", "read"})
@@ -564,7 +745,15 @@ async def get_sprint_issues(
     ] = 0,
     limit: Annotated[
         int,
-        Field(description="Maximum number of results (1-50)", default=10, ge=1, le=50),
+        Field(
+            description=(
+                f"Maximum number of results (1-{AGILE_MAX_RESULTS}). "
+                "Pages are fetched automatically up to this budget."
+            ),
+            default=10,
+            ge=1,
+            le=AGILE_MAX_RESULTS,
+        ),
     ] = 10,
 ) -> str:
     """Get jira issues from sprint.
@@ -588,7 +777,77 @@ async def get_sprint_issues(
         sprint_id=sprint_id, fields=fields_list, start=start_at, limit=limit
     )
     result = search_result.to_simplified_dict()
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return dumps_response(result)
+
+
+@jira_mcp.tool(tags={"jira", "read"})
+async def get_sprint_report(
+    ctx: Context,
+    sprint_id: Annotated[str, Field(description="The id of sprint (e.g., '10001')")],
+    estimate_field: Annotated[
+        str | None,
+        Field(
+            description=(
+                "(Optional) Name or ID of the estimate field (e.g., 'Story Points'). "
+                "Defaults to the story points field; issues are counted if there is none."
+            ),
+            default=None,
+        ),
+    ] = None,
+) -> str:
+    """Get velocity, burndown, carry-over and scope changes of a sprint.
+
+    Args:
+        ctx: The FastMCP context.
+        sprint_id: The ID of the sprint.
+        estimate_field: Optional name or ID of the estimate field.
+
+    Returns:
+        JSON string with the sprint summary, a columnar burndown series, the
+        carried over issues and the scope change events.
+    """
+    jira = await get_jira_fetcher(ctx)
+    report = jira.get_sprint_report(sprint_id, estimate_field=estimate_field)
+    return dumps_response(report)
+
+
+@jira_mcp.tool(tags={"jira", "read"})
+async def get_board_velocity(
+    ctx: Context,
+    board_id: Annotated[str, Field(description="The id of the board (e.g., '1001')")],
+    sprint_count: Annotated[
+        int,
+        Field(
+            description="Number of most recent closed sprints to include (1-20)",
+            default=5,
+            ge=1,
+            le=20,
+        ),
+    ] = 5,
+    estimate_field: Annotated[
+        str | None,
+        Field(
+            description="(Optional) Name or ID of the estimate field (e.g., 'Story Points')",
+            default=None,
+        ),
+    ] = None,
+) -> str:
+    """Get the committed and completed work of the last closed sprints of a board.
+
+    Args:
+        ctx: The FastMCP context.
+        board_id: The ID of the board.
+        sprint_count: Number of closed sprints to include.
+        estimate_field: Optional name or ID of the estimate field.
+
+    Returns:
+        JSON string with per-sprint columns and the average velocity.
+    """
+    jira = await get_jira_fetcher(ctx)
+    velocity = jira.get_board_velocity(
+        board_id, sprint_count=sprint_count, estimate_field=estimate_field
+    )
+    return dumps_response(velocity)
 
 
 @jira_mcp.tool(tags={"jira", "read"})
@@ -604,7 +863,7 @@ async def get_link_types(ctx: Context) -> str:
     jira = await get_jira_fetcher(ctx)
     link_types = jira.get_issue_link_types()
     formatted_link_types = [link_type.to_simplified_dict() for link_type in link_types]
-    return json.dumps(formatted_link_types, indent=2, ensure_ascii=False)
+    return dumps_response(formatted_link_types)
 
 
 @jira_mcp.tool(tags={"jira", "write"})
@@ -663,6 +922,16 @@ async def create_issue(
             default=None,
         ),
     ] = None,
+    response_mode: Annotated[
+        Literal["full", "narrow", "none"],
+        Field(
+            description=(
+                "(Optional) 'full' returns the created issue. 'narrow' returns "
+                "only the fields that were set, which avoids re-fetching the "
+                "whole issue. 'none' only returns the issue key and ID."
+            ),
+        ),
+    ] = "full",
 ) -> str:
     """Create a new Jira issue with optional Epic link or parent for subtasks.
 
@@ -675,6 +944,7 @@ async def create_issue(
         description: Issue description.
         components: Comma-separated list of component names.
         additional_fields: Dictionary of additional fields.
+        response_mode: How much of the created issue to return.
 
     Returns:
         JSON string representing the created issue object.
@@ -702,14 +972,11 @@ async def create_issue(
         description=description,
         assignee=assignee,
         components=components_list,
+        response_mode=response_mode,
         **extra_fields,
     )
     result = issue.to_simplified_dict()
-    return json.dumps(
-        {"message": "Issue created successfully", "issue": result},
-        indent=2,
-        ensure_ascii=False,
-    )
+    return dumps_response({"message": "Issue created successfully", "issue": result})
 
 
 @jira_mcp.tool(tags={"jira", "write"})
@@ -778,7 +1045,7 @@ async def batch_create_issues(
         "message": message,
         "issues": [issue.to_simplified_dict() for issue in created_issues],
     }
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return dumps_response(result)
 
 
 @jira_mcp.tool(tags={"jira", "read"})
@@ -803,14 +1070,13 @@ async def batch_get_changelogs(
             description=(
                 "Maximum number of changelogs to return in result for each issue. "
                 "Default to -1 for all changelogs. "
-                "Notice that it only limits the results in the response, "
-                "the function will still fetch all the data."
+                "Fetching stops as soon as every issue has reached the limit."
             ),
             default=-1,
         ),
     ] = -1,
 ) -> str:
-    """Get changelogs for multiple Jira issues (Cloud only).
+    """Get changelogs for multiple Jira issues.
 
     Args:
         ctx: The FastMCP context.
@@ -822,35 +1088,27 @@ async def batch_get_changelogs(
         JSON string representing a list of issues with their changelogs.
 
     Raises:
-        NotImplementedError: If run on Jira Server/Data Center.
         ValueError: If Jira client is unavailable.
     """
     jira = await get_jira_fetcher(ctx)
-    # Ensure this runs only on Cloud, as per original function docstring
-    if not jira.config.is_cloud:
-        raise NotImplementedError(
-            "Batch get issue changelogs is only available on Jira Cloud."
-        )
-
     # Call the underlying method
+    limit_val = None if limit == -1 else limit
     issues_with_changelogs = jira.batch_get_changelogs(
-        issue_ids_or_keys=issue_ids_or_keys, fields=fields
+        issue_ids_or_keys=issue_ids_or_keys, fields=fields, limit=limit_val
     )
 
     # Format the response
     results = []
-    limit_val = None if limit == -1 else limit
     for issue in issues_with_changelogs:
         results.append(
             {
                 "issue_id": issue.id,
                 "changelogs": [
-                    changelog.to_simplified_dict()
-                    for changelog in issue.changelogs[:limit_val]
+                    changelog.to_simplified_dict() for changelog in issue.changelogs
                 ],
             }
         )
-    return json.dumps(results, indent=2, ensure_ascii=False)
+    return dumps_response(results)
 
 
 @jira_mcp.tool(tags={"jira", "write"})
@@ -884,6 +1142,17 @@ async def update_issue(
             default=None,
         ),
     ] = None,
+    response_mode: Annotated[
+        Literal["full", "narrow", "none"],
+        Field(
+            description=(
+                "(Optional) 'full' returns the updated issue. 'narrow' returns "
+                "only the fields that were updated, which avoids re-fetching the "
+                "whole issue. 'none' only returns the issue key and the "
+                "attachment upload results."
+            ),
+        ),
+    ] = "full",
 ) -> str:
     """Update an existing Jira issue including changing status, adding Epic links, updating fields, etc.
 
@@ -893,6 +1162,7 @@ async def update_issue(
         fields: Dictionary of fields to update.
         additional_fields: Optional dictionary of additional fields.
         attachments: Optional JSON array string or comma-separated list of file paths.
+        response_mode: How much of the updated issue to return.
 
     Returns:
         JSON string representing the updated issue object and attachment results.
@@ -937,17 +1207,21 @@ async def update_issue(
         all_updates["attachments"] = attachment_paths
 
     try:
-        issue = jira.update_issue(issue_key=issue_key, **all_updates)
-        result = issue.to_simplified_dict()
+        issue = jira.update_issue(
+            issue_key=issue_key, response_mode=response_mode, **all_updates
+        )
+        if issue is None or response_mode == "none":
+            result = {"key": issue_key}
+        else:
+            result = issue.to_simplified_dict()
         if (
-            hasattr(issue, "custom_fields")
+            issue is not None
+            and hasattr(issue, "custom_fields")
             and "attachment_results" in issue.custom_fields
         ):
             result["attachment_results"] = issue.custom_fields["attachment_results"]
-        return json.dumps(
-            {"message": "Issue updated successfully", "issue": result},
-            indent=2,
-            ensure_ascii=False,
+        return dumps_response(
+            {"message": "Issue updated successfully", "issue": result}
         )
     except Exception as e:
         logger.error(f"Error updating issue {issue_key}: {str(e)}", exc_info=True)
@@ -976,7 +1250,7 @@ async def delete_issue(
     deleted = jira.delete_issue(issue_key)
     result = {"message": f"Issue {issue_key} has been deleted successfully."}
     # The underlying method raises on failure, so if we reach here, it's success.
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return dumps_response(result)
 
 
 @jira_mcp.tool(tags={"jira", "write"})
@@ -1002,7 +1276,7 @@ async def add_comment(
     jira = await get_jira_fetcher(ctx)
     # add_comment returns dict
     result = jira.add_comment(issue_key, comment)
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return dumps_response(result)
 
 
 @jira_mcp.tool(tags={"jira", "write"})
@@ -1069,7 +1343,7 @@ async def add_worklog(
         remaining_estimate=remaining_estimate,
     )
     result = {"message": "Worklog added successfully", "worklog": worklog_result}
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return dumps_response(result)
 
 
 @jira_mcp.tool(tags={"jira", "write"})
@@ -1102,7 +1376,7 @@ async def link_to_epic(
         "message": f"Issue {issue_key} has been linked to epic {epic_key}.",
         "issue": issue.to_simplified_dict(),
     }
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return dumps_response(result)
 
 
 @jira_mcp.tool(tags={"jira", "write"})
@@ -1170,7 +1444,7 @@ async def create_issue_link(
         link_data["comment"] = comment_obj
 
     result = jira.create_issue_link(link_data)
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return dumps_response(result)
 
 
 @jira_mcp.tool(tags={"jira", "write"})
@@ -1252,7 +1526,7 @@ async def create_remote_issue_link(
         link_data["relationship"] = relationship
 
     result = jira.create_remote_issue_link(issue_key, link_data)
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return dumps_response(result)
 
 
 @jira_mcp.tool(tags={"jira", "write"})
@@ -1278,7 +1552,7 @@ async def remove_issue_link(
         raise ValueError("link_id is required")
 
     result = jira.remove_issue_link(link_id)  # Returns dict on success
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return dumps_response(result)
 
 
 @jira_mcp.tool(tags={"jira", "write"})
@@ -1315,6 +1589,17 @@ async def transition_issue(
             ),
         ),
     ] = None,
+    response_mode: Annotated[
+        Literal["full", "narrow", "none"],
+        Field(
+            description=(
+                "(Optional) 'full' returns the updated issue. 'narrow' returns "
+                "only the status and the fields set during the transition. "
+                "'none' skips re-fetching the issue and only confirms the "
+                "transition, which is faster for bulk status changes."
+            ),
+        ),
+    ] = "full",
 ) -> str:
     """Transition a Jira issue to a new status.
 
@@ -1324,6 +1609,7 @@ async def transition_issue(
         transition_id: ID of the transition.
         fields: Optional dictionary of fields to update during transition.
         comment: Optional comment for the transition.
+        response_mode: How much of the updated issue to return ('full', 'narrow' or 'none').
 
     Returns:
         JSON string representing the updated issue object.
@@ -1345,13 +1631,14 @@ async def transition_issue(
         transition_id=transition_id,
         fields=update_fields,
         comment=comment,
+        response_mode=response_mode,
     )
 
     result = {
         "message": f"Issue {issue_key} transitioned successfully",
         "issue": issue.to_simplified_dict() if issue else None,
     }
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return dumps_response(result)
 
 
 @jira_mcp.tool(tags={"jira", "write"})
@@ -1396,7 +1683,7 @@ async def create_sprint(
         end_date=end_date,
         goal=goal,
     )
-    return json.dumps(sprint.to_simplified_dict(), indent=2, ensure_ascii=False)
+    return dumps_response(sprint.to_simplified_dict())
 
 
 @jira_mcp.tool(tags={"jira", "write"})
@@ -1452,9 +1739,9 @@ async def update_sprint(
         error_payload = {
             "error": f"Failed to update sprint {sprint_id}. Check logs for details."
         }
-        return json.dumps(error_payload, indent=2, ensure_ascii=False)
+        return dumps_response(error_payload)
     else:
-        return json.dumps(sprint.to_simplified_dict(), indent=2, ensure_ascii=False)
+        return dumps_response(sprint.to_simplified_dict())
 
 
 @jira_mcp.tool(tags={"jira", "read"})
@@ -1465,7 +1752,7 @@ async def get_project_versions(
     """Get all fix versions for a specific Jira project."""
     jira = await get_jira_fetcher(ctx)
     versions = jira.get_project_versions(project_key)
-    return json.dumps(versions, indent=2, ensure_ascii=False)
+    return dumps_response(versions)
 
 
 @jira_mcp.tool(tags={"jira", "read"})
@@ -1511,7 +1798,7 @@ async def get_all_projects(
             "error": error_message,
         }
         logger.log(log_level, f"get_all_projects failed: {error_message}")
-        return json.dumps(error_result, indent=2, ensure_ascii=False)
+        return dumps_response(error_result)
 
     # Ensure all project keys are uppercase
     for project in projects:
@@ -1530,7 +1817,7 @@ async def get_all_projects(
             if project.get("key") in allowed_project_keys
         ]
 
-    return json.dumps(projects, indent=2, ensure_ascii=False)
+    return dumps_response(projects)
 
 
 @jira_mcp.tool(tags={"jira", "write"})
@@ -1571,14 +1858,12 @@ async def create_version(
             release_date=release_date,
             description=description,
         )
-        return json.dumps(version, indent=2, ensure_ascii=False)
+        return dumps_response(version)
     except Exception as e:
         logger.error(
             f"Error creating version in project {project_key}: {str(e)}", exc_info=True
         )
-        return json.dumps(
-            {"success": False, "error": str(e)}, indent=2, ensure_ascii=False
-        )
+        return dumps_response({"success": False, "error": str(e)})
 
 
 @jira_mcp.tool(name="batch_create_versions", tags={"jira", "write"})
@@ -1625,7 +1910,7 @@ async def batch_create_versions(
 
     results = []
     if not version_list:
-        return json.dumps(results, indent=2, ensure_ascii=False)
+        return dumps_response(results)
 
     for idx, v in enumerate(version_list):
         # Defensive: ensure v is a dict and has a name
@@ -1652,4 +1937,4 @@ async def batch_create_versions(
                 exc_info=True,
             )
             results.append({"success": False, "error": str(e), "input": v})
-    return json.dumps(results, indent=2, ensure_ascii=False)
+    return dumps_response(results)
@@ -1,20 +1,23 @@
 """Main FastMCP server setup for Atlassian integration."""
 
+import asyncio
 import logging
-from collections.abc import AsyncIterator
-from contextlib import asynccontextmanager
+import time
+from collections.abc import AsyncIterator, Hashable
+from contextlib import asynccontextmanager, nullcontext
 from typing import Any, Literal, Optional
 
 from cachetools import TTLCache
 from fastmcp import FastMCP
 from fastmcp import Context
 from fastmcp.tools import Tool as FastMCPTool
+from mcp.types import EmbeddedResource, ImageContent, TextContent
 from mcp.types import Tool as MCPTool
 from starlette.applications import Starlette
 from starlette.middleware import Middleware
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 from starlette.requests import Request
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, PlainTextResponse, Response
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from mcp_atlassian.confluence import ConfluenceFetcher
 from mcp_atlassian.confluence.config import ConfluenceConfig
@@ -23,7 +26,20 @@ from mcp_atlassian.jira.config import JiraConfig
 from mcp_atlassian.utils.environment import get_available_services
 from mcp_atlassian.utils.io import is_read_only_mode
 from mcp_atlassian.utils.logging import mask_sensitive
+from mcp_atlassian.utils.metrics import (
+    METRICS_CONTENT_TYPE,
+    metrics_enabled,
+    record_tool_call,
+    render_metrics,
+)
+from mcp_atlassian.utils.profiling import get_slow_call_profiler
 from mcp_atlassian.utils.tools import get_enabled_tools, should_include_tool
+from mcp_atlassian.utils.tracing import (
+    configure_tracing,
+    shutdown_tracing,
+    start_span,
+    tracing_enabled,
+)
 
 from .confluence import confluence_mcp
 from .context import MainAppContext
@@ -36,9 +52,42 @@ async def health_check(request: Request) -> JSONResponse:
     return JSONResponse({"status": "ok"})
 
 
+async def metrics(request: Request) -> Response:
+    if not metrics_enabled():
+        return PlainTextResponse(
+            "Metrics are disabled. Set MCP_METRICS_ENABLED=true to enable them.",
+            status_code=404,
+        )
+    return PlainTextResponse(render_metrics(), media_type=METRICS_CONTENT_TYPE)
+
+
+async def prefetch_jira_metadata(config: JiraConfig) -> None:
+    """Warm the shared Jira metadata caches for the filtered projects.
+
+    Runs in a worker thread so server startup is not delayed. Failures are
+    logged and otherwise ignored; the caches are then filled on first use.
+
+    Args:
+        config: The Jira configuration loaded at startup.
+    """
+    project_keys = [
+        key.strip() for key in (config.projects_filter or "").split(",") if key.strip()
+    ]
+    if not project_keys:
+        return
+    logger.info(f"Prefetching Jira create metadata for projects: {project_keys}")
+    try:
+        fetcher = JiraFetcher(config=config)
+        await asyncio.to_thread(fetcher.prefetch_create_metadata, project_keys)
+        logger.info("Jira create metadata prefetch complete.")
+    except Exception as e:
+        logger.warning(f"Jira create metadata prefetch failed: {e}")
+
+
 @asynccontextmanager
 async def main_lifespan(app: FastMCP[MainAppContext]) -> AsyncIterator[dict]:
     logger.info("Main Atlassian MCP server lifespan starting...")
+    configure_tracing()
     services = get_available_services()
     read_only = is_read_only_mode()
     enabled_tools = get_enabled_tools()
@@ -85,6 +134,18 @@ async def main_lifespan(app: FastMCP[MainAppContext]) -> AsyncIterator[dict]:
     logger.info(f"Read-only mode: {'ENABLED' if read_only else 'DISABLED'}")
     logger.info(f"Enabled tools filter: {enabled_tools or 'All tools enabled'}")
 
+    prefetch_task: asyncio.Task[None] | None = None
+    if loaded_jira_config and loaded_jira_config.projects_filter:
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # Other anyio backends (e.g. trio) have no asyncio loop to run on
+            logger.debug("No asyncio event loop, skipping Jira metadata prefetch.")
+        else:
+            prefetch_task = asyncio.create_task(
+                prefetch_jira_metadata(loaded_jira_config)
+            )
+
     try:
         yield {"app_lifespan_context": app_context}
     except Exception as e:
@@ -92,6 +153,8 @@ async def main_lifespan(app: FastMCP[MainAppContext]) -> AsyncIterator[dict]:
         raise
     finally:
         logger.info("Main Atlassian MCP server lifespan shutting down...")
+        if prefetch_task and not prefetch_task.done():
+            prefetch_task.cancel()
         # Perform any necessary cleanup here
         try:
             # Close any open connections if needed
@@ -101,12 +164,58 @@ async def main_lifespan(app: FastMCP[MainAppContext]) -> AsyncIterator[dict]:
                 logger.debug("Cleaning up Confluence resources...")
         except Exception as e:
             logger.error(f"Error during cleanup: {e}", exc_info=True)
+        shutdown_tracing()
         logger.info("Main Atlassian MCP server lifespan shutdown complete.")
 
 
 class AtlassianMCP(FastMCP[MainAppContext]):
     """Custom FastMCP server class for Atlassian integration with tool filtering."""
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # Filtered tool lists keyed by the settings that affect filtering
+        self._tool_list_cache: dict[Hashable, list[MCPTool]] = {}
+
+    def invalidate_tool_list_cache(self) -> None:
+        """Drop the memoized tool lists so the next tools/list rebuilds them."""
+        self._tool_list_cache.clear()
+
+    def mount(self, *args: Any, **kwargs: Any) -> None:
+        super().mount(*args, **kwargs)
+        self.invalidate_tool_list_cache()
+
+    def add_tool(self, *args: Any, **kwargs: Any) -> None:
+        super().add_tool(*args, **kwargs)
+        self.invalidate_tool_list_cache()
+
+    def remove_tool(self, name: str) -> None:
+        super().remove_tool(name)
+        self.invalidate_tool_list_cache()
+
+    async def _mcp_call_tool(
+        self, key: str, arguments: dict[str, Any]
+    ) -> list[TextContent | ImageContent | EmbeddedResource]:
+        profiler = get_slow_call_profiler()
+        if not metrics_enabled() and not tracing_enabled() and profiler is None:
+            return await super()._mcp_call_tool(key, arguments)
+        start = time.perf_counter()
+        failed = True
+        try:
+            with (
+                start_span(f"tools/call {key}", {"mcp.tool.name": key}) as span,
+                profiler.profile(key, arguments) if profiler else nullcontext(),
+            ):
+                result = await super()._mcp_call_tool(key, arguments)
+                if span is not None:
+                    span.set_attribute(
+                        "mcp.tool.result.size",
+                        sum(len(c.text) for c in result if isinstance(c, TextContent)),
+                    )
+            failed = False
+            return result
+        finally:
+            record_tool_call(key, time.perf_counter() - start, failed=failed)
+
     async def _mcp_list_tools(self) -> list[MCPTool]:
         # Filter tools based on enabled_tools, read_only mode, and service configuration from the lifespan context.
         req_context = self._mcp_server.request_context
@@ -132,6 +241,19 @@ class AtlassianMCP(FastMCP[MainAppContext]):
             if app_lifespan_state
             else None
         )
+        # The filtered list only depends on these settings and on the
+        # registered tools, which invalidate the cache when they change
+        cache_key = (
+            app_lifespan_state is not None,
+            read_only,
+            tuple(enabled_tools_filter) if enabled_tools_filter is not None else None,
+            bool(app_lifespan_state and app_lifespan_state.full_jira_config),
+            bool(app_lifespan_state and app_lifespan_state.full_confluence_config),
+        )
+        cached_tools = self._tool_list_cache.get(cache_key)
+        if cached_tools is not None:
+            return list(cached_tools)
+
         logger.debug(
             f"_main_mcp_list_tools: read_only={read_only}, enabled_tools_filter={enabled_tools_filter}"
         )
@@ -184,7 +306,8 @@ class AtlassianMCP(FastMCP[MainAppContext]):
         logger.debug(
             f"_main_mcp_list_tools: Total tools after filtering: {len(filtered_tools)}"
         )
-        return filtered_tools
+        self._tool_list_cache[cache_key] = filtered_tools
+        return list(filtered_tools)
 
     def http_app(
         self,
@@ -207,123 +330,104 @@ token_validation_cache: TTLCache[
 ] = TTLCache(maxsize=100, ttl=300)
 
 
-class UserTokenMiddleware(BaseHTTPMiddleware):
-    """Middleware to extract Atlassian user tokens/credentials from Authorization headers."""
+class UserTokenMiddleware:
+    """Pure ASGI middleware extracting Atlassian user credentials from requests.
+
+    For POST requests to the streamable-http MCP endpoint, a ``Bearer`` token
+    is stored as an OAuth token and a ``Token`` as a PAT in the request state,
+    together with the optional ``X-Atlassian-Cloud-Id`` header. Other
+    Authorization schemes and empty tokens are rejected with a 401 response.
+    Unlike BaseHTTPMiddleware, responses are passed through untouched, so
+    streaming responses are not buffered or wrapped in extra tasks.
+    """
 
     def __init__(
-        self, app: Any, mcp_server_ref: Optional["AtlassianMCP"] = None
+        self, app: ASGIApp, mcp_server_ref: Optional["AtlassianMCP"] = None
     ) -> None:
-        super().__init__(app)
+        self.app = app
         self.mcp_server_ref = mcp_server_ref
         if not self.mcp_server_ref:
             logger.warning(
                 "UserTokenMiddleware initialized without mcp_server_ref. Path matching for MCP endpoint might fail if settings are needed."
             )
 
-    async def dispatch(
-        self, request: Request, call_next: RequestResponseEndpoint
-    ) -> JSONResponse:
-        logger.debug(
-            f"UserTokenMiddleware.dispatch: ENTERED for request path='{request.url.path}', method='{request.method}'"
-        )
-        mcp_server_instance = self.mcp_server_ref
-        if mcp_server_instance is None:
-            logger.debug(
-                "UserTokenMiddleware.dispatch: self.mcp_server_ref is None. Skipping MCP auth logic."
-            )
-            return await call_next(request)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "POST"
+            or self.mcp_server_ref is None
+            or scope["path"].rstrip("/")
+            != self.mcp_server_ref.settings.streamable_http_path.rstrip("/")
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        # Scan the raw headers (lower-cased by the server) instead of building
+        # a Headers object; nothing is allocated when neither header is set
+        auth_header: bytes | None = None
+        cloud_id_header: bytes | None = None
+        for name, value in scope["headers"]:
+            if name == b"authorization":
+                auth_header = value
+            elif name == b"x-atlassian-cloud-id":
+                cloud_id_header = value
+
+        if cloud_id_header is not None:
+            cloud_id = cloud_id_header.decode("latin-1").strip()
+            scope.setdefault("state", {})["user_atlassian_cloud_id"] = cloud_id or None
+
+        # An empty header counts as no header, as before
+        if not auth_header:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"No Authorization header provided for {scope['path']}. Will proceed with global/fallback server configuration if applicable."
+                )
+            await self.app(scope, receive, send)
+            return
 
-        mcp_path = mcp_server_instance.settings.streamable_http_path.rstrip("/")
-        request_path = request.url.path.rstrip("/")
-        logger.debug(
-            f"UserTokenMiddleware.dispatch: Comparing request_path='{request_path}' with mcp_path='{mcp_path}'. Request method='{request.method}'"
+        error = self._apply_authorization(
+            auth_header.decode("latin-1"), scope.setdefault("state", {})
         )
-        if request_path == mcp_path and request.method == "POST":
-            auth_header = request.headers.get("Authorization")
-            cloud_id_header = request.headers.get("X-Atlassian-Cloud-Id")
-
-            token_for_log = mask_sensitive(
-                auth_header.split(" ", 1)[1].strip()
-                if auth_header and " " in auth_header
-                else auth_header
+        if error is not None:
+            response = JSONResponse({"error": error}, status_code=401)
+            await response(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
+    @staticmethod
+    def _apply_authorization(auth_header: str, state: dict[str, Any]) -> str | None:
+        """Store the credentials of an Authorization header in the request state.
+
+        Args:
+            auth_header: The Authorization header value.
+            state: The ASGI request state, as exposed by ``request.state``.
+
+        Returns:
+            An error message if the header must be rejected, otherwise None.
+        """
+        scheme, separator, credentials = auth_header.partition(" ")
+        if separator and scheme == "Bearer":
+            auth_type, empty_error = "oauth", "Unauthorized: Empty Bearer token"
+        elif separator and scheme == "Token":
+            auth_type, empty_error = "pat", "Unauthorized: Empty Token (PAT)"
+        else:
+            logger.warning(
+                f"Unsupported Authorization type: {scheme if separator else 'UnknownType'}"
             )
+            return "Unauthorized: Only 'Bearer <OAuthToken>' or 'Token <PAT>' types are supported."
+
+        token = credentials.strip()
+        if not token:
+            return empty_error
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug(
-                f"UserTokenMiddleware: Path='{request.url.path}', AuthHeader='{mask_sensitive(auth_header)}', ParsedToken(masked)='{token_for_log}', CloudId='{cloud_id_header}'"
+                f"UserTokenMiddleware: {auth_type} token extracted (masked): ...{mask_sensitive(token, 8)}"
             )
-
-            # Extract and save cloudId if provided
-            if cloud_id_header and cloud_id_header.strip():
-                request.state.user_atlassian_cloud_id = cloud_id_header.strip()
-                logger.debug(
-                    f"UserTokenMiddleware: Extracted cloudId from header: {cloud_id_header.strip()}"
-                )
-            else:
-                request.state.user_atlassian_cloud_id = None
-                logger.debug(
-                    "UserTokenMiddleware: No cloudId header provided, will use global config"
-                )
-
-            # Check for mcp-session-id header for debugging
-            mcp_session_id = request.headers.get("mcp-session-id")
-            if mcp_session_id:
-                logger.debug(
-                    f"UserTokenMiddleware: MCP-Session-ID header found: {mcp_session_id}"
-                )
-            if auth_header and auth_header.startswith("Bearer "):
-                token = auth_header.split(" ", 1)[1].strip()
-                if not token:
-                    return JSONResponse(
-                        {"error": "Unauthorized: Empty Bearer token"},
-                        status_code=401,
-                    )
-                logger.debug(
-                    f"UserTokenMiddleware.dispatch: Bearer token extracted (masked): ...{mask_sensitive(token, 8)}"
-                )
-                request.state.user_atlassian_token = token
-                request.state.user_atlassian_auth_type = "oauth"
-                request.state.user_atlassian_email = None
-                logger.debug(
-                    f"UserTokenMiddleware.dispatch: Set request.state (pre-validation): "
-                    f"auth_type='{getattr(request.state, 'user_atlassian_auth_type', 'N/A')}', "
-                    f"token_present={bool(getattr(request.state, 'user_atlassian_token', None))}"
-                )
-            elif auth_header and auth_header.startswith("Token "):
-                token = auth_header.split(" ", 1)[1].strip()
-                if not token:
-                    return JSONResponse(
-                        {"error": "Unauthorized: Empty Token (PAT)"},
-                        status_code=401,
-                    )
-                logger.debug(
-                    f"UserTokenMiddleware.dispatch: PAT (Token scheme) extracted (masked): ...{mask_sensitive(token, 8)}"
-                )
-                request.state.user_atlassian_token = token
-                request.state.user_atlassian_auth_type = "pat"
-                request.state.user_atlassian_email = (
-                    None  # PATs don't carry email in the token itself
-                )
-                logger.debug(
-                    "UserTokenMiddleware.dispatch: Set request.state for PAT auth."
-                )
-            elif auth_header:
-                logger.warning(
-                    f"Unsupported Authorization type for {request.url.path}: {auth_header.split(' ', 1)[0] if ' ' in auth_header else 'UnknownType'}"
-                )
-                return JSONResponse(
-                    {
-                        "error": "Unauthorized: Only 'Bearer <OAuthToken>' or 'Token <PAT>' types are supported."
-                    },
-                    status_code=401,
-                )
-            else:
-                logger.debug(
-                    f"No Authorization header provided for {request.url.path}. Will proceed with global/fallback server configuration if applicable."
-                )
-        response = await call_next(request)
-        logger.debug(
-            f"UserTokenMiddleware.dispatch: EXITED for request path='{request.url.path}'"
-        )
-        return response
+        state["user_atlassian_token"] = token
+        state["user_atlassian_auth_type"] = auth_type
+        # Neither OAuth tokens nor PATs carry the user's email
+        state["user_atlassian_email"] = None
+        return None
 
 
 main_mcp = AtlassianMCP(name="Atlassian MCP", lifespan=main_lifespan)
@@ -339,6 +443,11 @@ async def _health_check_route(request: Request) -> JSONResponse:
 logger.info("Added /healthz endpoint for Kubernetes probes")
 
 
+@main_mcp.custom_route("/metrics", methods=["GET"], include_in_schema=False)
+async def _metrics_route(request: Request) -> Response:
+    return await metrics(request)
+
+
 @main_mcp.tool(
     name="get_connection_status",
     description="Check connectivity and authentication status for all configured Atlassian services (Jira, Confluence). Returns a structured status report for diagnostics.",
@@ -353,6 +462,7 @@ async def get_connection_status_tool(ctx: Context) -> dict:
         check_confluence_connection_status,
     )
     import datetime
+
     results = {}
     jira_status = await check_jira_connection_status(ctx)
     confluence_status = await check_confluence_connection_status(ctx)
@@ -372,6 +482,7 @@ async def get_connection_status_tool(ctx: Context) -> dict:
         overall = "unavailable"
     results["overall_status"] = overall
     results["services"] = services
-    results["timestamp"] = datetime.datetime.now(datetime.timezone.utc).replace(microsecond=0).isoformat()
+    results["timestamp"] = (
+        datetime.datetime.now(datetime.timezone.utc).replace(microsecond=0).isoformat()
+    )
     return results
-
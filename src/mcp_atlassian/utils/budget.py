@@ -0,0 +1,237 @@
+"""Response budget utilities for MCP Atlassian.
+
+Large issues and pages can produce responses of hundreds of kilobytes. These
+helpers shrink a simplified response dictionary to an approximate character
+budget by truncating its long fields (descriptions, comments, page bodies)
+while keeping every other field (the metadata) intact. Each truncated field
+is reported under ``truncated_fields`` together with a continuation cursor
+that can be passed back to fetch the next chunk of that field.
+"""
+
+import json
+import logging
+from collections.abc import Sequence
+from typing import Any
+
+logger = logging.getLogger("mcp-atlassian.utils.budget")
+
+# Rough conversion used in tool descriptions; most tokenizers average ~4 chars.
+CHARS_PER_TOKEN = 4
+
+# Smallest budget a caller may request; anything lower cannot fit metadata.
+MIN_RESPONSE_CHARS = 500
+
+TRUNCATED_FIELDS_KEY = "truncated_fields"
+
+_MISSING = object()
+
+
+def _size(value: Any) -> int:
+    """Approximate the serialized size of a value in characters."""
+    return len(json.dumps(value, ensure_ascii=False, separators=(",", ":")))
+
+
+def _get_path(data: dict[str, Any], path: str) -> Any:
+    """Get a value from a nested dictionary using a dotted path."""
+    current: Any = data
+    for part in path.split("."):
+        if not isinstance(current, dict) or part not in current:
+            return _MISSING
+        current = current[part]
+    return current
+
+
+def _set_path(data: dict[str, Any], path: str, value: Any) -> None:
+    """Set a value in a nested dictionary using a dotted path.
+
+    Intermediate dictionaries are copied so the caller's input is not mutated.
+    """
+    parts = path.split(".")
+    current = data
+    for part in parts[:-1]:
+        current[part] = dict(current[part])
+        current = current[part]
+    current[parts[-1]] = value
+
+
+def encode_cursor(field: str, offset: int) -> str:
+    """Build a continuation cursor for a truncated field.
+
+    Args:
+        field: Dotted path of the truncated field (e.g. 'description').
+        offset: Character offset (strings) or item index (lists) to resume at.
+
+    Returns:
+        The cursor string in the form ``<field>:<offset>``.
+    """
+    return f"{field}:{offset}"
+
+
+def decode_cursor(cursor: str) -> tuple[str, int]:
+    """Parse a continuation cursor.
+
+    Args:
+        cursor: A cursor produced by :func:`encode_cursor`.
+
+    Returns:
+        Tuple of (field path, offset).
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    field, sep, offset = cursor.rpartition(":")
+    if not sep or not field or not offset.isdigit():
+        raise ValueError(
+            f"Invalid continuation cursor '{cursor}'. Expected '<field>:<offset>'."
+        )
+    return field, int(offset)
+
+
+def _take_chunk(
+    value: Any, offset: int, budget: int, at_least_one: bool = False
+) -> tuple[Any, int]:
+    """Take as much of a string or list as fits in the budget.
+
+    Args:
+        value: The string or list to slice.
+        offset: Where to start (character offset or item index).
+        budget: Maximum serialized size of the chunk.
+        at_least_one: Always return at least one character or item, so that
+            repeated continuation calls make progress.
+
+    Returns:
+        Tuple of (chunk, end offset).
+    """
+    budget = max(budget, 0)
+    if isinstance(value, str):
+        end = min(len(value), offset + budget)
+        # JSON escaping can grow a string, so shrink until the chunk fits.
+        while end > offset and (overflow := _size(value[offset:end]) - budget) > 0:
+            end -= overflow
+        if at_least_one and end <= offset < len(value):
+            end = offset + 1
+        end = max(end, offset)
+        return value[offset:end], end
+
+    items: list[Any] = []
+    used = 2  # surrounding brackets
+    end = offset
+    for item in value[offset:]:
+        item_size = _size(item) + (1 if items else 0)
+        if used + item_size > budget and not (at_least_one and not items):
+            break
+        items.append(item)
+        used += item_size
+        end += 1
+    return items, end
+
+
+def apply_response_budget(
+    data: dict[str, Any],
+    max_chars: int | None,
+    fields: Sequence[str],
+) -> dict[str, Any]:
+    """Shrink a response dictionary to an approximate character budget.
+
+    Fields listed in ``fields`` are treated as truncatable, in priority order:
+    earlier fields get their share of the budget first. All other keys are
+    metadata and are always returned in full. Strings are cut at a character
+    offset and lists at an item boundary.
+
+    Args:
+        data: The simplified response dictionary.
+        max_chars: Approximate maximum serialized size. ``None`` disables
+            shaping.
+        fields: Dotted paths of the truncatable fields, highest priority first.
+
+    Returns:
+        The original dictionary if it already fits, otherwise a shallow copy
+        with truncated fields and a ``truncated_fields`` entry describing how
+        to continue each of them.
+    """
+    if max_chars is None or _size(data) <= max_chars:
+        return data
+
+    long_fields = [
+        (path, value)
+        for path in fields
+        if isinstance(value := _get_path(data, path), str | list) and value
+    ]
+    if not long_fields:
+        logger.debug("Response exceeds budget but has no truncatable fields.")
+        return data
+
+    result = dict(data)
+    for path, value in long_fields:
+        _set_path(result, path, value[:0])
+
+    # Reserve room for the truncation report before handing out the rest.
+    reserve = _size(
+        {
+            TRUNCATED_FIELDS_KEY: {
+                path: {
+                    "returned": len(value),
+                    "total": len(value),
+                    "next_cursor": encode_cursor(path, len(value)),
+                }
+                for path, value in long_fields
+            }
+        }
+    )
+    remaining = max_chars - _size(result) - reserve
+
+    truncated: dict[str, dict[str, Any]] = {}
+    for path, value in long_fields:
+        chunk, end = _take_chunk(value, 0, remaining)
+        _set_path(result, path, chunk)
+        remaining -= _size(chunk) - _size(value[:0])
+        if end < len(value):
+            truncated[path] = {
+                "returned": end,
+                "total": len(value),
+                "next_cursor": encode_cursor(path, end),
+            }
+
+    if truncated:
+        result[TRUNCATED_FIELDS_KEY] = truncated
+    return result
+
+
+def get_continuation_chunk(
+    data: dict[str, Any],
+    cursor: str,
+    max_chars: int | None,
+    fields: Sequence[str],
+) -> dict[str, Any]:
+    """Return the next chunk of a truncated field.
+
+    Args:
+        data: The full simplified response dictionary.
+        cursor: The continuation cursor from a previous response.
+        max_chars: Approximate maximum size of the returned chunk. ``None``
+            returns the rest of the field.
+        fields: Dotted paths of the fields that may be continued.
+
+    Returns:
+        Dictionary with the field path, the chunk, its offsets and the cursor
+        for the following chunk (``None`` once the field is exhausted).
+
+    Raises:
+        ValueError: If the cursor is malformed or refers to an unknown field.
+    """
+    path, offset = decode_cursor(cursor)
+    value = _get_path(data, path) if path in fields else _MISSING
+    if not isinstance(value, str | list):
+        raise ValueError(f"Field '{path}' cannot be continued.")
+
+    if max_chars is None:
+        chunk, end = value[offset:], len(value)
+    else:
+        chunk, end = _take_chunk(value, offset, max_chars, at_least_one=True)
+    return {
+        "field": path,
+        "offset": offset,
+        "value": chunk,
+        "total": len(value),
+        "next_cursor": encode_cursor(path, end) if end < len(value) else None,
+    }
@@ -0,0 +1,187 @@
+"""Process-wide caches shared by all fetchers.
+
+Fetchers are created per request in the HTTP transports, so metadata cached on
+a fetcher instance is lost after every call. The caches in this module live for
+the whole process instead. Entries expire after a TTL and every cache keeps hit
+and miss counters so their effectiveness can be observed.
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from collections.abc import Callable, Hashable
+from typing import Any, Generic, NamedTuple, TypeVar
+
+from cachetools import TLRUCache
+
+from .tracing import record_cache_lookup
+
+logger = logging.getLogger("mcp-atlassian.utils.cache")
+
+V = TypeVar("V")
+
+_registry: dict[str, "SharedCache[Any]"] = {}
+_registry_lock = threading.Lock()
+
+
+class _Entry(NamedTuple):
+    """A cached value together with its time to live."""
+
+    value: Any
+    ttl: float
+
+
+def _entry_expiry(key: Hashable, entry: _Entry, now: float) -> float:
+    return now + entry.ttl
+
+
+class SharedCache(Generic[V]):
+    """A thread-safe TTL cache registered under a name.
+
+    Keys should include the instance URL (and the user where results depend
+    on permissions) so that entries never leak between Atlassian instances.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ttl: float,
+        maxsize: int = 1024,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Create and register a cache.
+
+        Args:
+            name: Unique name of the cache, used in logs and statistics.
+            ttl: Default time to live of each entry in seconds.
+            maxsize: Maximum number of entries kept.
+            timer: Clock used for expiry; defaults to time.monotonic.
+        """
+        self.name = name
+        self.ttl = ttl
+        self._cache: TLRUCache[Hashable, _Entry] = TLRUCache(
+            maxsize=maxsize, ttu=_entry_expiry, timer=timer
+        )
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        with _registry_lock:
+            _registry[name] = self
+
+    def get(self, key: Hashable) -> V | None:
+        """Get an entry, counting the lookup as a hit or a miss.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            The cached value, or None if it is missing or expired.
+        """
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        record_cache_lookup(self.name, hit=entry is not None)
+        return None if entry is None else entry.value
+
+    def set(self, key: Hashable, value: V, ttl: float | None = None) -> None:
+        """Store an entry.
+
+        Args:
+            key: The cache key.
+            value: The value to cache. None values are not stored.
+            ttl: Time to live of this entry in seconds; defaults to the cache
+                TTL. Entries with a TTL of zero or less are not stored.
+        """
+        ttl = self.ttl if ttl is None else ttl
+        if value is None or ttl <= 0:
+            return
+        with self._lock:
+            self._cache[key] = _Entry(value, ttl)
+
+    def get_or_set(
+        self, key: Hashable, factory: Callable[[], V], ttl: float | None = None
+    ) -> V:
+        """Get an entry, computing and storing it on a miss.
+
+        The factory runs outside the lock, so concurrent misses may compute
+        the value more than once; the last result wins.
+
+        Args:
+            key: The cache key.
+            factory: Callable producing the value on a miss.
+            ttl: Time to live of a new entry; defaults to the cache TTL.
+
+        Returns:
+            The cached or freshly computed value.
+        """
+        value = self.get(key)
+        if value is None:
+            value = factory()
+            self.set(key, value, ttl)
+        return value
+
+    def invalidate(self, key: Hashable | None = None) -> None:
+        """Drop one entry, or every entry when no key is given.
+
+        Args:
+            key: The cache key to drop, or None to clear the cache.
+        """
+        with self._lock:
+            if key is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(key, None)
+
+    def invalidate_matching(self, predicate: Callable[[Hashable], bool]) -> None:
+        """Drop every entry whose key matches a predicate.
+
+        Args:
+            predicate: Called with each key; entries returning True are dropped.
+        """
+        with self._lock:
+            for key in [k for k in self._cache if predicate(k)]:
+                self._cache.pop(key, None)
+
+    def stats(self) -> dict[str, Any]:
+        """Return the size and hit/miss counters of the cache."""
+        with self._lock:
+            return {
+                "size": len(self._cache),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+def credential_fingerprint(*parts: Any) -> str:
+    """Derive a short, non-reversible cache key component from credentials.
+
+    Args:
+        parts: Credential values such as a username and a token.
+
+    Returns:
+        A hex digest that identifies the credentials without exposing them.
+    """
+    joined = "\0".join("" if part is None else str(part) for part in parts)
+    return hashlib.sha256(joined.encode("utf-8")).hexdigest()[:16]
+
+
+def get_cache_stats() -> dict[str, dict[str, Any]]:
+    """Return statistics for every registered cache, keyed by cache name."""
+    with _registry_lock:
+        caches = list(_registry.values())
+    return {cache.name: cache.stats() for cache in caches}
+
+
+def clear_all_caches() -> None:
+    """Clear every registered cache and reset its counters."""
+    with _registry_lock:
+        caches = list(_registry.values())
+    for cache in caches:
+        cache.invalidate()
+        cache.hits = 0
+        cache.misses = 0
+    logger.debug(f"Cleared {len(caches)} shared caches")
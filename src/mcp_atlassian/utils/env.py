@@ -1,7 +1,10 @@
 """Environment variable utility functions for MCP Atlassian."""
 
+import logging
 import os
 
+logger = logging.getLogger("mcp-atlassian.utils.env")
+
 
 def is_env_truthy(env_var_name: str, default: str = "") -> bool:
     """Check if environment variable is set to a standard truthy value.
@@ -91,3 +94,29 @@ def get_custom_headers(env_var_name: str) -> dict[str, str]:
             headers[key] = value
 
     return headers
+
+
+def get_cache_ttls(env_var_name: str) -> dict[str, int]:
+    """Parse cache TTLs from an environment variable of name=seconds pairs.
+
+    Args:
+        env_var_name: Name of the environment variable to read
+
+    Returns:
+        Dictionary mapping cache names to TTLs in seconds; invalid entries
+        are skipped
+
+    Examples:
+        >>> # With CACHE_TTLS="projects=600,versions=60"
+        >>> get_cache_ttls("CACHE_TTLS")
+        {'projects': 600, 'versions': 60}
+    """
+    ttls = {}
+    for name, value in get_custom_headers(env_var_name).items():
+        try:
+            ttls[name.lower()] = int(value)
+        except ValueError:
+            logger.warning(
+                f"Ignoring invalid TTL '{value}' for '{name}' in {env_var_name}"
+            )
+    return ttls
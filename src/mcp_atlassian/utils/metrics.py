@@ -0,0 +1,349 @@
+"""Lightweight in-process metrics exported in the Prometheus text format.
+
+Metrics are disabled unless ``MCP_METRICS_ENABLED`` is truthy. When disabled,
+recording functions return after a single flag check and REST clients are not
+instrumented at all. When enabled, the server exposes the counters at
+``/metrics``:
+
+- tool calls and their latency, per tool;
+- upstream Atlassian requests, status codes and latency, per endpoint;
+- upstream retries and rate-limited (HTTP 429) responses, per service;
+- hits, misses and hit ratio of every shared cache.
+"""
+
+import logging
+import math
+import re
+import threading
+from collections.abc import Callable, Sequence
+from typing import Any
+from urllib.parse import urlsplit
+
+from .cache import get_cache_stats
+from .env import is_env_truthy
+
+logger = logging.getLogger("mcp-atlassian.utils.metrics")
+
+METRICS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Latency buckets in seconds, from fast cache hits to slow bulk calls
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Path segments after which a version, not an ID, follows (e.g. /rest/api/2)
+_VERSIONED_SEGMENTS = frozenset({"api", "agile", "greenhopper", "servicedeskapi"})
+_DIGIT = re.compile(r"\d")
+
+_enabled = is_env_truthy("MCP_METRICS_ENABLED")
+
+
+def metrics_enabled() -> bool:
+    """Check whether metrics are being recorded."""
+    return _enabled
+
+
+def set_metrics_enabled(*, enabled: bool) -> None:
+    """Enable or disable metric recording.
+
+    Args:
+        enabled: Whether to record metrics. REST clients created while
+            metrics are disabled stay uninstrumented.
+    """
+    global _enabled
+    _enabled = enabled
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = (
+        f'{name}="{_escape(value)}"' for name, value in zip(names, values, strict=True)
+    )
+    return "{" + ",".join(pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class Counter:
+    """A monotonically increasing counter with labels."""
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str]) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self._values: dict[tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *label_values: str, amount: float = 1.0) -> None:
+        """Increment the counter of a label combination."""
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0.0) + amount
+
+    def value(self, *label_values: str) -> float:
+        """Get the current value of a label combination."""
+        with self._lock:
+            return self._values.get(label_values, 0.0)
+
+    def reset(self) -> None:
+        """Drop all recorded values."""
+        with self._lock:
+            self._values.clear()
+
+    def render(self) -> list[str]:
+        """Render the counter in the Prometheus text format."""
+        with self._lock:
+            values = sorted(self._values.items())
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} counter",
+        ]
+        for label_values, value in values:
+            labels = _format_labels(self.labels, label_values)
+            lines.append(f"{self.name}{labels} {_format_value(value)}")
+        return lines
+
+
+class Histogram:
+    """A histogram of observed values with fixed buckets and labels."""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: Sequence[str],
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self.buckets = tuple(sorted(buckets))
+        # Non-cumulative bucket counts (+Inf last) and sums per label values
+        self._counts: dict[tuple[str, ...], list[int]] = {}
+        self._sums: dict[tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *label_values: str) -> None:
+        """Record an observation for a label combination."""
+        index = len(self.buckets)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                index = i
+                break
+        with self._lock:
+            counts = self._counts.get(label_values)
+            if counts is None:
+                counts = self._counts[label_values] = [0] * (len(self.buckets) + 1)
+            counts[index] += 1
+            self._sums[label_values] = self._sums.get(label_values, 0.0) + value
+
+    def count(self, *label_values: str) -> int:
+        """Get the number of observations of a label combination."""
+        with self._lock:
+            return sum(self._counts.get(label_values, ()))
+
+    def reset(self) -> None:
+        """Drop all recorded observations."""
+        with self._lock:
+            self._counts.clear()
+            self._sums.clear()
+
+    def render(self) -> list[str]:
+        """Render the histogram in the Prometheus text format."""
+        with self._lock:
+            values = sorted(
+                (labels, (list(counts), self._sums[labels]))
+                for labels, counts in self._counts.items()
+            )
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} histogram",
+        ]
+        bucket_labels = (*self.labels, "le")
+        for label_values, (counts, total) in values:
+            cumulative = 0
+            for bound, count in zip((*self.buckets, math.inf), counts, strict=True):
+                cumulative += count
+                labels = _format_labels(
+                    bucket_labels, (*label_values, _format_value(bound))
+                )
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labels, label_values)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+TOOL_CALLS = Counter(
+    "mcp_atlassian_tool_calls_total",
+    "Number of MCP tool calls by tool and outcome.",
+    ("tool", "status"),
+)
+TOOL_DURATION = Histogram(
+    "mcp_atlassian_tool_duration_seconds",
+    "Duration of MCP tool calls in seconds.",
+    ("tool",),
+)
+UPSTREAM_REQUESTS = Counter(
+    "mcp_atlassian_upstream_requests_total",
+    "Number of HTTP requests sent to Atlassian by endpoint and status code.",
+    ("service", "method", "endpoint", "status"),
+)
+UPSTREAM_DURATION = Histogram(
+    "mcp_atlassian_upstream_request_duration_seconds",
+    "Time until the response headers of Atlassian HTTP requests arrived.",
+    ("service", "method", "endpoint"),
+)
+UPSTREAM_RETRIES = Counter(
+    "mcp_atlassian_upstream_retries_total",
+    "Number of Atlassian HTTP requests that were retried.",
+    ("service",),
+)
+UPSTREAM_RATE_LIMITED = Counter(
+    "mcp_atlassian_upstream_rate_limited_total",
+    "Number of Atlassian HTTP responses with status 429 (rate limited).",
+    ("service",),
+)
+
+_METRICS: tuple[Counter | Histogram, ...] = (
+    TOOL_CALLS,
+    TOOL_DURATION,
+    UPSTREAM_REQUESTS,
+    UPSTREAM_DURATION,
+    UPSTREAM_RETRIES,
+    UPSTREAM_RATE_LIMITED,
+)
+
+
+def reset_metrics() -> None:
+    """Drop every recorded value (cache statistics are not affected)."""
+    for metric in _METRICS:
+        metric.reset()
+
+
+def record_tool_call(tool: str, seconds: float, *, failed: bool = False) -> None:
+    """Record a finished tool call.
+
+    Args:
+        tool: The registered tool name.
+        seconds: Duration of the call.
+        failed: Whether the call raised an error.
+    """
+    if not _enabled:
+        return
+    TOOL_CALLS.inc(tool, "error" if failed else "ok")
+    TOOL_DURATION.observe(seconds, tool)
+
+
+def normalize_endpoint(url: str) -> str:
+    """Reduce a request URL to a low-cardinality endpoint label.
+
+    The query string is dropped and every path segment containing a digit
+    (issue keys, numeric IDs, cloud IDs) is replaced with ``{id}``, except API
+    versions such as the ``2`` in ``/rest/api/2``.
+
+    Args:
+        url: The request URL.
+
+    Returns:
+        The normalized path, e.g. ``/rest/api/2/issue/{id}/comment``.
+    """
+    segments = urlsplit(url).path.split("/")
+    for i in range(1, len(segments)):
+        if _DIGIT.search(segments[i]) and segments[i - 1] not in _VERSIONED_SEGMENTS:
+            segments[i] = "{id}"
+    return "/".join(segments) or "/"
+
+
+def instrument_rest_client(client: Any, service: str) -> None:
+    """Record the HTTP requests and retries of an Atlassian REST client.
+
+    Does nothing while metrics are disabled.
+
+    Args:
+        client: An atlassian-python-api client (e.g. Jira or Confluence).
+        service: Service label, "jira" or "confluence".
+    """
+    if not _enabled:
+        return
+
+    def record_response(response: Any, *args: Any, **kwargs: Any) -> None:
+        if not _enabled:
+            return
+        method = response.request.method if response.request else "GET"
+        endpoint = normalize_endpoint(response.url)
+        UPSTREAM_REQUESTS.inc(service, method, endpoint, str(response.status_code))
+        UPSTREAM_DURATION.observe(
+            response.elapsed.total_seconds(), service, method, endpoint
+        )
+        if response.status_code == 429:
+            UPSTREAM_RATE_LIMITED.inc(service)
+
+    client._session.hooks["response"].append(record_response)
+
+    # The client decides per response whether to retry the request
+    retry_handler_factory = getattr(client, "_retry_handler", None)
+    if retry_handler_factory is None:
+        return
+
+    def counting_retry_handler() -> Callable[[Any], bool]:
+        handler = retry_handler_factory()
+
+        def handle(response: Any) -> bool:
+            retry = handler(response)
+            if retry and _enabled:
+                UPSTREAM_RETRIES.inc(service)
+            return retry
+
+        return handle
+
+    client._retry_handler = counting_retry_handler
+
+
+def render_metrics() -> str:
+    """Render all metrics and cache statistics in the Prometheus text format."""
+    lines: list[str] = []
+    for metric in _METRICS:
+        lines.extend(metric.render())
+
+    cache_stats = sorted(get_cache_stats().items())
+    for name, kind, documentation, value_of in (
+        (
+            "mcp_atlassian_cache_hits_total",
+            "counter",
+            "Number of shared cache lookups that found an entry.",
+            lambda stats: stats["hits"],
+        ),
+        (
+            "mcp_atlassian_cache_misses_total",
+            "counter",
+            "Number of shared cache lookups that found no entry.",
+            lambda stats: stats["misses"],
+        ),
+        (
+            "mcp_atlassian_cache_entries",
+            "gauge",
+            "Number of entries in a shared cache.",
+            lambda stats: stats["size"],
+        ),
+        (
+            "mcp_atlassian_cache_hit_ratio",
+            "gauge",
+            "Share of shared cache lookups that found an entry.",
+            lambda stats: stats["hits"] / lookups
+            if (lookups := stats["hits"] + stats["misses"])
+            else 0.0,
+        ),
+    ):
+        lines.append(f"# HELP {name} {documentation}")
+        lines.append(f"# TYPE {name} {kind}")
+        for cache, stats in cache_stats:
+            labels = _format_labels(("cache",), (cache,))
+            lines.append(f"{name}{labels} {_format_value(value_of(stats))}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,255 @@
+"""Opt-in profiling of slow tool calls.
+
+When ``MCP_PROFILE_DIR`` is set (or ``--profile-dir`` is passed), a sample of
+tool calls runs under ``cProfile``. Calls that take longer than a threshold
+leave two files in the dump directory:
+
+- ``<timestamp>-<tool>.prof``: the raw profile, readable with ``pstats`` or
+  viewers such as snakeviz;
+- ``<timestamp>-<tool>.json``: the tool name, its arguments with secrets
+  masked, the duration and the functions with the highest cumulative time.
+
+The sample rate and an hourly cap on the number of dumps keep both the CPU
+overhead and the disk usage bounded. Only one call is profiled at a time, and
+only in the thread that runs the tool, so work of other requests handled by the
+event loop while the tool awaits may show up in its profile.
+"""
+
+import cProfile
+import io
+import json
+import logging
+import os
+import pstats
+import random
+import re
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from .logging import mask_sensitive
+
+logger = logging.getLogger("mcp-atlassian.utils.profiling")
+
+DEFAULT_THRESHOLD_MS = 1000.0
+DEFAULT_SAMPLE_RATE = 0.1
+DEFAULT_MAX_DUMPS_PER_HOUR = 60
+
+# Number of functions listed in the summary of a dump
+SUMMARY_FUNCTIONS = 30
+
+_SECRET_ARGUMENT = re.compile(
+    r"token|secret|password|passwd|credential|authorization|api_?key", re.IGNORECASE
+)
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^A-Za-z0-9_.-]")
+
+
+@dataclass
+class ProfilingConfig:
+    """Settings of the slow tool call profiler."""
+
+    dump_dir: Path
+    threshold_ms: float = DEFAULT_THRESHOLD_MS
+    sample_rate: float = DEFAULT_SAMPLE_RATE
+    max_dumps_per_hour: int = DEFAULT_MAX_DUMPS_PER_HOUR
+
+    @classmethod
+    def from_env(cls) -> "ProfilingConfig | None":
+        """Create the configuration from environment variables.
+
+        Returns:
+            ProfilingConfig, or None if MCP_PROFILE_DIR is not set.
+        """
+        dump_dir = os.getenv("MCP_PROFILE_DIR")
+        if not dump_dir:
+            return None
+        return cls(
+            dump_dir=Path(dump_dir),
+            threshold_ms=_float_env("MCP_PROFILE_THRESHOLD_MS", DEFAULT_THRESHOLD_MS),
+            sample_rate=min(
+                max(_float_env("MCP_PROFILE_SAMPLE_RATE", DEFAULT_SAMPLE_RATE), 0.0),
+                1.0,
+            ),
+            max_dumps_per_hour=int(
+                _float_env("MCP_PROFILE_MAX_DUMPS_PER_HOUR", DEFAULT_MAX_DUMPS_PER_HOUR)
+            ),
+        )
+
+
+def _float_env(name: str, default: float) -> float:
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        logger.warning(f"Invalid {name} value '{value}', using {default}")
+        return default
+
+
+def mask_arguments(value: Any, name: str = "") -> Any:
+    """Mask the values of secret-looking tool arguments, recursively.
+
+    Args:
+        value: The arguments, or a nested value of them.
+        name: Name of the argument holding the value.
+
+    Returns:
+        A copy of the value with secrets masked.
+    """
+    if isinstance(value, dict):
+        return {key: mask_arguments(item, str(key)) for key, item in value.items()}
+    if isinstance(value, list | tuple):
+        return [mask_arguments(item, name) for item in value]
+    if name and _SECRET_ARGUMENT.search(name) and value is not None:
+        return mask_sensitive(str(value))
+    if value is None or isinstance(value, bool | int | float | str):
+        return value
+    return repr(value)
+
+
+class SlowCallProfiler:
+    """Profile sampled tool calls and dump those slower than a threshold."""
+
+    def __init__(
+        self,
+        config: ProfilingConfig,
+        timer: Callable[[], float] = time.monotonic,
+        sampler: Callable[[], float] = random.random,
+    ) -> None:
+        """Create a profiler.
+
+        Args:
+            config: The profiler settings.
+            timer: Clock used for the dump rate limit.
+            sampler: Source of random numbers in [0, 1) for sampling.
+        """
+        self.config = config
+        self._timer = timer
+        self._sampler = sampler
+        self._active = threading.Lock()
+        self._dump_times: deque[float] = deque()
+        self._dump_lock = threading.Lock()
+
+    @contextmanager
+    def profile(self, tool: str, arguments: dict[str, Any]) -> Iterator[None]:
+        """Profile a block if the call is sampled, dumping it if it was slow.
+
+        Args:
+            tool: Name of the tool being called.
+            arguments: The tool arguments.
+        """
+        if self._sampler() >= self.config.sample_rate or not self._active.acquire(
+            blocking=False
+        ):
+            yield
+            return
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # Another profiler is already running in this thread
+            self._active.release()
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            # Failed calls are dumped too, slow timeouts are worth a look
+            profiler.disable()
+            duration_ms = (time.perf_counter() - start) * 1000
+            self._active.release()
+            if duration_ms >= self.config.threshold_ms and self._reserve_dump():
+                try:
+                    self._dump(profiler, tool, arguments, duration_ms)
+                except OSError as e:
+                    logger.warning(f"Failed to write the profile of {tool}: {e}")
+
+    def _reserve_dump(self) -> bool:
+        """Count a dump against the hourly limit, if there is room left."""
+        now = self._timer()
+        with self._dump_lock:
+            while self._dump_times and now - self._dump_times[0] >= 3600:
+                self._dump_times.popleft()
+            if len(self._dump_times) >= self.config.max_dumps_per_hour:
+                return False
+            self._dump_times.append(now)
+            return True
+
+    def _dump(
+        self,
+        profiler: cProfile.Profile,
+        tool: str,
+        arguments: dict[str, Any],
+        duration_ms: float,
+    ) -> Path:
+        """Write the profile and its description to the dump directory.
+
+        Returns:
+            Path of the written profile.
+        """
+        now = datetime.now(timezone.utc)
+        stem = f"{now:%Y%m%dT%H%M%S%fZ}-{_UNSAFE_FILENAME_CHARS.sub('_', tool)}"
+        self.config.dump_dir.mkdir(parents=True, exist_ok=True)
+        profile_path = self.config.dump_dir / f"{stem}.prof"
+        profiler.dump_stats(profile_path)
+
+        summary = io.StringIO()
+        stats = pstats.Stats(profiler, stream=summary)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(SUMMARY_FUNCTIONS)
+        report = {
+            "tool": tool,
+            "arguments": mask_arguments(arguments),
+            "duration_ms": round(duration_ms, 1),
+            "timestamp": now.isoformat(),
+            "profile": profile_path.name,
+            "summary": summary.getvalue(),
+        }
+        (self.config.dump_dir / f"{stem}.json").write_text(
+            json.dumps(report, indent=2), encoding="utf-8"
+        )
+        logger.info(
+            f"Tool {tool} took {duration_ms:.0f} ms, profile written to {profile_path}"
+        )
+        return profile_path
+
+
+_profiler: SlowCallProfiler | None = None
+_profiler_loaded = False
+
+
+def get_slow_call_profiler() -> SlowCallProfiler | None:
+    """Get the process-wide profiler configured from the environment.
+
+    Returns:
+        The profiler, or None if profiling is not enabled.
+    """
+    global _profiler, _profiler_loaded
+    if not _profiler_loaded:
+        config = ProfilingConfig.from_env()
+        _profiler = SlowCallProfiler(config) if config else None
+        _profiler_loaded = True
+        if config:
+            logger.info(
+                f"Profiling {config.sample_rate:.0%} of tool calls, dumping calls "
+                f"slower than {config.threshold_ms:.0f} ms to {config.dump_dir}"
+            )
+    return _profiler
+
+
+def set_slow_call_profiler(profiler: SlowCallProfiler | None) -> None:
+    """Replace the process-wide profiler, e.g. to disable profiling.
+
+    Args:
+        profiler: The profiler to use, or None to disable profiling.
+    """
+    global _profiler, _profiler_loaded
+    _profiler = profiler
+    _profiler_loaded = True
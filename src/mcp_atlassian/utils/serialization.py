@@ -0,0 +1,132 @@
+"""JSON serialization utilities for MCP tool responses.
+
+Every tool returns its payload as a JSON string. This module centralises how
+that string is produced so the output format (pretty or compact) and the
+encoder backend (``orjson`` when installed, the standard library otherwise)
+can be chosen in one place.
+"""
+
+import json
+import logging
+import os
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None  # type: ignore[assignment]
+
+logger = logging.getLogger("mcp-atlassian.utils.serialization")
+
+JSON_FORMAT_ENV_VAR = "MCP_JSON_FORMAT"
+JSON_BACKEND_ENV_VAR = "MCP_JSON_BACKEND"
+
+JSON_FORMAT_PRETTY = "pretty"
+JSON_FORMAT_COMPACT = "compact"
+JSON_FORMATS = (JSON_FORMAT_PRETTY, JSON_FORMAT_COMPACT)
+
+JSON_BACKEND_AUTO = "auto"
+JSON_BACKEND_ORJSON = "orjson"
+JSON_BACKEND_STDLIB = "json"
+JSON_BACKENDS = (JSON_BACKEND_AUTO, JSON_BACKEND_ORJSON, JSON_BACKEND_STDLIB)
+
+
+def get_json_format() -> str:
+    """Get the configured tool response format.
+
+    Reads the ``MCP_JSON_FORMAT`` environment variable. Unknown values fall
+    back to the pretty (indented) format, which is the historical default.
+
+    Returns:
+        Either ``"pretty"`` or ``"compact"``.
+    """
+    value = os.getenv(JSON_FORMAT_ENV_VAR, JSON_FORMAT_PRETTY).strip().lower()
+    if value not in JSON_FORMATS:
+        logger.warning(
+            f"Invalid {JSON_FORMAT_ENV_VAR} '{value}', using '{JSON_FORMAT_PRETTY}'."
+        )
+        return JSON_FORMAT_PRETTY
+    return value
+
+
+def get_json_backend() -> str:
+    """Get the JSON encoder backend to use.
+
+    Reads the ``MCP_JSON_BACKEND`` environment variable (``auto``, ``orjson``
+    or ``json``). ``auto`` selects ``orjson`` when it is installed. Requesting
+    ``orjson`` without it being installed falls back to the standard library.
+
+    Returns:
+        Either ``"orjson"`` or ``"json"``.
+    """
+    value = os.getenv(JSON_BACKEND_ENV_VAR, JSON_BACKEND_AUTO).strip().lower()
+    if value not in JSON_BACKENDS:
+        logger.warning(
+            f"Invalid {JSON_BACKEND_ENV_VAR} '{value}', using '{JSON_BACKEND_AUTO}'."
+        )
+        value = JSON_BACKEND_AUTO
+    if value == JSON_BACKEND_STDLIB or orjson is None:
+        return JSON_BACKEND_STDLIB
+    return JSON_BACKEND_ORJSON
+
+
+def dumps_stdlib(data: Any, compact: bool = False) -> str:
+    """Serialize data with the standard library ``json`` module.
+
+    Args:
+        data: The JSON-compatible object to serialize.
+        compact: Whether to omit indentation and separator whitespace.
+
+    Returns:
+        The JSON string.
+    """
+    if compact:
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+def dumps_orjson(data: Any, compact: bool = False) -> str:
+    """Serialize data with ``orjson``.
+
+    Args:
+        data: The JSON-compatible object to serialize.
+        compact: Whether to omit indentation.
+
+    Returns:
+        The JSON string.
+
+    Raises:
+        RuntimeError: If orjson is not installed.
+    """
+    if orjson is None:
+        raise RuntimeError("orjson is not installed")
+    option = orjson.OPT_NON_STR_KEYS
+    if not compact:
+        option |= orjson.OPT_INDENT_2
+    return orjson.dumps(data, option=option).decode("utf-8")
+
+
+def dumps_response(data: Any, compact: bool | None = None) -> str:
+    """Serialize a tool response to a JSON string.
+
+    This is the single serialization entry point for the Jira and Confluence
+    tool modules. Non-ASCII characters are kept as-is in both formats.
+
+    Args:
+        data: The JSON-compatible object to serialize.
+        compact: Override the configured format. ``None`` uses
+            ``MCP_JSON_FORMAT``.
+
+    Returns:
+        The JSON string.
+    """
+    if compact is None:
+        compact = get_json_format() == JSON_FORMAT_COMPACT
+
+    if get_json_backend() == JSON_BACKEND_ORJSON:
+        try:
+            return dumps_orjson(data, compact=compact)
+        except TypeError as e:
+            # orjson is stricter than json (e.g. integers above 64 bits)
+            logger.debug(f"orjson could not serialize response, using json: {e}")
+    return dumps_stdlib(data, compact=compact)
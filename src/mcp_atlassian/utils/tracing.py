@@ -0,0 +1,276 @@
+"""Optional OpenTelemetry tracing of tool calls, fetcher methods and HTTP requests.
+
+Tracing is disabled unless ``MCP_TRACING_ENABLED`` is truthy and the
+``opentelemetry-api`` package is installed. When enabled, every tool call gets
+a span with child spans for the fetcher and preprocessor methods it runs and
+for each HTTP request sent to Atlassian. Shared cache lookups are recorded as
+span events. Work handed to thread pools is wrapped with in_current_context()
+so its spans keep their parent. When disabled, nothing is wrapped and the
+remaining hooks return after a single flag check.
+
+Spans go to the globally configured tracer provider (for example the one set
+up by ``opentelemetry-instrument``). When ``MCP_TRACING_FILE`` is set and
+``opentelemetry-sdk`` is installed, they are written to that file instead, one
+JSON object per line, for offline analysis.
+"""
+
+import contextvars
+import functools
+import inspect
+import logging
+import os
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import IO, Any, TypeVar
+from urllib.parse import urlsplit
+
+from .env import is_env_truthy
+
+try:
+    from opentelemetry import trace
+except ImportError:  # pragma: no cover - exercised when opentelemetry is absent
+    trace = None  # type: ignore[assignment]
+
+logger = logging.getLogger("mcp-atlassian.utils.tracing")
+
+T = TypeVar("T")
+
+TRACER_NAME = "mcp-atlassian"
+SERVICE_NAME = "mcp-atlassian"
+
+_enabled = is_env_truthy("MCP_TRACING_ENABLED") and trace is not None
+if is_env_truthy("MCP_TRACING_ENABLED") and trace is None:
+    logger.warning(
+        "MCP_TRACING_ENABLED is set but opentelemetry-api is not installed; "
+        "tracing is disabled"
+    )
+
+# Provider and file created by configure_tracing() for the file export
+_provider: Any = None
+_export_file: IO[str] | None = None
+
+
+def tracing_enabled() -> bool:
+    """Check whether spans are being recorded."""
+    return _enabled
+
+
+def set_tracing_enabled(*, enabled: bool) -> None:
+    """Enable or disable tracing.
+
+    Args:
+        enabled: Whether to record spans. Has no effect without
+            opentelemetry-api. Classes and clients set up while tracing was
+            disabled stay uninstrumented.
+    """
+    global _enabled
+    _enabled = enabled and trace is not None
+
+
+def _get_tracer() -> Any:
+    if _provider is not None:
+        return _provider.get_tracer(TRACER_NAME)
+    return trace.get_tracer(TRACER_NAME)
+
+
+def _span_to_json_line(span: Any) -> str:
+    return span.to_json(indent=None) + "\n"
+
+
+def configure_tracing(path: str | None = None) -> None:
+    """Export spans to a file when one is configured.
+
+    Does nothing while tracing is disabled, when no file is configured or when
+    the export is already set up.
+
+    Args:
+        path: File to append the spans to, one JSON object per line.
+            Defaults to ``MCP_TRACING_FILE``.
+    """
+    global _provider, _export_file
+    path = path or os.getenv("MCP_TRACING_FILE")
+    if not _enabled or not path or _provider is not None:
+        return
+    try:
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import (
+            BatchSpanProcessor,
+            ConsoleSpanExporter,
+        )
+    except ImportError:
+        logger.warning(
+            "MCP_TRACING_FILE is set but opentelemetry-sdk is not installed; "
+            "spans are not exported to a file"
+        )
+        return
+
+    _export_file = open(path, "a", encoding="utf-8")  # noqa: SIM115
+    provider = TracerProvider(
+        resource=Resource.create({"service.name": SERVICE_NAME}),
+        shutdown_on_exit=True,
+    )
+    provider.add_span_processor(
+        BatchSpanProcessor(
+            ConsoleSpanExporter(out=_export_file, formatter=_span_to_json_line)
+        )
+    )
+    _provider = provider
+    logger.info(f"Writing OpenTelemetry spans to {path}")
+
+
+def shutdown_tracing() -> None:
+    """Flush and close the file export set up by configure_tracing()."""
+    global _provider, _export_file
+    if _provider is None:
+        return
+    provider, _provider = _provider, None
+    provider.shutdown()
+    if _export_file is not None:
+        _export_file.close()
+        _export_file = None
+
+
+@contextmanager
+def start_span(name: str, attributes: dict[str, Any] | None = None) -> Iterator[Any]:
+    """Run a block inside a span, or without one while tracing is disabled.
+
+    Exceptions are recorded on the span and re-raised.
+
+    Args:
+        name: The span name.
+        attributes: Initial span attributes.
+
+    Yields:
+        The current span, or None while tracing is disabled.
+    """
+    if not _enabled:
+        yield None
+        return
+    with _get_tracer().start_as_current_span(name, attributes=attributes) as span:
+        yield span
+
+
+def in_current_context(func: Callable[..., T]) -> Callable[..., T]:
+    """Make a callable run in the caller's context when run on another thread.
+
+    The current span lives in a context variable, which thread pool workers
+    do not inherit. Wrap the function before submitting it to an executor so
+    that the spans it creates are children of the current span. While
+    tracing is disabled the function is returned unchanged.
+
+    Args:
+        func: The function to run on worker threads.
+
+    Returns:
+        A function that runs ``func`` in a copy of the current context.
+    """
+    if not _enabled:
+        return func
+    context = contextvars.copy_context()
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> T:
+        # A context can only be entered by one thread at a time
+        return context.copy().run(func, *args, **kwargs)
+
+    return wrapper
+
+
+def _traced_method(func: Callable[..., Any], span_name: str) -> Callable[..., Any]:
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        if not _enabled:
+            return func(*args, **kwargs)
+        with _get_tracer().start_as_current_span(span_name) as span:
+            result = func(*args, **kwargs)
+            if isinstance(result, list | dict | str):
+                span.set_attribute("mcp_atlassian.result.size", len(result))
+            return result
+
+    wrapper.__mcp_traced__ = True  # type: ignore[attr-defined]
+    return wrapper
+
+
+def instrument_methods(cls: type, prefix: str) -> None:
+    """Wrap the public methods of a class, including inherited ones, in spans.
+
+    Spans are named ``<prefix>.<method>``. Generators, coroutines, static and
+    class methods are left alone. Does nothing while tracing is disabled.
+
+    Args:
+        cls: The class to instrument, e.g. JiraFetcher.
+        prefix: Prefix of the span names, e.g. "jira".
+    """
+    if not _enabled:
+        return
+    for name in dir(cls):
+        if name.startswith("_"):
+            continue
+        attr = inspect.getattr_static(cls, name)
+        if (
+            not inspect.isfunction(attr)
+            or inspect.isgeneratorfunction(attr)
+            or inspect.iscoroutinefunction(attr)
+            or getattr(attr, "__mcp_traced__", False)
+        ):
+            continue
+        setattr(cls, name, _traced_method(attr, f"{prefix}.{name}"))
+
+
+def trace_rest_client(client: Any, service: str) -> None:
+    """Record a span for every HTTP request of an Atlassian REST client.
+
+    Does nothing while tracing is disabled.
+
+    Args:
+        client: An atlassian-python-api client (e.g. Jira or Confluence).
+        service: Service label, "jira" or "confluence".
+    """
+    if not _enabled:
+        return
+    from .metrics import normalize_endpoint
+
+    session = client._session
+    send = session.request
+
+    def request(method: str, url: str, *args: Any, **kwargs: Any) -> Any:
+        if not _enabled:
+            return send(method, url, *args, **kwargs)
+        endpoint = normalize_endpoint(url)
+        attributes = {
+            "http.request.method": method,
+            "url.path": endpoint,
+            "server.address": urlsplit(url).hostname or "",
+            "mcp_atlassian.service": service,
+        }
+        with _get_tracer().start_as_current_span(
+            f"{method} {endpoint}",
+            kind=trace.SpanKind.CLIENT,
+            attributes=attributes,
+        ) as span:
+            response = send(method, url, *args, **kwargs)
+            span.set_attribute("http.response.status_code", response.status_code)
+            # Streamed downloads are not read here
+            size = response.headers.get("Content-Length")
+            if size is None and not kwargs.get("stream"):
+                size = len(response.content)
+            if size is not None:
+                span.set_attribute("http.response.body.size", int(size))
+            return response
+
+    session.request = request
+
+
+def record_cache_lookup(cache: str, *, hit: bool) -> None:
+    """Add a cache hit or miss event to the current span.
+
+    Args:
+        cache: Name of the shared cache.
+        hit: Whether the lookup found an entry.
+    """
+    if not _enabled:
+        return
+    span = trace.get_current_span()
+    if span.is_recording():
+        span.add_event("cache.hit" if hit else "cache.miss", {"cache.name": cache})
@@ -0,0 +1,66 @@
+"""Benchmark per-issue parse and serialize costs of ``JiraIssue``.
+
+Measures ``JiraIssue.from_api_response`` and ``JiraIssue.to_simplified_dict``
+over a 1,000-issue result set and reports the cost per issue. ``parse-narrow``
+parses with a small field projection, as searches with explicit fields do.
+``search`` parses and serializes a whole ``JiraSearchResult`` on an instance
+with ``EXTRA_CUSTOM_FIELDS`` custom fields, requesting one of them by name.
+Run with::
+
+    uv run python -m tests.benchmarks.bench_jira_issue
+"""
+
+import timeit
+
+from mcp_atlassian.models.jira import JiraIssue, JiraSearchResult
+from tests.benchmarks.data import make_jira_search_response
+
+ISSUE_COUNT = 1000
+REPEAT = 5
+NARROW_FIELDS = "summary,status,assignee,updated"
+EXTRA_CUSTOM_FIELDS = 200
+
+
+def main() -> None:
+    issues_data = make_jira_search_response(ISSUE_COUNT)["issues"]
+
+    def parse() -> list[JiraIssue]:
+        return [
+            JiraIssue.from_api_response(data, requested_fields="*all")
+            for data in issues_data
+        ]
+
+    def parse_narrow() -> list[JiraIssue]:
+        return [
+            JiraIssue.from_api_response(data, requested_fields=NARROW_FIELDS)
+            for data in issues_data
+        ]
+
+    search_data = make_jira_search_response(ISSUE_COUNT, EXTRA_CUSTOM_FIELDS)
+
+    def search() -> None:
+        JiraSearchResult.from_api_response(
+            search_data, requested_fields=f"{NARROW_FIELDS},Custom Field 7"
+        ).to_simplified_dict()
+
+    issues = parse()
+
+    def serialize() -> None:
+        for issue in issues:
+            issue.to_simplified_dict()
+
+    print(
+        f"{'operation':>12} {'us/issue':>9}  ({ISSUE_COUNT} issues, best of {REPEAT})"
+    )
+    for name, func in (
+        ("parse", parse),
+        ("parse-narrow", parse_narrow),
+        ("serialize", serialize),
+        ("search", search),
+    ):
+        best = min(timeit.repeat(func, number=1, repeat=REPEAT))
+        print(f"{name:>12} {best / ISSUE_COUNT * 1e6:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
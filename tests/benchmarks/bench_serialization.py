@@ -0,0 +1,50 @@
+"""Benchmark tool response serialization on large search results.
+
+Compares the standard library encoder against orjson (when installed) in the
+pretty and compact formats. Run with::
+
+    uv run python -m tests.benchmarks.bench_serialization
+"""
+
+import timeit
+
+from mcp_atlassian.models.jira import JiraSearchResult
+from mcp_atlassian.utils import serialization
+from tests.benchmarks.data import make_jira_search_response
+
+SIZES = (50, 500)
+REPEAT = 5
+
+
+def _best_of(func: object, number: int) -> float:
+    timings = timeit.repeat(func, number=number, repeat=REPEAT)  # type: ignore[arg-type]
+    return min(timings) / number
+
+
+def main() -> None:
+    encoders = {"json": serialization.dumps_stdlib}
+    if serialization.orjson is not None:
+        encoders["orjson"] = serialization.dumps_orjson
+    else:
+        print("orjson is not installed; only the json backend is measured.")
+
+    print(f"{'issues':>6} {'backend':>7} {'format':>8} {'ms/call':>9} {'bytes':>10}")
+    for size in SIZES:
+        payload = JiraSearchResult.from_api_response(
+            make_jira_search_response(size), requested_fields="*all"
+        ).to_simplified_dict()
+        number = max(1, 2000 // size)
+        for name, encoder in encoders.items():
+            for compact in (False, True):
+                output = encoder(payload, compact=compact)
+                seconds = _best_of(
+                    lambda e=encoder, p=payload, c=compact: e(p, compact=c), number
+                )
+                print(
+                    f"{size:>6} {name:>7} {'compact' if compact else 'pretty':>8} "
+                    f"{seconds * 1000:>9.3f} {len(output.encode('utf-8')):>10}"
+                )
+
+
+if __name__ == "__main__":
+    main()
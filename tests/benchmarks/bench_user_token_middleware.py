@@ -0,0 +1,160 @@
+"""Benchmark the per-request overhead of UserTokenMiddleware.
+
+Compares the previous BaseHTTPMiddleware implementation ("before") with the
+pure ASGI one ("after") on a stand-in for the streamable-http endpoint that
+answers ``POST /mcp`` with a short event stream. Requests are driven straight
+through the ASGI interface so that no HTTP client cost is measured. Run with::
+
+    uv run python -m tests.benchmarks.bench_user_token_middleware
+"""
+
+import asyncio
+import logging
+import time
+from unittest.mock import MagicMock
+
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.requests import Request
+from starlette.responses import Response, StreamingResponse
+from starlette.routing import Route
+
+from mcp_atlassian.servers.main import UserTokenMiddleware
+from mcp_atlassian.utils.logging import mask_sensitive
+
+logger = logging.getLogger("mcp-atlassian.benchmarks")
+
+REQUESTS = 2000
+REPEAT = 3
+
+HEADERS = {
+    "none": [],
+    "bearer": [(b"authorization", b"Bearer benchmark-oauth-token")],
+}
+
+
+class BaseHTTPUserTokenMiddleware(BaseHTTPMiddleware):
+    """The hot path of the previous BaseHTTPMiddleware implementation."""
+
+    def __init__(self, app: object, mcp_server_ref: object) -> None:
+        super().__init__(app)  # type: ignore[arg-type]
+        self.mcp_server_ref = mcp_server_ref
+
+    async def dispatch(
+        self, request: Request, call_next: RequestResponseEndpoint
+    ) -> Response:
+        logger.debug(f"ENTERED for request path='{request.url.path}'")
+        mcp_path = self.mcp_server_ref.settings.streamable_http_path.rstrip("/")  # type: ignore[attr-defined]
+        request_path = request.url.path.rstrip("/")
+        logger.debug(f"Comparing request_path='{request_path}' with '{mcp_path}'")
+        if request_path == mcp_path and request.method == "POST":
+            auth_header = request.headers.get("Authorization")
+            cloud_id_header = request.headers.get("X-Atlassian-Cloud-Id")
+            logger.debug(
+                f"AuthHeader='{mask_sensitive(auth_header)}', CloudId='{cloud_id_header}'"
+            )
+            request.state.user_atlassian_cloud_id = (
+                cloud_id_header.strip() if cloud_id_header else None
+            )
+            if auth_header and auth_header.startswith("Bearer "):
+                token = auth_header.split(" ", 1)[1].strip()
+                logger.debug(f"Bearer token extracted: ...{mask_sensitive(token, 8)}")
+                request.state.user_atlassian_token = token
+                request.state.user_atlassian_auth_type = "oauth"
+                request.state.user_atlassian_email = None
+        response = await call_next(request)
+        logger.debug(f"EXITED for request path='{request.url.path}'")
+        return response
+
+
+async def _mcp_endpoint(request: Request) -> StreamingResponse:
+    async def events():  # noqa: ANN202
+        yield b'event: message\ndata: {"jsonrpc": "2.0", "id": 1, "result": {}}\n\n'
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
+def _make_app(middleware_class: type | None) -> Starlette:
+    mcp_server = MagicMock()
+    mcp_server.settings.streamable_http_path = "/mcp/"
+    middleware = (
+        [Middleware(middleware_class, mcp_server_ref=mcp_server)]
+        if middleware_class
+        else []
+    )
+    return Starlette(
+        routes=[Route("/mcp", _mcp_endpoint, methods=["POST"])],
+        middleware=middleware,
+    )
+
+
+async def _request(app: Starlette, headers: list[tuple[bytes, bytes]]) -> int:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": "/mcp",
+        "raw_path": b"/mcp",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"content-type", b"application/json"), *headers],
+        "client": ("127.0.0.1", 50000),
+        "server": ("testserver", 80),
+    }
+    status = 0
+    body_sent = False
+
+    async def receive() -> dict:
+        nonlocal body_sent
+        if body_sent:
+            # The client stays connected until the response is complete
+            await asyncio.Event().wait()
+        body_sent = True
+        return {"type": "http.request", "body": b"{}", "more_body": False}
+
+    async def send(message: dict) -> None:
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status
+
+
+async def _best_of(app: Starlette, headers: list[tuple[bytes, bytes]]) -> float:
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        for _ in range(REQUESTS):
+            await _request(app, headers)
+        best = min(best, (time.perf_counter() - start) / REQUESTS)
+    return best
+
+
+async def _run() -> None:
+    apps = {
+        "bare": _make_app(None),
+        "before": _make_app(BaseHTTPUserTokenMiddleware),
+        "after": _make_app(UserTokenMiddleware),
+    }
+    print(f"{'auth':>6} {'middleware':>10} {'us/request':>11} {'overhead':>9}")
+    for header_name, headers in HEADERS.items():
+        for app in apps.values():
+            assert await _request(app, headers) == 200
+        timings = {name: await _best_of(app, headers) for name, app in apps.items()}
+        for name, seconds in timings.items():
+            overhead = (seconds - timings["bare"]) * 1e6
+            print(
+                f"{header_name:>6} {name:>10} {seconds * 1e6:>11.1f} {overhead:>9.1f}"
+            )
+
+
+def main() -> None:
+    asyncio.run(_run())
+
+
+if __name__ == "__main__":
+    main()
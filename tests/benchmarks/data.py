@@ -0,0 +1,153 @@
+"""Synthetic, scaled-up API payloads for benchmarks.
+
+The payloads are derived from the static mocks in ``tests/fixtures`` so the
+benchmarks exercise the same shapes as the unit tests, just at volume.
+"""
+
+import copy
+from typing import Any
+
+from tests.fixtures.confluence_mocks import MOCK_PAGE_RESPONSE
+from tests.fixtures.jira_mocks import MOCK_JIRA_ISSUE_RESPONSE
+
+JIRA_MARKUP_BLOCK = """h2. Section {index}
+
+Some *bold* and _italic_ text with a [link|https://example.com/{index}], \
+{{{{inline code}}}} and a mention of [~accountid:user{index}].
+
+* First item
+** Nested item
+# Numbered item
+
+{{code:python}}
+def handler_{index}(event):
+    return event["id"]
+{{code}}
+
+||Key||Status||
+|PROJ-{index}|In Progress|
+
+bq. A quoted remark about issue {index}.
+"""
+
+MARKDOWN_BLOCK = """## Section {index}
+
+Some **bold** and *italic* text with a [link](https://example.com/{index}) and
+`inline code`.
+
+- First item
+  - Nested item
+1. Numbered item
+
+```python
+def handler_{index}(event):
+    return event["id"]
+```
+
+| Key | Status |
+| --- | --- |
+| PROJ-{index} | In Progress |
+
+> A quoted remark about issue {index}.
+"""
+
+STORAGE_BLOCK = """<h2>Section {index}</h2>
+<p>Some <strong>bold</strong> text with a
+<a href="https://example.com/{index}">link</a> and a mention of
+<ac:link><ri:user ri:account-id="user{index}" /></ac:link>.</p>
+<ul><li><p>First item</p></li><li><p>Second item</p></li></ul>
+<ac:structured-macro ac:name="code"><ac:parameter ac:name="language">python\
+</ac:parameter><ac:plain-text-body><![CDATA[def handler_{index}(event):
+    return event["id"]]]></ac:plain-text-body></ac:structured-macro>
+<table><tbody><tr><th>Key</th><th>Status</th></tr>
+<tr><td>PROJ-{index}</td><td>In Progress</td></tr></tbody></table>
+"""
+
+
+def make_jira_issue(index: int) -> dict[str, Any]:
+    """Create a unique Jira issue payload based on the mock issue.
+
+    Args:
+        index: Sequence number used to derive the issue id and key.
+
+    Returns:
+        A Jira REST API issue dictionary.
+    """
+    issue = copy.deepcopy(MOCK_JIRA_ISSUE_RESPONSE)
+    issue["id"] = str(100000 + index)
+    issue["key"] = f"PROJ-{index}"
+    issue["self"] = f"https://example.atlassian.net/rest/api/2/issue/{issue['id']}"
+    fields = issue["fields"]
+    fields["summary"] = f"Benchmark issue {index}"
+    fields["description"] = (
+        f"h2. Issue {index}\n\n"
+        + "Some *bold* text, a [link|https://example.com] and {{code}}.\n" * 20
+    )
+    return issue
+
+
+def make_jira_search_response(
+    count: int, extra_custom_fields: int = 0
+) -> dict[str, Any]:
+    """Create a Jira JQL search response containing ``count`` issues.
+
+    Args:
+        count: Number of issues in the response.
+        extra_custom_fields: Number of additional custom fields added to every
+            issue and to the ``names`` map, as on instances with many fields.
+
+    Returns:
+        A Jira REST API search response dictionary.
+    """
+    issues = [make_jira_issue(i) for i in range(1, count + 1)]
+    names = dict(MOCK_JIRA_ISSUE_RESPONSE["names"])
+    for n in range(extra_custom_fields):
+        field_id = f"customfield_{20000 + n}"
+        names[field_id] = f"Custom Field {n}"
+        for issue in issues:
+            issue["fields"][field_id] = None
+    return {
+        "expand": "schema,names",
+        "startAt": 0,
+        "maxResults": count,
+        "total": count,
+        "issues": issues,
+        "names": names,
+    }
+
+
+def make_jira_markup(blocks: int) -> str:
+    """Create Jira wiki markup with ``blocks`` sections of mixed formatting.
+
+    Args:
+        blocks: Number of sections (headings, lists, code, tables, quotes).
+
+    Returns:
+        Jira wiki markup text.
+    """
+    return "\n".join(JIRA_MARKUP_BLOCK.format(index=i) for i in range(blocks))
+
+
+def make_markdown(blocks: int) -> str:
+    """Create Markdown with ``blocks`` sections of mixed formatting.
+
+    Args:
+        blocks: Number of sections (headings, lists, code, tables, quotes).
+
+    Returns:
+        Markdown text.
+    """
+    return "\n".join(MARKDOWN_BLOCK.format(index=i) for i in range(blocks))
+
+
+def make_confluence_storage(blocks: int) -> str:
+    """Create a Confluence storage format body based on the mock page.
+
+    Args:
+        blocks: Number of sections appended to the body of the mock page.
+
+    Returns:
+        Confluence storage format (XHTML) text.
+    """
+    body = MOCK_PAGE_RESPONSE["body"]["storage"]["value"]
+    return body + "".join(STORAGE_BLOCK.format(index=i) for i in range(blocks))
@@ -0,0 +1,269 @@
+"""Offline micro-benchmark suite with stored baselines.
+
+Times the hot paths of text conversion, model parsing and search results on
+synthetic payloads from ``tests.benchmarks.data``, so no Atlassian instance
+is needed. Results can be saved as a baseline; later runs are compared with
+it and the command exits with status 1 when a benchmark got slower than the
+allowed threshold. Timings depend on the machine, so baselines are kept
+locally (``.benchmarks/`` is not committed). Run with::
+
+    uv run python -m tests.benchmarks.suite --save-baseline   # on main
+    uv run python -m tests.benchmarks.suite                   # on a branch
+    uv run python -m tests.benchmarks.suite -k search --repeat 10
+"""
+
+import argparse
+import json
+import platform
+import sys
+import timeit
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from mcp_atlassian.models.jira import JiraIssue, JiraSearchResult
+from mcp_atlassian.preprocessing.base import BasePreprocessor
+from mcp_atlassian.preprocessing.confluence import ConfluencePreprocessor
+from mcp_atlassian.preprocessing.jira import JiraPreprocessor
+from tests.benchmarks.data import (
+    make_confluence_storage,
+    make_jira_markup,
+    make_jira_search_response,
+    make_markdown,
+)
+
+BASELINE_PATH = Path(".benchmarks/baseline.json")
+
+# A benchmark regresses when it is this much slower than its baseline
+DEFAULT_THRESHOLD = 0.25
+REPEAT = 5
+
+CONVERSION_BLOCKS = (10, 100)
+MODEL_ISSUES = 100
+SEARCH_SIZES = (10, 100, 1000)
+
+BASE_URL = "https://example.atlassian.net"
+
+
+@dataclass
+class Benchmark:
+    """A named operation and the number of items it handles per call."""
+
+    name: str
+    func: Callable[[], object]
+    items: int = 1
+
+
+class _StubConfluenceClient:
+    """Answers user lookups without network access."""
+
+    def get_user_details_by_accountid(self, account_id: str) -> dict[str, Any]:
+        return {"displayName": f"User {account_id}"}
+
+    def get_user_details_by_username(self, username: str) -> dict[str, Any]:
+        return {"displayName": f"User {username}"}
+
+
+def build_benchmarks() -> list[Benchmark]:
+    """Create the benchmarks of the suite with their input data."""
+    jira_preprocessor = JiraPreprocessor(base_url=BASE_URL)
+    confluence_preprocessor = ConfluencePreprocessor(base_url=f"{BASE_URL}/wiki")
+    base_preprocessor = BasePreprocessor(base_url=f"{BASE_URL}/wiki")
+    confluence_client = _StubConfluenceClient()
+    benchmarks = []
+
+    for blocks in CONVERSION_BLOCKS:
+        markup = make_jira_markup(blocks)
+        markdown = make_markdown(blocks)
+        storage = make_confluence_storage(blocks)
+        benchmarks += [
+            Benchmark(
+                f"jira_to_markdown[{blocks}]",
+                lambda text=markup: jira_preprocessor.jira_to_markdown(text),
+            ),
+            Benchmark(
+                f"markdown_to_jira[{blocks}]",
+                lambda text=markdown: jira_preprocessor.markdown_to_jira(text),
+            ),
+            Benchmark(
+                f"process_html_content[{blocks}]",
+                lambda html=storage: base_preprocessor.process_html_content(
+                    html, space_key="PROJ", confluence_client=confluence_client
+                ),
+            ),
+            Benchmark(
+                f"markdown_to_confluence_storage[{blocks}]",
+                lambda text=markdown: (
+                    confluence_preprocessor.markdown_to_confluence_storage(text)
+                ),
+            ),
+        ]
+
+    issues_data = make_jira_search_response(MODEL_ISSUES)["issues"]
+    issues = [
+        JiraIssue.from_api_response(data, requested_fields="*all")
+        for data in issues_data
+    ]
+    benchmarks += [
+        Benchmark(
+            "issue_from_api_response",
+            lambda: [
+                JiraIssue.from_api_response(data, requested_fields="*all")
+                for data in issues_data
+            ],
+            items=MODEL_ISSUES,
+        ),
+        Benchmark(
+            "issue_to_simplified_dict",
+            lambda: [issue.to_simplified_dict() for issue in issues],
+            items=MODEL_ISSUES,
+        ),
+    ]
+
+    for size in SEARCH_SIZES:
+        search_data = make_jira_search_response(size)
+        benchmarks.append(
+            Benchmark(
+                f"search_result[{size}]",
+                lambda data=search_data: JiraSearchResult.from_api_response(
+                    data, requested_fields="*all"
+                ).to_simplified_dict(),
+                items=size,
+            )
+        )
+    return benchmarks
+
+
+def measure(func: Callable[[], object], repeat: int) -> float:
+    """Get the best time of one call in seconds.
+
+    The number of calls per round is chosen so that a round takes at least
+    0.2 seconds, which keeps timer noise low for fast operations.
+    """
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def load_baseline(path: Path) -> dict[str, Any] | None:
+    """Load a saved baseline, or None if there is none."""
+    if not path.exists():
+        return None
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def save_baseline(path: Path, results: dict[str, float]) -> None:
+    """Save results as the baseline, with the environment they ran in."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    baseline = {
+        "created": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "machine": platform.platform(),
+        "results": results,
+    }
+    path.write_text(json.dumps(baseline, indent=2) + "\n", encoding="utf-8")
+
+
+def find_regressions(
+    results: dict[str, float], baseline: dict[str, float], threshold: float
+) -> list[str]:
+    """Get the benchmarks that are slower than their baseline allows.
+
+    Args:
+        results: Seconds per call by benchmark name.
+        baseline: Baseline seconds per call by benchmark name.
+        threshold: Allowed slowdown, e.g. 0.25 for 25%.
+
+    Returns:
+        Names of the regressed benchmarks, in the order of ``results``.
+    """
+    return [
+        name
+        for name, seconds in results.items()
+        if name in baseline and seconds > baseline[name] * (1 + threshold)
+    ]
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        default=BASELINE_PATH,
+        help=f"baseline file (default: {BASELINE_PATH})",
+    )
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="save the results as the new baseline instead of comparing",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="allowed slowdown before a regression is flagged (default: 0.25)",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=REPEAT,
+        help=f"rounds per benchmark, the best one counts (default: {REPEAT})",
+    )
+    parser.add_argument(
+        "-k",
+        dest="filter",
+        default="",
+        help="only run benchmarks whose name contains this text",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    saved = None if args.save_baseline else load_baseline(args.baseline)
+    if saved and saved.get("python") != platform.python_version():
+        print(
+            f"Baseline was recorded with Python {saved.get('python')}, "
+            f"comparing anyway."
+        )
+    baseline: dict[str, float] = saved["results"] if saved else {}
+
+    results: dict[str, float] = {}
+    print(f"{'benchmark':<38} {'ms/call':>10} {'us/item':>9} {'change':>9}")
+    for benchmark in build_benchmarks():
+        if args.filter not in benchmark.name:
+            continue
+        seconds = measure(benchmark.func, args.repeat)
+        results[benchmark.name] = seconds
+        per_item = (
+            f"{seconds / benchmark.items * 1e6:.1f}" if benchmark.items > 1 else ""
+        )
+        line = f"{benchmark.name:<38} {seconds * 1e3:>10.3f} {per_item:>9}"
+        if benchmark.name in baseline:
+            change = seconds / baseline[benchmark.name] - 1
+            line += f" {change:>+9.1%}"
+        print(line)
+
+    if args.save_baseline:
+        if args.filter and (previous := load_baseline(args.baseline)):
+            # Keep the baselines of the benchmarks that were filtered out
+            results = {**previous["results"], **results}
+        save_baseline(args.baseline, results)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+    if not saved:
+        print(f"No baseline at {args.baseline}; run with --save-baseline first.")
+        return 0
+
+    regressions = find_regressions(results, baseline, args.threshold)
+    if regressions:
+        print(f"Regressions over {args.threshold:.0%}: {', '.join(regressions)}")
+        return 1
+    print(f"No regressions over {args.threshold:.0%}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,6 +8,7 @@ to provide efficient, reusable test fixtures.
 
 import pytest
 
+from mcp_atlassian.utils.cache import clear_all_caches
 from tests.utils.factories import (
     AuthConfigFactory,
     ConfluencePageFactory,
@@ -316,6 +317,24 @@ def parametrized_auth_env(request):
         raise ValueError(f"Unknown auth type: {auth_type}")
 
 
+# ============================================================================
+# Shared Cache Isolation
+# ============================================================================
+
+
+@pytest.fixture(autouse=True)
+def clear_shared_caches():
+    """
+    Clear the process-wide metadata caches around every test.
+
+    Fetchers in different tests share the same instance URL, so cached
+    metadata would otherwise leak from one test into the next.
+    """
+    clear_all_caches()
+    yield
+    clear_all_caches()
+
+
 # ============================================================================
 # Session Validation and Health Checks
 # ============================================================================
@@ -289,3 +289,63 @@ def test_init_no_proxies(monkeypatch):
     )
     client = JiraClient(config=config)
     assert mock_session.proxies == {}
+
+
+def _offset_pages(total, served_page_size=50, with_total=True):
+    """Build a fake offset-paginated endpoint returning numbered items."""
+    calls = []
+
+    def fetch_page(start, limit):
+        calls.append((start, limit))
+        count = max(0, min(limit, served_page_size, total - start))
+        page = {
+            "startAt": start,
+            "maxResults": min(limit, served_page_size),
+            "values": list(range(start, start + count)),
+        }
+        if with_total:
+            page["total"] = total
+        else:
+            page["isLast"] = start + count >= total
+        return page
+
+    return fetch_page, calls
+
+
+def test_iter_offset_paged_concurrent_with_total():
+    """Test remaining pages are fetched once the total is known."""
+    with patch("mcp_atlassian.jira.client.configure_ssl_verification"):
+        client = JiraClient(
+            config=JiraConfig(
+                url="https://test.atlassian.net",
+                auth_type="basic",
+                username="user",
+                api_token="token",
+            )
+        )
+    fetch_page, calls = _offset_pages(total=120, served_page_size=25)
+
+    pages = list(client.iter_offset_paged(fetch_page, "values", limit=110))
+
+    items = [item for page in pages for item in page["values"]]
+    assert items == list(range(110))
+    assert sorted(calls) == [(0, 50), (25, 50), (50, 50), (75, 35), (100, 10)]
+
+
+def test_iter_offset_paged_sequential_without_total():
+    """Test pages are followed until the last one when no total is reported."""
+    with patch("mcp_atlassian.jira.client.configure_ssl_verification"):
+        client = JiraClient(
+            config=JiraConfig(
+                url="https://test.atlassian.net",
+                auth_type="basic",
+                username="user",
+                api_token="token",
+            )
+        )
+    fetch_page, calls = _offset_pages(total=70, with_total=False)
+
+    pages = list(client.iter_offset_paged(fetch_page, "values", start=10))
+
+    assert [item for page in pages for item in page["values"]] == list(range(10, 70))
+    assert calls == [(10, 50), (60, 50)]
@@ -48,6 +48,21 @@ def test_from_env_token_auth():
         assert config.ssl_verify is False
 
 
+def test_from_env_catalog_cache_ttls():
+    """Test that from_env loads the project catalog cache TTLs."""
+    with patch.dict(
+        os.environ,
+        {
+            "JIRA_URL": "https://jira.example.com",
+            "JIRA_PERSONAL_TOKEN": "test_personal_token",
+            "JIRA_CATALOG_CACHE_TTLS": "projects=60,versions=0",
+        },
+        clear=True,
+    ):
+        config = JiraConfig.from_env()
+        assert config.catalog_cache_ttls == {"projects": 60, "versions": 0}
+
+
 def test_from_env_missing_url():
     """Test that from_env raises ValueError when URL is missing."""
     original_env = os.environ.copy()
@@ -0,0 +1,151 @@
+"""Tests for the Jira cycle time mixin."""
+
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from mcp_atlassian.jira import JiraFetcher
+from mcp_atlassian.jira.cycle_time import CycleTimeCalculator, summarize_durations
+from mcp_atlassian.models.jira import JiraIssue, JiraSearchResult
+from mcp_atlassian.models.jira.common import JiraChangelog
+
+STATUS_CATEGORIES = {"1": "new", "2": "indeterminate", "3": "done"}
+STATUS_NAMES = {"1": "To Do", "2": "In Progress", "3": "Done"}
+
+
+def _transition(created: str, from_id: str, to_id: str) -> JiraChangelog:
+    return JiraChangelog.from_api_response(
+        {
+            "id": created,
+            "created": created,
+            "items": [
+                {
+                    "field": "status",
+                    "from": from_id,
+                    "fromString": STATUS_NAMES[from_id],
+                    "to": to_id,
+                    "toString": STATUS_NAMES[to_id],
+                }
+            ],
+        }
+    )
+
+
+CREATED = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def test_summarize_durations():
+    """Test percentiles are interpolated between the sorted values."""
+    assert summarize_durations([4.0, 1.0, 3.0, 2.0, 5.0]) == {
+        "count": 5,
+        "mean": 3.0,
+        "p50": 3.0,
+        "p85": 4.4,
+        "p95": 4.8,
+        "max": 5.0,
+    }
+    assert summarize_durations([]) == {"count": 0}
+
+
+def test_calculator_add_issue():
+    """Test dwell, cycle and lead times of a completed issue."""
+    calculator = CycleTimeCalculator(STATUS_CATEGORIES)
+    calculator.add_issue(
+        CREATED,
+        "3",
+        [
+            _transition("2024-01-01T10:00:00.000Z", "1", "2"),
+            _transition("2024-01-01T12:00:00.000Z", "2", "1"),
+            _transition("2024-01-01T13:00:00.000Z", "1", "2"),
+            _transition("2024-01-02T01:00:00.000Z", "2", "3"),
+        ],
+    )
+
+    summary = calculator.summary()
+
+    assert summary["completed_issues"] == 1
+    assert summary["lead_time"]["max"] == 25.0
+    assert summary["cycle_time"]["max"] == 15.0
+    assert summary["statuses"]["status"] == ["In Progress", "To Do"]
+    assert summary["statuses"]["mean"] == [14.0, 11.0]
+
+
+def test_calculator_open_issue_has_no_lead_time():
+    """Test the current status of unfinished issues is not counted."""
+    calculator = CycleTimeCalculator(STATUS_CATEGORIES)
+    calculator.add_issue(
+        CREATED, "2", [_transition("2024-01-01T10:00:00.000Z", "1", "2")]
+    )
+    calculator.add_issue(CREATED, "1", [])
+
+    summary = calculator.summary()
+
+    assert summary["issue_count"] == 2
+    assert summary["completed_issues"] == 0
+    assert summary["cycle_time"] == {"count": 0}
+    assert summary["statuses"] == {
+        "status": ["To Do"],
+        "count": [1],
+        "mean": [10.0],
+        "p50": [10.0],
+        "p85": [10.0],
+        "p95": [10.0],
+        "max": [10.0],
+    }
+
+
+class TestCycleTimeMixin:
+    """Tests for the CycleTimeMixin class."""
+
+    @pytest.fixture
+    def cycle_time_fetcher(self, jira_fetcher: JiraFetcher) -> JiraFetcher:
+        jira_fetcher.config.url = "https://test.atlassian.net"
+        jira_fetcher.jira.get_all_statuses.return_value = [
+            {"id": status_id, "statusCategory": {"key": category}}
+            for status_id, category in STATUS_CATEGORIES.items()
+        ]
+        jira_fetcher.search_issues = MagicMock(
+            return_value=JiraSearchResult(
+                issues=[
+                    JiraIssue.from_api_response(
+                        {
+                            "id": issue_id,
+                            "key": f"TEST-{issue_id}",
+                            "fields": {
+                                "created": "2024-01-01T00:00:00.000+0000",
+                                "status": {"id": status_id, "name": "Status"},
+                            },
+                        }
+                    )
+                    for issue_id, status_id in (("10", "3"), ("11", "1"))
+                ],
+                total=2,
+            )
+        )
+        return jira_fetcher
+
+    def test_get_cycle_time_report(self, cycle_time_fetcher):
+        """Test changelogs are streamed and merged across pages per issue."""
+        cycle_time_fetcher.iter_changelogs = MagicMock(
+            return_value=iter(
+                [
+                    ("10", [_transition("2024-01-01T10:00:00.000Z", "1", "2")]),
+                    ("10", [_transition("2024-01-02T10:00:00.000Z", "2", "3")]),
+                ]
+            )
+        )
+
+        report = cycle_time_fetcher.get_cycle_time_report("project = TEST")
+
+        cycle_time_fetcher.search_issues.assert_called_once_with(
+            "project = TEST", fields="created,status", limit=1000
+        )
+        cycle_time_fetcher.iter_changelogs.assert_called_once_with(
+            ["10", "11"], fields=["status"]
+        )
+        assert report["jql"] == "project = TEST"
+        assert report["issue_count"] == 2
+        assert report["lead_time"]["p50"] == 34.0
+        assert report["cycle_time"]["p50"] == 24.0
+        assert report["statuses"]["status"] == ["In Progress", "To Do"]
@@ -5,6 +5,7 @@ from unittest.mock import MagicMock, call
 import pytest
 
 from mcp_atlassian.jira import JiraFetcher
+from mcp_atlassian.jira.cache import epic_strategy_cache
 from mcp_atlassian.jira.epics import EpicsMixin
 from mcp_atlassian.models.jira import JiraIssue
 
@@ -648,15 +649,11 @@ class TestEpicsMixin:
         # Call the method with start parameter
         result = epics_mixin.get_epic_issues("EPIC-123", start=5, limit=10)
 
-        # Verify search_issues was called with the right JQL
-        epics_mixin.search_issues.assert_called_once()
-        call_args = epics_mixin.search_issues.call_args[0]
-        assert 'issueFunction in issuesScopedToEpic("EPIC-123")' in call_args[0]
-
-        # Verify keyword arguments for start and limit
-        call_kwargs = epics_mixin.search_issues.call_args[1]
-        assert call_kwargs.get("start") == 5
-        assert call_kwargs.get("limit") == 10
+        # Verify search_issues was called with the right JQL; the other
+        # strategies are probed concurrently
+        epics_mixin.search_issues.assert_any_call(
+            'issueFunction in issuesScopedToEpic("EPIC-123")', start=5, limit=10
+        )
 
         # Verify result
         assert len(result) == 2
@@ -754,6 +751,76 @@ class TestEpicsMixin:
         assert last_call_kwargs.get("start") == 3
         assert last_call_kwargs.get("limit") == 10
 
+    def test_get_epic_issues_prefers_highest_priority_winner(self, epics_mixin):
+        """Test that concurrent probing returns the highest-priority results."""
+        epics_mixin.jira.get_issue.return_value = {
+            "key": "EPIC-123",
+            "fields": {"issuetype": {"name": "Epic"}},
+        }
+        epics_mixin.get_field_ids_to_epic = MagicMock(
+            return_value={"epic_link": "customfield_10014"}
+        )
+
+        def search_side_effect(jql, **kwargs):
+            if jql.startswith("parent"):
+                return MagicMock(issues=[JiraIssue(key="PARENT-1")])
+            if "customfield_10014" in jql:
+                return MagicMock(issues=[JiraIssue(key="FIELD-1")])
+            raise ValueError("unsupported JQL")
+
+        epics_mixin.search_issues = MagicMock(side_effect=search_side_effect)
+
+        result = epics_mixin.get_epic_issues("EPIC-123")
+
+        assert [issue.key for issue in result] == ["PARENT-1"]
+        cache_key = (*epics_mixin._cache_scope(), "EPIC")
+        assert epic_strategy_cache.get(cache_key) == "parent"
+
+    def test_get_epic_issues_uses_cached_strategy(self, epics_mixin):
+        """Test that a cached winning strategy is tried alone."""
+        epics_mixin.jira.get_issue.return_value = {
+            "key": "EPIC-123",
+            "fields": {"issuetype": {"name": "Epic"}},
+        }
+        epics_mixin.get_field_ids_to_epic = MagicMock()
+        epic_strategy_cache.set(
+            (*epics_mixin._cache_scope(), "EPIC"), "field:customfield_10008"
+        )
+        epics_mixin.search_issues = MagicMock(
+            return_value=MagicMock(issues=[JiraIssue(key="CHILD-1")])
+        )
+
+        result = epics_mixin.get_epic_issues("EPIC-123", limit=5)
+
+        assert [issue.key for issue in result] == ["CHILD-1"]
+        epics_mixin.search_issues.assert_called_once_with(
+            '"customfield_10008" = "EPIC-123"', start=0, limit=5
+        )
+        epics_mixin.get_field_ids_to_epic.assert_not_called()
+
+    def test_get_epic_issues_cached_strategy_failure_reprobes(self, epics_mixin):
+        """Test that a failing cached strategy is dropped and probing resumes."""
+        epics_mixin.jira.get_issue.return_value = {
+            "key": "EPIC-123",
+            "fields": {"issuetype": {"name": "Epic"}},
+        }
+        epics_mixin.get_field_ids_to_epic = MagicMock(return_value={})
+        epics_mixin._find_epic_link_field = MagicMock(return_value=None)
+        cache_key = (*epics_mixin._cache_scope(), "EPIC")
+        epic_strategy_cache.set(cache_key, "epicLinkName")
+
+        def search_side_effect(jql, **kwargs):
+            if jql.startswith("parent"):
+                return MagicMock(issues=[JiraIssue(key="CHILD-1")])
+            raise ValueError("Field 'Epic Link' does not exist")
+
+        epics_mixin.search_issues = MagicMock(side_effect=search_side_effect)
+
+        result = epics_mixin.get_epic_issues("EPIC-123")
+
+        assert [issue.key for issue in result] == ["CHILD-1"]
+        assert epic_strategy_cache.get(cache_key) == "parent"
+
     def test_get_epic_issues_api_error(self, epics_mixin: EpicsMixin):
         """Test get_epic_issues with API error."""
         # Setup mocks - simulate API error
@@ -300,6 +300,53 @@ class TestFieldsMixin:
             project="TEST", issue_type_id="10001"
         )
 
+    def test_get_required_fields_shared_cache(self, fields_mixin: FieldsMixin):
+        """Test required fields are reused by later fetchers."""
+        fields_mixin.get_project_issue_types = MagicMock(
+            return_value=[{"id": "10001", "name": "Bug"}]
+        )
+        fields_mixin.jira.issue_createmeta_fieldtypes.return_value = {
+            "fields": [{"required": True, "name": "Summary", "fieldId": "summary"}]
+        }
+
+        first = fields_mixin.get_required_fields("Bug", "TEST")
+        other = JiraFetcher(config=fields_mixin.config)
+        other.jira = fields_mixin.jira
+        second = other.get_required_fields("bug", "TEST")
+
+        assert (
+            first
+            == second
+            == {"summary": {"required": True, "name": "Summary", "fieldId": "summary"}}
+        )
+        fields_mixin.jira.issue_createmeta_fieldtypes.assert_called_once()
+
+    def test_prefetch_create_metadata(self, fields_mixin: FieldsMixin):
+        """Test prefetching loads the required fields of every issue type."""
+        fields_mixin.jira.issue_createmeta.return_value = {
+            "projects": [
+                {
+                    "key": "TEST",
+                    "issuetypes": [
+                        {"id": "10001", "name": "Bug"},
+                        {"id": "10002", "name": "Task"},
+                    ],
+                }
+            ]
+        }
+        fields_mixin.jira.issue_createmeta_fieldtypes.return_value = {"fields": []}
+
+        fields_mixin.prefetch_create_metadata(["TEST"])
+
+        fields_mixin.jira.issue_createmeta.assert_called_once_with(project="TEST")
+        assert fields_mixin.jira.issue_createmeta_fieldtypes.call_count == 2
+
+        # Creation-time lookups are now served from the cache
+        fields_mixin.get_required_fields("Task", "TEST")
+        fields_mixin.get_project_issue_types("TEST")
+        fields_mixin.jira.issue_createmeta.assert_called_once()
+        assert fields_mixin.jira.issue_createmeta_fieldtypes.call_count == 2
+
     def test_get_jira_field_ids_cached(self, fields_mixin: FieldsMixin):
         """Test get_field_ids_to_epic returns cached field IDs."""
         # Set up the cache
@@ -337,6 +384,45 @@ class TestFieldsMixin:
         assert "Epic Name" in result
         assert result["epic_name"] == "customfield_10011"
 
+    def test_get_jira_field_ids_shared_epic_schema(
+        self, fields_mixin: FieldsMixin, mock_fields: list[dict]
+    ):
+        """Test the epic schema is reused across fetchers until invalidated."""
+        fields_mixin.jira.get_all_fields.return_value = mock_fields
+
+        first = fields_mixin.get_field_ids_to_epic()
+        # A new fetcher for the same instance starts with an empty field cache
+        fields_mixin._field_ids_cache = None
+        second = fields_mixin.get_field_ids_to_epic()
+
+        assert second == first
+        assert fields_mixin.jira.get_all_fields.call_count == 1
+
+        # Fallback discoveries are recorded in the cached schema
+        fields_mixin.remember_epic_field("epic_color", "customfield_10013")
+        assert fields_mixin.get_field_ids_to_epic()["epic_color"] == (
+            "customfield_10013"
+        )
+
+        fields_mixin.invalidate_epic_schema()
+        fields_mixin._field_ids_cache = None
+        assert "epic_color" not in fields_mixin.get_field_ids_to_epic()
+        assert fields_mixin.jira.get_all_fields.call_count == 2
+
+    def test_remember_epic_field_after_invalidation(
+        self, fields_mixin: FieldsMixin, mock_fields: list[dict]
+    ):
+        """Test a working fallback field is recorded even without a cached schema."""
+        fields_mixin.jira.get_all_fields.return_value = mock_fields
+        fields_mixin.get_field_ids_to_epic()
+        fields_mixin.invalidate_epic_schema()
+
+        fields_mixin.remember_epic_field("epic_link", "customfield_10008")
+
+        schema = fields_mixin.get_field_ids_to_epic()
+        assert schema["epic_link"] == "customfield_10008"
+        assert schema["epic_name"] == "customfield_10011"
+
     def test_get_jira_field_ids_error(self, fields_mixin: FieldsMixin):
         """Test get_field_ids_to_epic handles errors gracefully."""
         # Ensure no cache exists
@@ -3,6 +3,7 @@
 from unittest.mock import ANY, MagicMock, patch
 
 import pytest
+from requests.exceptions import HTTPError
 
 from mcp_atlassian.jira import JiraFetcher
 from mcp_atlassian.jira.issues import IssuesMixin, logger
@@ -690,6 +691,138 @@ class TestIssuesMixin:
         # Call the method with status in kwargs instead of fields
         issues_mixin.update_issue(issue_key="TEST-123", status="In Progress")
 
+        # The transition is posted directly with the looked up ID
+        issues_mixin.jira.post.assert_called_once_with(
+            f"{issues_mixin.jira.resource_url.return_value}/TEST-123/transitions",
+            data={"transition": {"id": 21}},
+        )
+
+    def test_update_issue_narrow_uses_returned_issue(self, issues_mixin: IssuesMixin):
+        """Test that a narrow update on Cloud uses the edit response."""
+        issues_mixin.jira.put.return_value = {
+            "id": "12345",
+            "key": "TEST-123",
+            "fields": {"summary": "Updated Summary"},
+        }
+
+        document = issues_mixin.update_issue(
+            issue_key="TEST-123",
+            fields={"summary": "Updated Summary"},
+            response_mode="narrow",
+        )
+
+        issues_mixin.jira.put.assert_called_once_with(
+            f"{issues_mixin.jira.resource_url.return_value}/TEST-123",
+            data={"fields": {"summary": "Updated Summary"}},
+            params={"returnIssue": "true"},
+        )
+        issues_mixin.jira.update_issue.assert_not_called()
+        issues_mixin.jira.get_issue.assert_not_called()
+        assert document.to_simplified_dict() == {
+            "id": "12345",
+            "key": "TEST-123",
+            "summary": "Updated Summary",
+        }
+
+    def test_update_issue_narrow_fetches_written_fields(
+        self, issues_mixin: IssuesMixin, jira_config_factory
+    ):
+        """Test that a narrow update on Server/DC fetches only written fields."""
+        fetcher = issues_mixin
+        fetcher.config = jira_config_factory(url="https://jira.example.com")
+        fetcher.jira.get_issue.return_value = {
+            "id": "12345",
+            "key": "TEST-123",
+            "fields": {"summary": "Updated Summary", "labels": ["a"]},
+        }
+
+        document = fetcher.update_issue(
+            issue_key="TEST-123",
+            fields={"summary": "Updated Summary", "labels": ["a"]},
+            response_mode="narrow",
+        )
+
+        fetcher.jira.update_issue.assert_called_once()
+        fetcher.jira.get_issue.assert_called_once_with(
+            "TEST-123", fields="labels,summary", update_history=False
+        )
+        assert document.to_simplified_dict() == {
+            "id": "12345",
+            "key": "TEST-123",
+            "labels": ["a"],
+            "summary": "Updated Summary",
+        }
+
+    def test_update_issue_response_mode_none(self, issues_mixin: IssuesMixin):
+        """Test that response_mode 'none' skips the re-fetch."""
+        result = issues_mixin.update_issue(
+            issue_key="TEST-123",
+            fields={"summary": "Updated Summary"},
+            response_mode="none",
+        )
+
+        assert result is None
+        issues_mixin.jira.update_issue.assert_called_once()
+        issues_mixin.jira.get_issue.assert_not_called()
+
+    def test_update_issue_response_mode_none_keeps_attachments(
+        self, issues_mixin: IssuesMixin
+    ):
+        """Test that response_mode 'none' still returns the attachment results."""
+        upload_result = {"success": [{"filename": "a.txt"}], "failed": []}
+        issues_mixin.upload_attachments = MagicMock(return_value=upload_result)
+
+        result = issues_mixin.update_issue(
+            issue_key="TEST-123",
+            response_mode="none",
+            attachments=["/tmp/a.txt"],
+        )
+
+        assert result is not None
+        assert result.key == "TEST-123"
+        assert result.custom_fields["attachment_results"] == upload_result
+        issues_mixin.upload_attachments.assert_called_once_with(
+            "TEST-123", ["/tmp/a.txt"]
+        )
+        issues_mixin.jira.get_issue.assert_not_called()
+
+    def test_create_issue_response_modes(self, issues_mixin: IssuesMixin):
+        """Test that create_issue honours narrow and none response modes."""
+        issues_mixin.jira.create_issue.return_value = {
+            "id": "10001",
+            "key": "TEST-1",
+        }
+        issues_mixin.jira.get_issue.return_value = {
+            "id": "10001",
+            "key": "TEST-1",
+            "fields": {"summary": "New Issue", "issuetype": {"name": "Task"}},
+        }
+
+        none_issue = issues_mixin.create_issue(
+            project_key="TEST",
+            summary="New Issue",
+            issue_type="Task",
+            response_mode="none",
+        )
+        assert none_issue.to_simplified_dict() == {"id": "10001", "key": "TEST-1"}
+        issues_mixin.jira.get_issue.assert_not_called()
+
+        narrow_issue = issues_mixin.create_issue(
+            project_key="TEST",
+            summary="New Issue",
+            issue_type="Task",
+            response_mode="narrow",
+        )
+        issues_mixin.jira.get_issue.assert_called_once_with(
+            "TEST-1", fields="issuetype,project,summary", update_history=False
+        )
+        assert narrow_issue.to_simplified_dict() == {
+            "id": "10001",
+            "key": "TEST-1",
+            "summary": "New Issue",
+            "issue_type": {"name": "Task"},
+        }
+
     def test_update_issue_unassign(self, issues_mixin: IssuesMixin):
         """Test unassigning an issue."""
         issue_data = {
@@ -1221,12 +1354,98 @@ class TestIssuesMixin:
         """Test batch_get_changelogs method on non-cloud instance."""
         issues_mixin.config = MagicMock()
         issues_mixin.config.is_cloud = False
+        issues_mixin.jira.jql.return_value = {
+            "issues": [
+                {
+                    "id": "10002",
+                    "key": "TEST-2",
+                    "changelog": {"histories": []},
+                },
+                {
+                    "id": "10001",
+                    "key": "TEST-1",
+                    "changelog": {
+                        "histories": [
+                            {
+                                "id": "1",
+                                "created": "2024-01-05T10:06:03.548+0800",
+                                "items": [
+                                    {
+                                        "field": "status",
+                                        "fromString": "Open",
+                                        "toString": "Done",
+                                    },
+                                    {"field": "summary", "toString": "New"},
+                                ],
+                            },
+                            {
+                                "id": "2",
+                                "created": "2024-01-06T10:06:03.548+0800",
+                                "items": [{"field": "labels", "toString": "a"}],
+                            },
+                        ]
+                    },
+                },
+            ]
+        }
+
+        result = issues_mixin.batch_get_changelogs(
+            issue_ids_or_keys=["TEST-1", "10002"],
+            fields=["status", "description"],
+        )
+
+        issues_mixin.jira.jql.assert_called_once_with(
+            'issuekey in ("TEST-1", "10002")',
+            fields="key",
+            limit=2,
+            expand="changelog",
+        )
+        # Issues keep the requested order and changes are filtered by field
+        assert [issue.id for issue in result] == ["10001", "10002"]
+        assert len(result[0].changelogs) == 1
+        assert [item.field for item in result[0].changelogs[0].items] == ["status"]
+        assert result[1].changelogs == []
+
+    def test_batch_get_changelogs_not_cloud_chunks(self, issues_mixin: IssuesMixin):
+        """Test batch_get_changelogs searches Server/DC issues in chunks."""
+        issues_mixin.config = MagicMock()
+        issues_mixin.config.is_cloud = False
+        issues_mixin.jira.jql.side_effect = lambda jql, **kwargs: {
+            "issues": [
+                {"id": ref, "key": f"TEST-{ref}"}
+                for ref in jql[len("issuekey in (") : -1].replace('"', "").split(", ")
+            ]
+        }
+        refs = [str(i) for i in range(120)]
 
-        with pytest.raises(NotImplementedError):
-            issues_mixin.batch_get_changelogs(
-                issue_ids_or_keys=["TEST-123"],
-                fields=["summary", "description"],
-            )
+        result = issues_mixin.batch_get_changelogs(issue_ids_or_keys=refs)
+
+        assert issues_mixin.jira.jql.call_count == 3
+        assert [issue.id for issue in result] == refs
+
+    def test_batch_get_changelogs_not_cloud_missing_key(
+        self, issues_mixin: IssuesMixin
+    ):
+        """Test a missing key on Server/DC only drops that issue."""
+        issues_mixin.config = MagicMock()
+        issues_mixin.config.is_cloud = False
+
+        def jql(query, **kwargs):
+            if "TEST-404" in query:
+                response = MagicMock(status_code=400)
+                raise HTTPError("400 Bad Request", response=response)
+            key = query[len('issuekey in ("') : -2]
+            return {"issues": [{"id": key[5:], "key": key}]}
+
+        issues_mixin.jira.jql.side_effect = jql
+
+        result = issues_mixin.batch_get_changelogs(
+            issue_ids_or_keys=["TEST-1", "TEST-404", "TEST-2"]
+        )
+
+        # The whole chunk, then each issue on its own
+        assert issues_mixin.jira.jql.call_count == 4
+        assert [issue.id for issue in result] == ["1", "2"]
 
     def test_batch_get_changelogs_cloud(self, issues_mixin: IssuesMixin):
         """Test batch_get_changelogs method on cloud instance."""
@@ -1437,8 +1656,8 @@ class TestIssuesMixin:
             },
         ]
 
-        # Mock the get_paged method
-        issues_mixin.get_paged = MagicMock(return_value=mock_get_paged_result)
+        # Mock the iter_paged method
+        issues_mixin.iter_paged = MagicMock(return_value=iter(mock_get_paged_result))
 
         # Call the method
         result = issues_mixin.batch_get_changelogs(
@@ -1451,7 +1670,7 @@ class TestIssuesMixin:
         assert simplified_result == expected_result
 
         # Verify the method was called with the correct arguments
-        issues_mixin.get_paged.assert_called_once_with(
+        issues_mixin.iter_paged.assert_called_once_with(
             method="post",
             url=issues_mixin.jira.resource_url("changelog/bulkfetch"),
             params_or_json={
@@ -1460,6 +1679,74 @@ class TestIssuesMixin:
             },
         )
 
+    def test_batch_get_changelogs_cloud_chunks(self, issues_mixin: IssuesMixin):
+        """Test the Cloud bulk changelog API is called in chunks of issues."""
+        issues_mixin.config = MagicMock()
+        issues_mixin.config.is_cloud = True
+        issues_mixin.iter_paged = MagicMock(
+            side_effect=lambda **kwargs: iter(
+                [
+                    {
+                        "issueChangeLogs": [
+                            {"issueId": issue_id, "changeHistories": []}
+                            for issue_id in kwargs["params_or_json"]["issueIdsOrKeys"]
+                        ]
+                    }
+                ]
+            )
+        )
+        refs = [str(i) for i in range(2500)]
+
+        result = issues_mixin.batch_get_changelogs(issue_ids_or_keys=refs)
+
+        requests = [
+            call.kwargs["params_or_json"]["issueIdsOrKeys"]
+            for call in issues_mixin.iter_paged.call_args_list
+        ]
+        assert [len(chunk) for chunk in requests] == [1000, 1000, 500]
+        assert [issue.id for issue in result] == refs
+
+    def test_batch_get_changelogs_stops_at_limit(self, issues_mixin: IssuesMixin):
+        """Test batch_get_changelogs stops paging once every issue is complete."""
+        issues_mixin.config = MagicMock()
+        issues_mixin.config.is_cloud = True
+        fetched_pages = []
+
+        def pages(**kwargs):
+            for page in range(10):
+                fetched_pages.append(page)
+                yield {
+                    "issueChangeLogs": [
+                        {
+                            "issueId": issue_id,
+                            "changeHistories": [
+                                {"id": f"{issue_id}-{page}-{i}"} for i in range(2)
+                            ],
+                        }
+                        for issue_id in ("1", "2")
+                    ],
+                    "nextPageToken": str(page + 1),
+                }
+
+        issues_mixin.iter_paged = MagicMock(side_effect=pages)
+
+        result = issues_mixin.batch_get_changelogs(
+            issue_ids_or_keys=["TEST-1", "TEST-2"], fields=["status"], limit=3
+        )
+
+        assert fetched_pages == [0, 1]
+        assert [len(issue.changelogs) for issue in result] == [3, 3]
+        assert [changelog.id for changelog in result[0].changelogs] == [
+            "1-0-0",
+            "1-0-1",
+            "1-1-0",
+        ]
+        request = issues_mixin.iter_paged.call_args.kwargs["params_or_json"]
+        assert request == {
+            "issueIdsOrKeys": ["TEST-1", "TEST-2"],
+            "fieldIds": ["status"],
+        }
+
     def test_create_issue_with_labels(self, issues_mixin: IssuesMixin):
         """Test creating an issue with labels in additional_fields."""
         # Mock create_issue response
@@ -132,6 +132,35 @@ def test_get_all_projects_non_list_response(projects_mixin: ProjectsMixin):
     projects_mixin.jira.projects.assert_called_once()
 
 
+def test_get_all_projects_cached(
+    projects_mixin: ProjectsMixin, mock_projects: list[dict]
+):
+    """Test the project catalog is cached and shared by derived lookups."""
+    projects_mixin.config.catalog_cache_ttls = None
+    projects_mixin.jira.projects.return_value = mock_projects
+
+    assert projects_mixin.get_all_projects() == mock_projects
+    assert projects_mixin.get_project_keys() == ["PROJ1", "PROJ2"]
+    assert projects_mixin.get_project_leads() == {"PROJ1": "user1", "PROJ2": "user2"}
+    projects_mixin.jira.projects.assert_called_once_with(included_archived=False)
+
+    # Archived projects are a separate catalog entry
+    projects_mixin.get_all_projects(include_archived=True)
+    assert projects_mixin.jira.projects.call_count == 2
+
+
+def test_get_all_projects_cache_disabled(
+    projects_mixin: ProjectsMixin, mock_projects: list[dict]
+):
+    """Test a TTL of zero disables caching for that kind of data."""
+    projects_mixin.config.catalog_cache_ttls = {"projects": 0}
+    projects_mixin.jira.projects.return_value = mock_projects
+
+    projects_mixin.get_all_projects()
+    projects_mixin.get_all_projects()
+    assert projects_mixin.jira.projects.call_count == 2
+
+
 def test_get_project(projects_mixin: ProjectsMixin, mock_projects: list[dict]):
     """Test get_project method."""
     project = mock_projects[0]
@@ -432,6 +461,27 @@ def test_get_project_issue_types(
     projects_mixin.jira.issue_createmeta.assert_called_once_with(project="PROJ1")
 
 
+def test_get_project_issue_types_shared_cache(
+    projects_mixin: ProjectsMixin, mock_issue_types: list[dict]
+):
+    """Test issue types are cached process-wide per instance and credentials."""
+    projects_mixin.jira.issue_createmeta.return_value = {
+        "projects": [{"key": "PROJ1", "issuetypes": mock_issue_types}]
+    }
+
+    assert projects_mixin.get_project_issue_types("PROJ1") == mock_issue_types
+    # A new fetcher with the same configuration reuses the cached result
+    other = JiraFetcher(config=projects_mixin.config)
+    other.jira = projects_mixin.jira
+    assert other.get_project_issue_types("PROJ1") == mock_issue_types
+    projects_mixin.jira.issue_createmeta.assert_called_once_with(project="PROJ1")
+
+    # Different credentials may see different issue types
+    projects_mixin.config.api_token = "other-token"
+    projects_mixin.get_project_issue_types("PROJ1")
+    assert projects_mixin.jira.issue_createmeta.call_count == 2
+
+
 def test_get_project_issue_types_empty_response(projects_mixin: ProjectsMixin):
     """Test get_project_issue_types method with empty response."""
     # Empty projects list
@@ -630,18 +680,32 @@ def test_get_project_leads_exception(projects_mixin: ProjectsMixin):
         projects_mixin.get_all_projects.assert_called_once()
 
 
+def _browse_users_by_project(responses: dict[str, Any]):
+    """Build a side effect answering browse permission checks per project."""
+
+    def side_effect(username: str, project_key: str, limit: int):
+        response = responses[project_key]
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    return side_effect
+
+
 def test_get_user_accessible_projects(
     projects_mixin: ProjectsMixin, mock_projects: list[dict[str, Any]]
 ):
     """Test get_user_accessible_projects method."""
+    projects_mixin.config.is_cloud = False
     # Mock the get_all_projects method
     with patch.object(projects_mixin, "get_all_projects", return_value=mock_projects):
         # Set up the browse permission responses
-        browse_users_responses = [
-            [{"name": "test_user"}],  # User has access to PROJ1
-            [],  # User doesn't have access to PROJ2
-        ]
-        projects_mixin.jira.get_users_with_browse_permission_to_a_project.side_effect = browse_users_responses
+        projects_mixin.jira.get_users_with_browse_permission_to_a_project.side_effect = _browse_users_by_project(
+            {
+                "PROJ1": [{"name": "test_user"}],  # User has access to PROJ1
+                "PROJ2": [],  # User doesn't have access to PROJ2
+            }
+        )
 
         result = projects_mixin.get_user_accessible_projects("test_user")
 
@@ -654,25 +718,106 @@ def test_get_user_accessible_projects(
             projects_mixin.jira.get_users_with_browse_permission_to_a_project.call_count
             == 2
         )
+        # Projects are checked concurrently, so the call order is not fixed
         projects_mixin.jira.get_users_with_browse_permission_to_a_project.assert_has_calls(
             [
                 call(username="test_user", project_key="PROJ1", limit=1),
                 call(username="test_user", project_key="PROJ2", limit=1),
-            ]
+            ],
+            any_order=True,
         )
 
 
+def test_get_user_accessible_projects_cached(
+    projects_mixin: ProjectsMixin, mock_projects: list[dict[str, Any]]
+):
+    """Test browse permissions are cached per user and project."""
+    projects_mixin.config.is_cloud = False
+    check = projects_mixin.jira.get_users_with_browse_permission_to_a_project
+    check.side_effect = _browse_users_by_project(
+        {"PROJ1": [{"name": "test_user"}], "PROJ2": []}
+    )
+    with patch.object(projects_mixin, "get_all_projects", return_value=mock_projects):
+        first = projects_mixin.get_user_accessible_projects("test_user")
+        second = projects_mixin.get_user_accessible_projects("test_user")
+        assert first == second
+        assert check.call_count == 2
+
+        # Another user is checked separately
+        projects_mixin.get_user_accessible_projects("other_user")
+        assert check.call_count == 4
+
+
+def test_get_user_accessible_projects_limit(projects_mixin: ProjectsMixin):
+    """Test the scan stops once enough accessible projects are found."""
+    projects_mixin.config.is_cloud = False
+    projects = [{"id": str(i), "key": f"P{i}"} for i in range(50)]
+    projects_mixin.jira.get_users_with_browse_permission_to_a_project.return_value = [
+        {"name": "test_user"}
+    ]
+    with patch.object(projects_mixin, "get_all_projects", return_value=projects):
+        result = projects_mixin.get_user_accessible_projects("test_user", limit=2)
+
+    assert [project["key"] for project in result] == ["P0", "P1"]
+
+
+def test_get_user_accessible_projects_cloud_bulk(
+    projects_mixin: ProjectsMixin, mock_projects: list[dict[str, Any]]
+):
+    """Test Jira Cloud checks all projects with the bulk permission endpoint."""
+    projects_mixin.config.is_cloud = True
+    projects_mixin._get_account_id = MagicMock(return_value="account-1")
+    projects_mixin.jira.post.return_value = {
+        "projectPermissions": [
+            {"permission": "BROWSE_PROJECTS", "projects": [10000], "issues": []}
+        ]
+    }
+    with patch.object(projects_mixin, "get_all_projects", return_value=mock_projects):
+        result = projects_mixin.get_user_accessible_projects("test_user")
+
+    assert [project["key"] for project in result] == ["PROJ1"]
+    projects_mixin.jira.post.assert_called_once_with(
+        "rest/api/3/permissions/check",
+        json={
+            "accountId": "account-1",
+            "projectPermissions": [
+                {"permissions": ["BROWSE_PROJECTS"], "projects": [10000, 10001]}
+            ],
+        },
+    )
+    projects_mixin.jira.get_users_with_browse_permission_to_a_project.assert_not_called()
+
+
+def test_get_user_accessible_projects_cloud_bulk_fallback(
+    projects_mixin: ProjectsMixin, mock_projects: list[dict[str, Any]]
+):
+    """Test a failing bulk check falls back to per-project checks."""
+    projects_mixin.config.is_cloud = True
+    projects_mixin._get_account_id = MagicMock(return_value="account-1")
+    projects_mixin.jira.post.side_effect = Exception("Forbidden")
+    projects_mixin.jira.get_users_with_browse_permission_to_a_project.side_effect = (
+        _browse_users_by_project({"PROJ1": [], "PROJ2": [{"name": "test_user"}]})
+    )
+    with patch.object(projects_mixin, "get_all_projects", return_value=mock_projects):
+        result = projects_mixin.get_user_accessible_projects("test_user")
+
+    assert [project["key"] for project in result] == ["PROJ2"]
+
+
 def test_get_user_accessible_projects_with_permissions_exception(
     projects_mixin: ProjectsMixin, mock_projects: list[dict[str, Any]]
 ):
     """Test get_user_accessible_projects method with exception in permissions check."""
+    projects_mixin.config.is_cloud = False
     # Mock the get_all_projects method
     with patch.object(projects_mixin, "get_all_projects", return_value=mock_projects):
         # First call succeeds, second call raises exception
-        projects_mixin.jira.get_users_with_browse_permission_to_a_project.side_effect = [
-            [{"name": "test_user"}],  # User has access to PROJ1
-            Exception("Permission error"),  # Error checking PROJ2
-        ]
+        projects_mixin.jira.get_users_with_browse_permission_to_a_project.side_effect = _browse_users_by_project(
+            {
+                "PROJ1": [{"name": "test_user"}],  # User has access to PROJ1
+                "PROJ2": Exception("Permission error"),  # Error checking PROJ2
+            }
+        )
 
         result = projects_mixin.get_user_accessible_projects("test_user")
 
@@ -746,3 +891,35 @@ def test_create_project_version_error(projects_mixin: ProjectsMixin) -> None:
     ):
         with pytest.raises(Exception):
             projects_mixin.create_project_version("PROJ4", "v6.0")
+
+
+def test_create_project_version_invalidates_catalog(
+    projects_mixin: ProjectsMixin, mock_components: list[dict]
+) -> None:
+    """Test creating a version drops the cached versions of the project."""
+    projects_mixin.config.catalog_cache_ttls = None
+    projects_mixin.jira.get_project_versions.return_value = [
+        {"id": "100", "name": "v1.0"}
+    ]
+    projects_mixin.jira.get_project_components.return_value = mock_components
+
+    assert [v["name"] for v in projects_mixin.get_project_versions("PROJ1")] == ["v1.0"]
+    projects_mixin.get_project_versions("PROJ2")
+    projects_mixin.get_project_components("PROJ1")
+    assert projects_mixin.jira.get_project_versions.call_count == 2
+
+    projects_mixin.jira.get_project_versions.return_value = [
+        {"id": "100", "name": "v1.0"},
+        {"id": "101", "name": "v1.1"},
+    ]
+    with patch.object(projects_mixin, "create_version", return_value={"id": "101"}):
+        projects_mixin.create_project_version("PROJ1", "v1.1")
+
+    assert len(projects_mixin.get_project_versions("PROJ1")) == 2
+    # Other projects keep their cached versions
+    projects_mixin.get_project_versions("PROJ2")
+    assert projects_mixin.jira.get_project_versions.call_count == 3
+
+    projects_mixin.invalidate_project_catalog()
+    projects_mixin.get_project_components("PROJ1")
+    assert projects_mixin.jira.get_project_components.call_count == 2
@@ -489,6 +489,30 @@ class TestSearchMixin:
         assert "Issue description" in issue.description
         assert issue.key == "TEST-123"
 
+    def test_get_board_issues_pages_to_limit(self, search_mixin: SearchMixin):
+        """Test get_board_issues fetches further pages up to the limit."""
+
+        def get_issues_for_board(start, limit, **kwargs):
+            return {
+                "issues": [
+                    {"id": str(i), "key": f"TEST-{i}", "fields": {}}
+                    for i in range(start, min(start + limit, 130))
+                ],
+                "total": 130,
+                "startAt": start,
+                "maxResults": limit,
+            }
+
+        search_mixin.jira.get_issues_for_board.side_effect = get_issues_for_board
+
+        result = search_mixin.get_board_issues("1000", jql="", limit=120)
+
+        assert [issue.key for issue in result.issues] == [
+            f"TEST-{i}" for i in range(120)
+        ]
+        assert result.total == 130
+        assert search_mixin.jira.get_issues_for_board.call_count == 3
+
     def test_get_board_issues_exception(self, search_mixin: SearchMixin):
         search_mixin.jira.get_issues_for_board.side_effect = Exception("API Error")
 
@@ -0,0 +1,172 @@
+"""Tests for the Jira sprint analytics mixin."""
+
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from mcp_atlassian.jira import JiraFetcher
+from mcp_atlassian.jira.cache import sprint_analytics_cache
+from mcp_atlassian.jira.sprint_analytics import build_sprint_report
+from mcp_atlassian.models.jira import JiraIssue
+from mcp_atlassian.models.jira.common import JiraChangelog
+
+SPRINT = {
+    "id": 7,
+    "name": "Sprint 7",
+    "state": "closed",
+    "startDate": "2024-01-01T09:00:00.000Z",
+    "endDate": "2024-01-03T17:00:00.000Z",
+    "completeDate": "2024-01-03T17:00:00.000Z",
+}
+
+ISSUES = [
+    {
+        "id": "1",
+        "key": "TEST-1",
+        "fields": {"status": {"id": "3"}, "customfield_10016": 5},
+    },
+    {
+        "id": "2",
+        "key": "TEST-2",
+        "fields": {"status": {"id": "1"}, "customfield_10016": 3},
+    },
+    {
+        "id": "3",
+        "key": "TEST-3",
+        "fields": {"status": {"id": "3"}, "customfield_10016": 2},
+    },
+]
+
+
+def _changelog(created, field, **values):
+    return JiraChangelog.from_api_response(
+        {"id": created, "created": created, "items": [{"field": field, **values}]}
+    )
+
+
+CHANGELOGS = {
+    # Done on the second day
+    "1": [_changelog("2024-01-02T12:00:00.000Z", "status", **{"from": "1", "to": "3"})],
+    # Re-estimated from 1 to 3 during the sprint and never finished
+    "2": [
+        _changelog(
+            "2024-01-01T12:00:00.000Z", "Story Points", fromString="1", toString="3"
+        )
+    ],
+    # Added on the second day and finished on the last day
+    "3": [
+        _changelog("2024-01-02T10:00:00.000Z", "Sprint", **{"from": "", "to": "6, 7"}),
+        _changelog("2024-01-03T10:00:00.000Z", "status", **{"from": "1", "to": "3"}),
+    ],
+}
+
+
+def test_build_sprint_report():
+    """Test the report replays the changelogs over the sprint."""
+    report = build_sprint_report(
+        SPRINT,
+        ISSUES,
+        CHANGELOGS,
+        done_status_ids={"3"},
+        estimate_field="customfield_10016",
+        estimate_field_name="Story Points",
+    )
+
+    assert report["committed"] == 6.0
+    assert report["committed_issues"] == 2
+    assert report["completed"] == 7.0
+    assert report["completed_issues"] == 2
+    assert report["added"] == 2.0
+    assert report["carry_over"] == [{"issue_key": "TEST-2", "points": 3.0}]
+    assert report["burndown"] == {
+        "date": ["2024-01-01", "2024-01-02", "2024-01-03"],
+        "remaining": [8.0, 5.0, 3.0],
+        "ideal": pytest.approx([4.39, 1.82, 0.0], abs=0.01),
+    }
+    assert [change["type"] for change in report["scope_changes"]] == [
+        "estimate_changed",
+        "added",
+    ]
+
+
+def test_build_sprint_report_counts_issues_without_estimate():
+    """Test issues are counted when there is no estimate field."""
+    report = build_sprint_report(
+        {**SPRINT, "completeDate": None, "state": "active"},
+        ISSUES[:2],
+        {},
+        done_status_ids={"3"},
+        now=datetime(2024, 1, 2, tzinfo=timezone.utc),
+    )
+
+    assert report["committed"] == 2.0
+    assert report["completed"] == 1.0
+    assert report["burndown"]["date"] == ["2024-01-01", "2024-01-02"]
+
+
+class TestSprintAnalyticsMixin:
+    """Tests for the SprintAnalyticsMixin class."""
+
+    @pytest.fixture
+    def analytics_fetcher(self, jira_fetcher: JiraFetcher) -> JiraFetcher:
+        jira_fetcher.jira.get_sprint.return_value = SPRINT
+        jira_fetcher.jira.get.return_value = {
+            "issues": ISSUES,
+            "total": 3,
+            "maxResults": 50,
+        }
+        jira_fetcher.jira.get_all_statuses.return_value = [
+            {"id": "1", "statusCategory": {"key": "new"}},
+            {"id": "3", "statusCategory": {"key": "done"}},
+        ]
+        jira_fetcher.get_field_id = MagicMock(
+            side_effect=lambda name: {"Story Points": "customfield_10016"}.get(name)
+        )
+        jira_fetcher.get_field_by_id = MagicMock(
+            return_value={"id": "customfield_10016", "name": "Story Points"}
+        )
+        jira_fetcher.batch_get_changelogs = MagicMock(
+            return_value=[
+                JiraIssue(id=issue_id, changelogs=changelogs)
+                for issue_id, changelogs in CHANGELOGS.items()
+            ]
+        )
+        return jira_fetcher
+
+    def test_get_sprint_report_cached_for_closed_sprints(self, analytics_fetcher):
+        """Test closed sprint reports are computed once and kept for a day."""
+        first = analytics_fetcher.get_sprint_report("7")
+        second = analytics_fetcher.get_sprint_report("7")
+
+        assert first == second
+        assert first["completed"] == 7.0
+        analytics_fetcher.batch_get_changelogs.assert_called_once_with(
+            ["TEST-1", "TEST-2", "TEST-3"],
+            fields=["status", "customfield_10016"],
+        )
+        assert analytics_fetcher.jira.get.call_args.kwargs["params"]["fields"] == (
+            "status,customfield_10016"
+        )
+        assert sprint_analytics_cache.stats()["hits"] == 1
+
+    def test_get_sprint_report_unknown_estimate_field(self, analytics_fetcher):
+        """Test an explicit estimate field must exist."""
+        with pytest.raises(ValueError, match="Estimate field 'Effort' not found"):
+            analytics_fetcher.get_sprint_report("7", estimate_field="Effort")
+
+    def test_get_board_velocity(self, analytics_fetcher):
+        """Test the velocity report covers the most recent closed sprints."""
+        analytics_fetcher.jira.get_all_sprints_from_board.return_value = {
+            "isLast": True,
+            "values": [
+                {**SPRINT, "id": 6, "completeDate": "2023-12-29T17:00:00.000Z"},
+                SPRINT,
+            ],
+        }
+
+        velocity = analytics_fetcher.get_board_velocity("1000", sprint_count=1)
+
+        assert velocity["sprint_id"] == ["7"]
+        assert velocity["completed"] == [7.0]
+        assert velocity["average_velocity"] == 7.0
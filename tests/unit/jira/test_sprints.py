@@ -86,6 +86,31 @@ def test_get_all_sprints_from_board(sprints_mixin, mock_sprints):
     assert result == mock_sprints["values"]
 
 
+def test_get_all_sprints_from_board_pages(sprints_mixin):
+    """Test get_all_sprints_from_board follows pages until the last one."""
+    sprints_mixin.jira.get_all_sprints_from_board.side_effect = [
+        {
+            "maxResults": 50,
+            "startAt": 0,
+            "isLast": False,
+            "values": [{"id": i} for i in range(50)],
+        },
+        {
+            "maxResults": 50,
+            "startAt": 50,
+            "isLast": True,
+            "values": [{"id": i} for i in range(50, 60)],
+        },
+    ]
+
+    result = sprints_mixin.get_all_sprints_from_board("1000", limit=100)
+
+    assert [sprint["id"] for sprint in result] == list(range(60))
+    sprints_mixin.jira.get_all_sprints_from_board.assert_called_with(
+        board_id="1000", state=None, start=50, limit=50
+    )
+
+
 def test_get_all_sprints_from_board_exception(sprints_mixin):
     """Test get_all_sprints_from_board method with exception."""
     sprints_mixin.jira.get_all_sprints_from_board.side_effect = Exception("API Error")
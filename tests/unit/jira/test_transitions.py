@@ -3,6 +3,7 @@
 from unittest.mock import MagicMock
 
 import pytest
+from requests.exceptions import HTTPError
 
 from mcp_atlassian.jira import JiraFetcher
 from mcp_atlassian.jira.transitions import TransitionsMixin
@@ -48,6 +49,7 @@ class TestTransitionsMixin:
             )
         ]
         mixin.get_transitions_models = MagicMock(return_value=mock_transitions)
+        mixin.jira.resource_url.return_value = "rest/api/2/issue"
 
         return mixin
 
@@ -122,10 +124,12 @@ class TestTransitionsMixin:
         # Call the method
         result = transitions_mixin.transition_issue("TEST-123", "10")
 
-        # Verify
-        transitions_mixin.jira.set_issue_status.assert_called_once_with(
-            issue_key="TEST-123", status_name="In Progress", fields=None, update=None
+        # Verify the transition is posted directly, without a lookup
+        transitions_mixin.jira.post.assert_called_once_with(
+            "rest/api/2/issue/TEST-123/transitions", data={"transition": {"id": 10}}
         )
+        transitions_mixin.get_transitions_models.assert_not_called()
+        transitions_mixin.jira.set_issue_status.assert_not_called()
         transitions_mixin.get_issue.assert_called_once_with("TEST-123")
         assert isinstance(result, JiraIssue)
         assert result.key == "TEST-123"
@@ -137,9 +141,8 @@ class TestTransitionsMixin:
         # Call the method with int ID
         transitions_mixin.transition_issue("TEST-123", 10)
 
-        # Verify status name is used instead of ID
-        transitions_mixin.jira.set_issue_status.assert_called_once_with(
-            issue_key="TEST-123", status_name="In Progress", fields=None, update=None
+        transitions_mixin.jira.post.assert_called_once_with(
+            "rest/api/2/issue/TEST-123/transitions", data={"transition": {"id": 10}}
         )
 
     def test_transition_issue_with_fields(self, transitions_mixin: TransitionsMixin):
@@ -153,12 +156,10 @@ class TestTransitionsMixin:
         fields = {"summary": "Updated"}
         transitions_mixin.transition_issue("TEST-123", "10", fields=fields)
 
-        # Verify fields were passed correctly
-        transitions_mixin.jira.set_issue_status.assert_called_once_with(
-            issue_key="TEST-123",
-            status_name="In Progress",
-            fields={"summary": "Updated"},
-            update=None,
+        # Verify fields are sent with the transition
+        transitions_mixin.jira.post.assert_called_once_with(
+            "rest/api/2/issue/TEST-123/transitions",
+            data={"transition": {"id": 10}, "fields": {"summary": "Updated"}},
         )
 
     def test_transition_issue_with_empty_sanitized_fields(
@@ -172,9 +173,9 @@ class TestTransitionsMixin:
         fields = {"invalid": "field"}
         transitions_mixin.transition_issue("TEST-123", "10", fields=fields)
 
-        # Verify fields were passed as None
-        transitions_mixin.jira.set_issue_status.assert_called_once_with(
-            issue_key="TEST-123", status_name="In Progress", fields=None, update=None
+        # Verify no fields were sent
+        transitions_mixin.jira.post.assert_called_once_with(
+            "rest/api/2/issue/TEST-123/transitions", data={"transition": {"id": 10}}
         )
 
     def test_transition_issue_with_comment(self, transitions_mixin: TransitionsMixin):
@@ -197,20 +198,19 @@ class TestTransitionsMixin:
         # Verify _add_comment_to_transition_data was called
         transitions_mixin._add_comment_to_transition_data.assert_called_once()
 
-        # Verify set_issue_status was called with the right parameters
-        transitions_mixin.jira.set_issue_status.assert_called_once_with(
-            issue_key="TEST-123",
-            status_name="In Progress",
-            fields=None,
-            update={"comment": [{"add": {"body": comment}}]},
+        # Verify the comment is sent with the transition
+        transitions_mixin.jira.post.assert_called_once_with(
+            "rest/api/2/issue/TEST-123/transitions",
+            data={
+                "transition": {"id": 10},
+                "update": {"comment": [{"add": {"body": comment}}]},
+            },
         )
 
     def test_transition_issue_with_error(self, transitions_mixin: TransitionsMixin):
         """Test transition_issue error handling."""
         # Setup mock to raise exception
-        transitions_mixin.jira.set_issue_status.side_effect = Exception(
-            "Transition error"
-        )
+        transitions_mixin.jira.post.side_effect = Exception("Transition error")
 
         # Call the method and verify exception
         with pytest.raises(
@@ -219,39 +219,28 @@ class TestTransitionsMixin:
         ):
             transitions_mixin.transition_issue("TEST-123", "10")
 
-    def test_transition_issue_without_status_name(
-        self, transitions_mixin: TransitionsMixin
-    ):
-        """Test transition_issue when status name is not available."""
-        # Setup - create a transition without to_status
-        mock_transitions = [
-            JiraTransition(
-                id="10",
-                name="Start Progress",
-                to_status=None,
-            )
-        ]
-        transitions_mixin.get_transitions_models = MagicMock(
-            return_value=mock_transitions
+    def test_transition_issue_rejected(self, transitions_mixin: TransitionsMixin):
+        """Test a rejected transition reports the available transitions."""
+        response = MagicMock(status_code=400)
+        transitions_mixin.jira.post.side_effect = HTTPError(
+            "400 Bad Request", response=response
         )
 
-        # Add mock for set_issue_status_by_transition_id
-        transitions_mixin.jira.set_issue_status_by_transition_id = MagicMock()
+        with pytest.raises(ValueError, match=r"Available transitions: 10 \(Start"):
+            transitions_mixin.transition_issue("TEST-123", "99")
+        transitions_mixin.get_transitions_models.assert_called_once_with("TEST-123")
 
-        # Call the method
-        result = transitions_mixin.transition_issue("TEST-123", "10")
-
-        # Verify direct transition ID was used
-        transitions_mixin.jira.set_issue_status_by_transition_id.assert_called_once_with(
-            issue_key="TEST-123", transition_id=10
+    def test_transition_issue_without_refetch(
+        self, transitions_mixin: TransitionsMixin
+    ):
+        """Test response_mode='none' skips re-fetching the issue."""
+        result = transitions_mixin.transition_issue(
+            "TEST-123", "10", response_mode="none"
         )
 
-        # Verify standard status call was not made
-        transitions_mixin.jira.set_issue_status.assert_not_called()
-
-        # Verify result
-        transitions_mixin.get_issue.assert_called_once_with("TEST-123")
-        assert isinstance(result, JiraIssue)
+        assert result is None
+        transitions_mixin.jira.post.assert_called_once()
+        transitions_mixin.get_issue.assert_not_called()
 
     def test_normalize_transition_id(self, transitions_mixin: TransitionsMixin):
         """Test _normalize_transition_id with various input types."""
@@ -3,8 +3,10 @@
 from unittest.mock import MagicMock
 
 import pytest
+from requests.exceptions import HTTPError
 
-from mcp_atlassian.jira.worklog import WorklogMixin
+from mcp_atlassian.jira.worklog import WORKLOG_PAGE_SIZE, WorklogMixin
+from mcp_atlassian.models.jira import JiraIssue
 
 
 class TestWorklogMixin:
@@ -79,13 +81,16 @@ class TestWorklogMixin:
                 }
             ]
         }
-        worklog_mixin.jira.issue_get_worklog.return_value = mock_result
+        worklog_mixin.jira.get.return_value = mock_result
 
         # Call the method
         result = worklog_mixin.get_worklogs("TEST-123")
 
         # Verify
-        worklog_mixin.jira.issue_get_worklog.assert_called_once_with("TEST-123")
+        worklog_mixin.jira.get.assert_called_once_with(
+            f"{worklog_mixin.jira.resource_url.return_value}/TEST-123/worklog",
+            params={"startAt": 0, "maxResults": WORKLOG_PAGE_SIZE},
+        )
         assert len(result) == 1
         assert result[0]["id"] == "10001"
         assert result[0]["comment"] == "Work item 1"
@@ -116,7 +121,7 @@ class TestWorklogMixin:
                 },
             ]
         }
-        worklog_mixin.jira.issue_get_worklog.return_value = mock_result
+        worklog_mixin.jira.get.return_value = mock_result
 
         # Call the method
         result = worklog_mixin.get_worklogs("TEST-123")
@@ -141,7 +146,7 @@ class TestWorklogMixin:
                 }
             ]
         }
-        worklog_mixin.jira.issue_get_worklog.return_value = mock_result
+        worklog_mixin.jira.get.return_value = mock_result
 
         # Call the method
         result = worklog_mixin.get_worklogs("TEST-123")
@@ -157,7 +162,7 @@ class TestWorklogMixin:
     def test_get_worklogs_with_empty_response(self, worklog_mixin):
         """Test get_worklogs with empty response."""
         # Setup mock response with no worklogs
-        worklog_mixin.jira.issue_get_worklog.return_value = {}
+        worklog_mixin.jira.get.return_value = {}
 
         # Call the method
         result = worklog_mixin.get_worklogs("TEST-123")
@@ -169,9 +174,7 @@ class TestWorklogMixin:
     def test_get_worklogs_with_error(self, worklog_mixin):
         """Test get_worklogs error handling."""
         # Setup mock to raise exception
-        worklog_mixin.jira.issue_get_worklog.side_effect = Exception(
-            "Worklog fetch error"
-        )
+        worklog_mixin.jira.get.side_effect = Exception("Worklog fetch error")
 
         # Call the method and verify exception
         with pytest.raises(
@@ -179,6 +182,202 @@ class TestWorklogMixin:
         ):
             worklog_mixin.get_worklogs("TEST-123")
 
+    def test_get_worklogs_paginates(self, worklog_mixin):
+        """Test get_worklogs follows pages until the total is reached."""
+        pages = [
+            {
+                "startAt": 0,
+                "total": 3,
+                "worklogs": [{"id": "1"}, {"id": "2"}],
+            },
+            {"startAt": 2, "total": 3, "worklogs": [{"id": "3"}]},
+        ]
+        worklog_mixin.jira.get.side_effect = pages
+
+        result = worklog_mixin.get_worklogs("TEST-123")
+
+        assert [worklog["id"] for worklog in result] == ["1", "2", "3"]
+        assert worklog_mixin.jira.get.call_count == 2
+        assert worklog_mixin.jira.get.call_args.kwargs["params"]["startAt"] == 2
+
+    def test_iter_worklogs_started_after(self, worklog_mixin):
+        """Test iter_worklogs sends startedAfter and filters older entries."""
+        worklog_mixin.jira.get.return_value = {
+            "total": 2,
+            "worklogs": [
+                {"id": "1", "started": "2023-12-31T09:00:00.000+0000"},
+                {"id": "2", "started": "2024-01-02T09:00:00.000+0000"},
+            ],
+        }
+
+        result = list(worklog_mixin.iter_worklogs("TEST-123", "2024-01-01T00:00Z"))
+
+        assert [worklog["id"] for worklog in result] == ["2"]
+        params = worklog_mixin.jira.get.call_args.kwargs["params"]
+        assert params["startedAfter"] == 1704067200000
+
+    def test_aggregate_worklogs(self, worklog_mixin):
+        """Test aggregate_worklogs totals time per author and day."""
+        worklog_mixin.jira.get.return_value = {
+            "total": 3,
+            "worklogs": [
+                {
+                    "started": "2024-01-01T09:00:00.000+0000",
+                    "timeSpentSeconds": 3600,
+                    "author": {"displayName": "User 1"},
+                },
+                {
+                    "started": "2024-01-01T14:00:00.000+0000",
+                    "timeSpentSeconds": 1800,
+                    "author": {"displayName": "User 1"},
+                },
+                {
+                    "started": "2024-01-02T09:00:00.000+0000",
+                    "timeSpentSeconds": 7200,
+                    "author": {"displayName": "User 2"},
+                },
+            ],
+        }
+
+        result = worklog_mixin.aggregate_worklogs("TEST-123")
+
+        assert result == {
+            "issue_key": "TEST-123",
+            "total_seconds": 12600,
+            "worklog_count": 3,
+            "by_author": {"User 1": 5400, "User 2": 7200},
+            "by_day": {"2024-01-01": 5400, "2024-01-02": 7200},
+            "by_author_day": {
+                "User 1": {"2024-01-01": 5400},
+                "User 2": {"2024-01-02": 7200},
+            },
+        }
+
+    def test_get_worklog_report(self, worklog_mixin):
+        """Test get_worklog_report totals worklogs per author, issue and day."""
+        worklog_mixin.search_issues = MagicMock(
+            return_value=MagicMock(
+                issues=[JiraIssue(key="TEST-1"), JiraIssue(key="TEST-2")], total=2
+            )
+        )
+        worklogs = {
+            "TEST-1": [
+                {
+                    "started": "2024-01-01T09:00:00.000+0000",
+                    "timeSpentSeconds": 3600,
+                    "author": {"displayName": "User 1"},
+                },
+                {
+                    "started": "2024-01-01T13:00:00.000+0000",
+                    "timeSpentSeconds": 1800,
+                    "author": {"displayName": "User 1"},
+                },
+                {
+                    # Outside the date range
+                    "started": "2024-02-01T09:00:00.000+0000",
+                    "timeSpentSeconds": 600,
+                    "author": {"displayName": "User 1"},
+                },
+            ],
+            "TEST-2": [
+                {
+                    "started": "2024-01-02T09:00:00.000+0000",
+                    "timeSpentSeconds": 7200,
+                    "author": {"displayName": "User 2"},
+                }
+            ],
+        }
+        worklog_mixin.jira.get.side_effect = lambda url, params: {
+            "total": len(worklogs[url.split("/")[-2]]),
+            "worklogs": worklogs[url.split("/")[-2]],
+        }
+
+        report = worklog_mixin.get_worklog_report(
+            "project = TEST ORDER BY created DESC",
+            start_date="2024-01-01",
+            end_date="2024-01-31",
+        )
+
+        worklog_mixin.search_issues.assert_called_once_with(
+            '(project = TEST) AND worklogDate >= "2024-01-01" '
+            'AND worklogDate <= "2024-01-31"',
+            fields="key",
+            limit=1000,
+        )
+        assert report == {
+            "jql": "project = TEST ORDER BY created DESC",
+            "start_date": "2024-01-01",
+            "end_date": "2024-01-31",
+            "issue_count": 2,
+            "worklog_count": 3,
+            "total_seconds": 12600,
+            "skipped_issue_keys": [],
+            "table": {
+                "author": ["User 1", "User 2"],
+                "issue_key": ["TEST-1", "TEST-2"],
+                "day": ["2024-01-01", "2024-01-02"],
+                "seconds": [5400, 7200],
+            },
+        }
+        params = worklog_mixin.jira.get.call_args.kwargs["params"]
+        assert params["startedAfter"] == 1704067200000
+
+    def test_get_worklog_report_pages_server_search(
+        self, worklog_mixin, jira_config_factory
+    ):
+        """Test the report pages through search results on Server/DC."""
+        worklog_mixin.config = jira_config_factory(url="https://jira.example.com")
+        worklog_mixin.search_issues = MagicMock(
+            side_effect=[
+                MagicMock(issues=[JiraIssue(key="TEST-1")], total=2),
+                MagicMock(issues=[JiraIssue(key="TEST-2")], total=2),
+            ]
+        )
+        worklog_mixin.jira.get.return_value = {"worklogs": []}
+
+        report = worklog_mixin.get_worklog_report("project = TEST")
+
+        assert report["issue_count"] == 2
+        assert report["table"]["seconds"] == []
+        assert worklog_mixin.search_issues.call_args.kwargs["start"] == 1
+
+    def test_get_worklog_report_skips_failed_issues(self, worklog_mixin):
+        """Test an issue whose worklogs fail is skipped and listed."""
+        worklog_mixin.search_issues = MagicMock(
+            return_value=MagicMock(
+                issues=[JiraIssue(key="TEST-1"), JiraIssue(key="TEST-2")], total=2
+            )
+        )
+
+        def get_worklogs(url, params):
+            if "TEST-2" in url:
+                raise HTTPError("403 Forbidden")
+            return {
+                "total": 1,
+                "worklogs": [
+                    {
+                        "started": "2024-01-01T09:00:00.000+0000",
+                        "timeSpentSeconds": 3600,
+                        "author": {"displayName": "User 1"},
+                    }
+                ],
+            }
+
+        worklog_mixin.jira.get.side_effect = get_worklogs
+
+        report = worklog_mixin.get_worklog_report("project = TEST")
+
+        assert report["issue_count"] == 2
+        assert report["worklog_count"] == 1
+        assert report["total_seconds"] == 3600
+        assert report["skipped_issue_keys"] == ["TEST-2"]
+        assert report["table"]["issue_key"] == ["TEST-1"]
+
+    def test_get_worklog_report_invalid_date(self, worklog_mixin):
+        """Test the report rejects dates that are not YYYY-MM-DD."""
+        with pytest.raises(ValueError, match="start_date must be a date"):
+            worklog_mixin.get_worklog_report("project = TEST", start_date="Jan 1")
+
     def test_add_worklog_basic(self, worklog_mixin):
         """Test basic functionality of add_worklog."""
         # Setup mock response
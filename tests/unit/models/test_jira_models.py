@@ -18,6 +18,7 @@ from src.mcp_atlassian.models.constants import (
 )
 from src.mcp_atlassian.models.jira import (
     JiraComment,
+    JiraFieldContext,
     JiraIssue,
     JiraIssueLink,
     JiraIssueLinkType,
@@ -989,6 +990,53 @@ class TestJiraIssue:
             "name": "Epic Link",
         }
 
+    def test_custom_field_attribute_access(self, jira_issue_data):
+        """Test custom fields remain reachable as attributes and via the accessor."""
+        issue = JiraIssue.from_api_response(jira_issue_data)
+        expected = {"value": "Custom Text Field Value", "name": "My Custom Text Field"}
+
+        assert issue.customfield_10001 == expected
+        assert issue.get_custom_field("customfield_10001") == expected
+        assert issue.get_custom_field("cf_10001") == expected
+        assert issue.get_custom_field("my custom text field") == expected
+        assert issue.get_custom_field("customfield_99999") is None
+        assert issue.get_custom_field("missing", default={}) == {}
+
+        # Regular attributes still take precedence and unknown names still fail
+        assert issue.summary == "Test Issue Summary"
+        assert not hasattr(issue, "customfield_99999")
+        with pytest.raises(AttributeError):
+            _ = issue.not_a_field
+
+    def test_from_api_response_skips_unrequested_structures(self, jira_issue_data):
+        """Test that a field projection skips building unrequested structures."""
+        issue = JiraIssue.from_api_response(
+            jira_issue_data, requested_fields="summary,My Custom Text Field"
+        )
+
+        assert issue.summary == "Test Issue Summary"
+        assert issue.comments == []
+        assert issue.attachments == []
+        assert issue.issuelinks == []
+        assert issue.epic_key is None
+        assert list(issue.custom_fields) == ["customfield_10001"]
+
+        simplified = issue.to_simplified_dict()
+        assert simplified["customfield_10001"]["value"] == "Custom Text Field Value"
+        assert "comments" not in simplified
+
+        # Requesting by ID or short 'cf_' ID keeps the custom field as well
+        for requested in ("customfield_10001", "cf_10001"):
+            narrowed = JiraIssue.from_api_response(
+                jira_issue_data, requested_fields=requested
+            )
+            assert list(narrowed.custom_fields) == ["customfield_10001"]
+
+        # Without a projection everything is still parsed
+        full = JiraIssue.from_api_response(jira_issue_data)
+        assert full.comments
+        assert len(full.custom_fields) > 1
+
     def test_jira_issue_with_default_fields(self, jira_issue_data):
         """Test that JiraIssue returns only essential fields by default."""
         issue = JiraIssue.from_api_response(jira_issue_data)
@@ -1188,6 +1236,64 @@ class TestJiraSearchResult:
         assert simplified["issues"][1]["key"] == "PROJ-124"
         assert simplified["issues"][1]["summary"] == "Second Issue"
 
+    def test_from_api_response_shares_field_context(self):
+        """Test that issues share one field context built from search metadata."""
+        mock_data = {
+            "total": 2,
+            "issues": [
+                {
+                    "id": str(i),
+                    "key": f"PROJ-{i}",
+                    "fields": {
+                        "summary": f"Issue {i}",
+                        "customfield_10014": "EPIC-1",
+                        "customfield_10020": f"Team {i}",
+                    },
+                }
+                for i in (1, 2)
+            ],
+            "names": {"customfield_10014": "Epic Link"},
+        }
+        result = JiraSearchResult.from_api_response(
+            mock_data,
+            requested_fields="summary,epic_key,team",
+            field_metadata=[{"id": "customfield_10020", "name": "Team"}],
+        )
+
+        first, second = result.issues
+        assert first._field_context is second._field_context
+        assert first.epic_key == "EPIC-1"
+
+        simplified = result.to_simplified_dict()["issues"][1]
+        assert simplified["customfield_10020"] == {"value": "Team 2", "name": "Team"}
+        assert "customfield_10014" not in simplified
+
+
+class TestJiraFieldContext:
+    """Tests for the JiraFieldContext lookup table."""
+
+    def test_resolution(self):
+        """Test resolving IDs, short IDs, names and name patterns."""
+        context = JiraFieldContext(
+            names={"customfield_10014": "Epic Link"},
+            field_metadata=[
+                {"id": "customfield_10014", "name": "Ignored"},
+                {"id": "customfield_10011", "name": "Epic Name"},
+            ],
+        )
+
+        assert context.get_name("customfield_10014") == "Epic Link"
+        assert context.resolve_field_id("customfield_1") == "customfield_1"
+        assert context.resolve_field_id("EPIC NAME") == "customfield_10011"
+        assert context.resolve_field_id("cf_10020") == "customfield_10020"
+        assert context.resolve_field_id("unknown") is None
+        assert context.find_field_id(("epic-name",)) == "customfield_10011"
+        assert context.find_field_id(("sprint",)) is None
+        assert context.requested_field_ids(["summary", "epic link", "cf_1"]) == {
+            "customfield_10014",
+            "customfield_1",
+        }
+
 
 class TestJiraProject:
     """Tests for the JiraProject model."""
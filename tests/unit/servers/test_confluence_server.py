@@ -290,6 +290,42 @@ async def test_get_page(client, mock_confluence_fetcher):
     assert "This is a test page content" in result_data["metadata"]["content"]["value"]
 
 
+@pytest.mark.anyio
+async def test_get_page_with_response_budget(client, mock_confluence_fetcher):
+    """Test that get_page truncates the page body to the response budget."""
+    mock_page = mock_confluence_fetcher.get_page_content.return_value
+    mock_page.id = "123456"
+    mock_page.to_simplified_dict.return_value = {
+        "id": "123456",
+        "title": "Big Spec",
+        "content": {"value": "p" * 6000, "format": "markdown"},
+    }
+
+    response = await client.call_tool(
+        "confluence_get_page", {"page_id": "123456", "max_response_chars": 1000}
+    )
+    result_data = json.loads(response[0].text)
+    assert result_data["metadata"]["title"] == "Big Spec"
+    assert len(result_data["metadata"]["content"]["value"]) < 1000
+    truncated = result_data["truncated_fields"]["metadata.content.value"]
+    assert truncated["total"] == 6000
+
+    response = await client.call_tool(
+        "confluence_get_page",
+        {
+            "page_id": "123456",
+            "continuation_cursor": truncated["next_cursor"],
+            "max_response_chars": 2000,
+        },
+    )
+    chunk = json.loads(response[0].text)
+    assert chunk["page_id"] == "123456"
+    assert chunk["offset"] == truncated["returned"]
+    assert chunk["next_cursor"] == (
+        f"metadata.content.value:{truncated['returned'] + len(chunk['value'])}"
+    )
+
+
 @pytest.mark.anyio
 async def test_get_page_no_metadata(client, mock_confluence_fetcher):
     """Test get_page with metadata disabled."""
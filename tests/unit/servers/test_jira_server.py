@@ -14,6 +14,7 @@ from starlette.requests import Request
 
 from src.mcp_atlassian.jira import JiraFetcher
 from src.mcp_atlassian.jira.config import JiraConfig
+from src.mcp_atlassian.models.jira import JiraIssue
 from src.mcp_atlassian.servers.context import MainAppContext
 from src.mcp_atlassian.servers.main import AtlassianMCP
 from src.mcp_atlassian.utils.oauth import OAuthConfig
@@ -286,15 +287,19 @@ def test_jira_mcp(mock_jira_fetcher, mock_base_jira_config):
         get_agile_boards,
         get_all_projects,
         get_board_issues,
+        get_board_velocity,
+        get_cycle_time_report,
         get_issue,
         get_link_types,
         get_project_issues,
         get_project_versions,
         get_sprint_issues,
+        get_sprint_report,
         get_sprints_from_board,
         get_transitions,
         get_user_profile,
         get_worklog,
+        get_worklog_report,
         link_to_epic,
         remove_issue_link,
         search,
@@ -313,11 +318,15 @@ def test_jira_mcp(mock_jira_fetcher, mock_base_jira_config):
     jira_sub_mcp.tool()(get_all_projects)
     jira_sub_mcp.tool()(get_transitions)
     jira_sub_mcp.tool()(get_worklog)
+    jira_sub_mcp.tool()(get_worklog_report)
+    jira_sub_mcp.tool()(get_cycle_time_report)
     jira_sub_mcp.tool()(download_attachments)
     jira_sub_mcp.tool()(get_agile_boards)
     jira_sub_mcp.tool()(get_board_issues)
     jira_sub_mcp.tool()(get_sprints_from_board)
     jira_sub_mcp.tool()(get_sprint_issues)
+    jira_sub_mcp.tool()(get_sprint_report)
+    jira_sub_mcp.tool()(get_board_velocity)
     jira_sub_mcp.tool()(get_link_types)
     jira_sub_mcp.tool()(get_user_profile)
     jira_sub_mcp.tool()(create_issue)
@@ -428,6 +437,45 @@ async def test_get_issue(jira_client, mock_jira_fetcher):
     )
 
 
+@pytest.mark.anyio
+async def test_get_issue_with_response_budget(jira_client, mock_jira_fetcher):
+    """Test that get_issue truncates long fields to the response budget."""
+    long_issue = MagicMock()
+    long_issue.to_simplified_dict.return_value = {
+        "id": "10001",
+        "key": "TEST-123",
+        "summary": "Test Issue Summary",
+        "description": "x" * 5000,
+    }
+    mock_jira_fetcher.get_issue.side_effect = None
+    mock_jira_fetcher.get_issue.return_value = long_issue
+
+    response = await jira_client.call_tool(
+        "jira_get_issue",
+        {"issue_key": "TEST-123", "max_response_chars": 1000},
+    )
+    content = json.loads(response[0].text)
+    assert content["summary"] == "Test Issue Summary"
+    assert len(content["description"]) < 1000
+    truncated = content["truncated_fields"]["description"]
+    assert truncated["total"] == 5000
+    assert truncated["next_cursor"] == f"description:{truncated['returned']}"
+
+    response = await jira_client.call_tool(
+        "jira_get_issue",
+        {
+            "issue_key": "TEST-123",
+            "continuation_cursor": truncated["next_cursor"],
+        },
+    )
+    chunk = json.loads(response[0].text)
+    assert chunk["key"] == "TEST-123"
+    assert chunk["field"] == "description"
+    assert chunk["offset"] == truncated["returned"]
+    assert len(chunk["value"]) == 5000 - truncated["returned"]
+    assert chunk["next_cursor"] is None
+
+
 @pytest.mark.anyio
 async def test_search(jira_client, mock_jira_fetcher):
     """Test the search tool with fixture data."""
@@ -499,6 +547,7 @@ async def test_create_issue(jira_client, mock_jira_fetcher):
         description="This is a new task",
         assignee=None,
         components=["Frontend", "API"],
+        response_mode="full",
         priority={"name": "Medium"},
     )
 
@@ -553,6 +602,75 @@ async def test_batch_create_issues_invalid_json(jira_client):
     assert "Error calling tool 'batch_create_issues'" in str(excinfo.value)
 
 
+@pytest.mark.anyio
+async def test_transition_issue_without_refetch(jira_client, mock_jira_fetcher):
+    """Test the transition_issue tool can skip re-fetching the issue."""
+    mock_jira_fetcher.transition_issue.return_value = None
+    response = await jira_client.call_tool(
+        "jira_transition_issue",
+        {"issue_key": "TEST-123", "transition_id": "31", "response_mode": "none"},
+    )
+    content = json.loads(response[0].text)
+    assert content == {
+        "message": "Issue TEST-123 transitioned successfully",
+        "issue": None,
+    }
+    mock_jira_fetcher.transition_issue.assert_called_once_with(
+        issue_key="TEST-123",
+        transition_id="31",
+        fields={},
+        comment=None,
+        response_mode="none",
+    )
+
+
+@pytest.mark.anyio
+async def test_update_issue_without_refetch(jira_client, mock_jira_fetcher):
+    """Test the update_issue tool returns only the key without a re-fetch."""
+    mock_jira_fetcher.update_issue.return_value = None
+    response = await jira_client.call_tool(
+        "jira_update_issue",
+        {
+            "issue_key": "TEST-123",
+            "fields": {"summary": "Updated"},
+            "response_mode": "none",
+        },
+    )
+    content = json.loads(response[0].text)
+    assert content == {
+        "message": "Issue updated successfully",
+        "issue": {"key": "TEST-123"},
+    }
+    mock_jira_fetcher.update_issue.assert_called_once_with(
+        issue_key="TEST-123", response_mode="none", summary="Updated"
+    )
+
+
+@pytest.mark.anyio
+async def test_update_issue_without_refetch_keeps_attachments(
+    jira_client, mock_jira_fetcher
+):
+    """Test the update_issue tool reports uploads when skipping the re-fetch."""
+    upload_result = {"success": [{"filename": "a.txt"}], "failed": []}
+    mock_jira_fetcher.update_issue.return_value = JiraIssue(
+        key="TEST-123", custom_fields={"attachment_results": upload_result}
+    )
+    response = await jira_client.call_tool(
+        "jira_update_issue",
+        {
+            "issue_key": "TEST-123",
+            "fields": {},
+            "attachments": "/tmp/a.txt",
+            "response_mode": "none",
+        },
+    )
+    content = json.loads(response[0].text)
+    assert content == {
+        "message": "Issue updated successfully",
+        "issue": {"key": "TEST-123", "attachment_results": upload_result},
+    }
+
+
 @pytest.mark.anyio
 async def test_get_user_profile_tool_success(jira_client, mock_jira_fetcher):
     """Test the get_user_profile tool successfully retrieves user info."""
@@ -1148,3 +1266,93 @@ async def test_batch_create_versions_empty(jira_client, mock_jira_fetcher):
     )
     content = json.loads(response[0].text)
     assert content == []
+
+
+@pytest.mark.anyio
+async def test_get_worklog_aggregate(jira_client, mock_jira_fetcher):
+    """Test the get_worklog tool can return per author/day totals."""
+    totals = {"issue_key": "TEST-123", "total_seconds": 3600, "worklog_count": 1}
+    mock_jira_fetcher.aggregate_worklogs.return_value = totals
+    response = await jira_client.call_tool(
+        "jira_get_worklog",
+        {"issue_key": "TEST-123", "started_after": "2024-01-01", "aggregate": True},
+    )
+    assert json.loads(response[0].text) == totals
+    mock_jira_fetcher.aggregate_worklogs.assert_called_once_with(
+        "TEST-123", started_after="2024-01-01"
+    )
+    mock_jira_fetcher.get_worklogs.assert_not_called()
+
+
+@pytest.mark.anyio
+async def test_get_worklog_report(jira_client, mock_jira_fetcher):
+    """Test the get_worklog_report tool passes the JQL and date range."""
+    report = {"issue_count": 1, "total_seconds": 3600, "table": {}}
+    mock_jira_fetcher.get_worklog_report.return_value = report
+    response = await jira_client.call_tool(
+        "jira_get_worklog_report",
+        {"jql": "project = TEST", "start_date": "2024-01-01", "limit": 10},
+    )
+    assert json.loads(response[0].text) == report
+    mock_jira_fetcher.get_worklog_report.assert_called_once_with(
+        "project = TEST", start_date="2024-01-01", end_date=None, max_issues=10
+    )
+
+
+@pytest.mark.anyio
+async def test_get_cycle_time_report(jira_client, mock_jira_fetcher):
+    """Test the get_cycle_time_report tool passes the JQL and limit."""
+    report = {"jql": "project = TEST", "issue_count": 1, "lead_time": {"count": 1}}
+    mock_jira_fetcher.get_cycle_time_report.return_value = report
+    response = await jira_client.call_tool(
+        "jira_get_cycle_time_report", {"jql": "project = TEST", "limit": 500}
+    )
+    assert json.loads(response[0].text) == report
+    mock_jira_fetcher.get_cycle_time_report.assert_called_once_with(
+        "project = TEST", max_issues=500
+    )
+
+
+@pytest.mark.anyio
+async def test_get_sprint_report(jira_client, mock_jira_fetcher):
+    """Test the get_sprint_report tool passes the estimate field."""
+    report = {"sprint": {"id": "7"}, "committed": 6.0, "completed": 7.0}
+    mock_jira_fetcher.get_sprint_report.return_value = report
+    response = await jira_client.call_tool(
+        "jira_get_sprint_report",
+        {"sprint_id": "7", "estimate_field": "Story Points"},
+    )
+    assert json.loads(response[0].text) == report
+    mock_jira_fetcher.get_sprint_report.assert_called_once_with(
+        "7", estimate_field="Story Points"
+    )
+
+
+@pytest.mark.anyio
+async def test_get_board_velocity(jira_client, mock_jira_fetcher):
+    """Test the get_board_velocity tool passes the sprint count."""
+    velocity = {"sprint_id": ["7"], "completed": [7.0], "average_velocity": 7.0}
+    mock_jira_fetcher.get_board_velocity.return_value = velocity
+    response = await jira_client.call_tool(
+        "jira_get_board_velocity", {"board_id": "1000", "sprint_count": 3}
+    )
+    assert json.loads(response[0].text) == velocity
+    mock_jira_fetcher.get_board_velocity.assert_called_once_with(
+        "1000", sprint_count=3, estimate_field=None
+    )
+
+
+@pytest.mark.anyio
+async def test_batch_get_changelogs_limit(jira_client, mock_jira_fetcher):
+    """Test the batch_get_changelogs tool pushes the limit down."""
+    mock_jira_fetcher.batch_get_changelogs.return_value = [
+        JiraIssue(id="10001", changelogs=[])
+    ]
+    response = await jira_client.call_tool(
+        "jira_batch_get_changelogs",
+        {"issue_ids_or_keys": ["TEST-1"], "fields": ["status"], "limit": 5},
+    )
+    assert json.loads(response[0].text) == [{"issue_id": "10001", "changelogs": []}]
+    mock_jira_fetcher.batch_get_changelogs.assert_called_once_with(
+        issue_ids_or_keys=["TEST-1"], fields=["status"], limit=5
+    )
@@ -1,13 +1,31 @@
 """Tests for the main MCP server implementation."""
 
+import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
+from fastmcp.exceptions import ToolError
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
 from starlette.requests import Request
-from starlette.responses import JSONResponse
-
-from mcp_atlassian.servers.main import UserTokenMiddleware, main_mcp
+from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.routing import Route
+
+from mcp_atlassian.jira.config import JiraConfig
+from mcp_atlassian.servers.context import MainAppContext
+from mcp_atlassian.servers.main import (
+    AtlassianMCP,
+    UserTokenMiddleware,
+    main_mcp,
+    prefetch_jira_metadata,
+)
+from mcp_atlassian.utils import metrics, tracing
+from mcp_atlassian.utils.profiling import (
+    ProfilingConfig,
+    SlowCallProfiler,
+    set_slow_call_profiler,
+)
 
 
 @pytest.mark.anyio
@@ -56,6 +74,73 @@ async def test_run_server_invalid_transport():
     assert "invalid" in str(excinfo.value)
 
 
+@pytest.mark.asyncio
+async def test_prefetch_jira_metadata_filtered_projects():
+    """Test the startup prefetch warms metadata for the filtered projects."""
+    config = JiraConfig(
+        url="https://test.atlassian.net",
+        auth_type="pat",
+        personal_token="token",
+        projects_filter="PROJ1, PROJ2,",
+    )
+    with patch("mcp_atlassian.servers.main.JiraFetcher") as mock_fetcher_cls:
+        await prefetch_jira_metadata(config)
+        mock_fetcher_cls.assert_called_once_with(config=config)
+        prefetch = mock_fetcher_cls.return_value.prefetch_create_metadata
+        prefetch.assert_called_once_with(["PROJ1", "PROJ2"])
+
+        # Failures are logged, never raised
+        prefetch.side_effect = Exception("boom")
+        await prefetch_jira_metadata(config)
+
+
+@pytest.mark.anyio
+async def test_list_tools_is_memoized_per_filter_settings():
+    """Test the filtered tool list is built once per settings and reset on mount."""
+    server = AtlassianMCP(name="Test Atlassian MCP")
+
+    def jira_read_tool() -> str:
+        return "read"
+
+    def jira_write_tool() -> str:
+        return "write"
+
+    server.add_tool(jira_read_tool, tags={"jira", "read"})
+    server.add_tool(jira_write_tool, tags={"jira", "write"})
+
+    def set_context(read_only: bool) -> None:
+        app_context = MainAppContext(full_jira_config=MagicMock(), read_only=read_only)
+        server._mcp_server = MagicMock()
+        server._mcp_server.request_context.lifespan_context = {
+            "app_lifespan_context": app_context
+        }
+
+    get_tools = AsyncMock(wraps=server.get_tools)
+    server.get_tools = get_tools
+
+    set_context(read_only=False)
+    first = await server._mcp_list_tools()
+    second = await server._mcp_list_tools()
+    assert [tool.name for tool in first] == ["jira_read_tool", "jira_write_tool"]
+    assert second == first
+    assert get_tools.await_count == 1
+
+    set_context(read_only=True)
+    read_only_tools = await server._mcp_list_tools()
+    assert [tool.name for tool in read_only_tools] == ["jira_read_tool"]
+    assert get_tools.await_count == 2
+
+    def jira_other_tool() -> str:
+        return "other"
+
+    other = AtlassianMCP(name="Other")
+    other.add_tool(jira_other_tool, tags={"jira", "read"})
+    server.mount("sub", other)
+    tools = await server._mcp_list_tools()
+    assert "sub_jira_other_tool" in [tool.name for tool in tools]
+    assert get_tools.await_count == 3
+
+
 @pytest.mark.anyio
 async def test_health_check_endpoint():
     """Test the health check endpoint returns 200 and correct JSON response."""
@@ -68,6 +153,95 @@ async def test_health_check_endpoint():
         assert response.json() == {"status": "ok"}
 
 
+@pytest.mark.anyio
+async def test_metrics_endpoint():
+    """Test /metrics is only served when metrics are enabled."""
+    app = main_mcp.http_app()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get("/metrics")
+        assert response.status_code == 404
+
+        metrics.set_metrics_enabled(enabled=True)
+        try:
+            response = await client.get("/metrics")
+        finally:
+            metrics.set_metrics_enabled(enabled=False)
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert "# TYPE mcp_atlassian_tool_calls_total counter" in response.text
+
+
+@pytest.mark.anyio
+async def test_tool_calls_are_timed_when_metrics_enabled():
+    """Test tool calls are counted per tool and outcome."""
+    server = AtlassianMCP(name="Test Atlassian MCP")
+
+    def jira_failing_tool() -> str:
+        raise ValueError("boom")
+
+    server.add_tool(jira_failing_tool, tags={"jira", "read"})
+    metrics.reset_metrics()
+    metrics.set_metrics_enabled(enabled=True)
+    try:
+        with pytest.raises(ToolError):
+            await server._mcp_call_tool("jira_failing_tool", {})
+    finally:
+        metrics.set_metrics_enabled(enabled=False)
+
+    assert metrics.TOOL_CALLS.value("jira_failing_tool", "error") == 1
+    assert metrics.TOOL_DURATION.count("jira_failing_tool") == 1
+    metrics.reset_metrics()
+
+
+@pytest.mark.anyio
+async def test_tool_calls_are_traced_when_tracing_enabled(tmp_path):
+    """Test every tool call gets a span with the size of its result."""
+    pytest.importorskip("opentelemetry.sdk")
+    server = AtlassianMCP(name="Test Atlassian MCP")
+
+    def jira_echo_tool(text: str) -> str:
+        return text
+
+    server.add_tool(jira_echo_tool, tags={"jira", "read"})
+    span_file = tmp_path / "spans.jsonl"
+    tracing.set_tracing_enabled(enabled=True)
+    tracing.configure_tracing(str(span_file))
+    try:
+        await server._mcp_call_tool("jira_echo_tool", {"text": "hello"})
+    finally:
+        tracing.shutdown_tracing()
+        tracing.set_tracing_enabled(enabled=False)
+
+    span = json.loads(span_file.read_text())
+    assert span["name"] == "tools/call jira_echo_tool"
+    assert span["attributes"] == {
+        "mcp.tool.name": "jira_echo_tool",
+        "mcp.tool.result.size": 5,
+    }
+
+
+@pytest.mark.anyio
+async def test_slow_tool_calls_are_profiled(tmp_path):
+    """Test slow tool calls are profiled when profiling is enabled."""
+    server = AtlassianMCP(name="Test Atlassian MCP")
+
+    def jira_echo_tool(text: str) -> str:
+        return text
+
+    server.add_tool(jira_echo_tool, tags={"jira", "read"})
+    config = ProfilingConfig(dump_dir=tmp_path, threshold_ms=0, sample_rate=1.0)
+    set_slow_call_profiler(SlowCallProfiler(config))
+    try:
+        await server._mcp_call_tool("jira_echo_tool", {"text": "hello"})
+    finally:
+        set_slow_call_profiler(None)
+
+    [report_path] = tmp_path.glob("*-jira_echo_tool.json")
+    report = json.loads(report_path.read_text())
+    assert report["arguments"] == {"text": "hello"}
+
+
 @pytest.mark.anyio
 async def test_sse_app_health_check_endpoint():
     """Test the /healthz endpoint on the SSE app returns 200 and correct JSON response."""
@@ -94,54 +268,114 @@ class TestUserTokenMiddleware:
     """Tests for the UserTokenMiddleware class."""
 
     @pytest.fixture
-    def middleware(self):
-        """Create a UserTokenMiddleware instance for testing."""
-        mock_app = AsyncMock()
-        # Create a mock MCP server to avoid warnings
-        mock_mcp_server = MagicMock()
-        mock_mcp_server.settings.streamable_http_path = "/mcp"
-        return UserTokenMiddleware(mock_app, mcp_server_ref=mock_mcp_server)
+    def seen_state(self):
+        """Collect the request state seen by the downstream app."""
+        return {}
 
     @pytest.fixture
-    def mock_request(self):
-        """Create a mock request for testing."""
-        request = MagicMock(spec=Request)
-        request.url.path = "/mcp"
-        request.method = "POST"
-        request.headers = {}
-        # Create a real state object that can be modified
-        from types import SimpleNamespace
-
-        request.state = SimpleNamespace()
-        return request
+    def client(self, seen_state):
+        """Create a client for an app wrapped in the middleware."""
 
-    @pytest.fixture
-    def mock_call_next(self):
-        """Create a mock call_next function."""
-        mock_response = JSONResponse({"test": "response"})
-        call_next = AsyncMock(return_value=mock_response)
-        return call_next
+        async def endpoint(request: Request) -> Response:
+            seen_state.update(request.scope.get("state", {}))
+            return JSONResponse({"test": "response"})
+
+        async def stream(request: Request) -> StreamingResponse:
+            async def chunks():
+                yield b"event: message\n"
+                yield b"data: {}\n\n"
+
+            return StreamingResponse(chunks(), media_type="text/event-stream")
+
+        # Create a mock MCP server providing the endpoint path
+        mock_mcp_server = MagicMock()
+        mock_mcp_server.settings.streamable_http_path = "/mcp/"
+        app = Starlette(
+            routes=[
+                Route("/mcp", endpoint, methods=["GET", "POST"]),
+                Route("/stream", stream, methods=["POST"]),
+            ],
+            middleware=[
+                Middleware(UserTokenMiddleware, mcp_server_ref=mock_mcp_server)
+            ],
+        )
+        return httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        )
 
     @pytest.mark.anyio
-    async def test_cloud_id_header_extraction_success(
-        self, middleware, mock_request, mock_call_next
-    ):
+    async def test_cloud_id_header_extraction_success(self, client, seen_state):
         """Test successful cloud ID header extraction."""
-        # Setup request with cloud ID header
-        mock_request.headers = {
-            "Authorization": "Bearer test-token",
-            "X-Atlassian-Cloud-Id": "test-cloud-id-123",
+        response = await client.post(
+            "/mcp",
+            headers={
+                "Authorization": "Bearer test-token",
+                "X-Atlassian-Cloud-Id": " test-cloud-id-123 ",
+            },
+        )
+
+        assert response.json() == {"test": "response"}
+        assert seen_state == {
+            "user_atlassian_cloud_id": "test-cloud-id-123",
+            "user_atlassian_token": "test-token",
+            "user_atlassian_auth_type": "oauth",
+            "user_atlassian_email": None,
         }
 
-        result = await middleware.dispatch(mock_request, mock_call_next)
+    @pytest.mark.anyio
+    async def test_pat_token(self, client, seen_state):
+        """Test a PAT is stored with the pat auth type."""
+        await client.post("/mcp", headers={"Authorization": "Token pat-token"})
+
+        assert seen_state["user_atlassian_token"] == "pat-token"
+        assert seen_state["user_atlassian_auth_type"] == "pat"
 
-        # Verify cloud ID was extracted and stored in request state
-        assert hasattr(mock_request.state, "user_atlassian_cloud_id")
-        assert mock_request.state.user_atlassian_cloud_id == "test-cloud-id-123"
+    @pytest.mark.anyio
+    @pytest.mark.parametrize(
+        ("header", "error"),
+        [
+            ("Bearer ", "Empty Bearer token"),
+            ("Token  ", "Empty Token (PAT)"),
+            ("Basic dXNlcjpwYXNz", "Only 'Bearer <OAuthToken>' or 'Token <PAT>'"),
+            ("Bearer", "Only 'Bearer <OAuthToken>' or 'Token <PAT>'"),
+        ],
+    )
+    async def test_rejected_authorization(self, client, seen_state, header, error):
+        """Test empty tokens and unsupported schemes are rejected."""
+        response = await client.post("/mcp", headers={"Authorization": header})
+
+        assert response.status_code == 401
+        assert error in response.json()["error"]
+        assert seen_state == {}
 
-        # Verify the request was processed normally
-        mock_call_next.assert_called_once_with(mock_request)
-        assert result is not None
+    @pytest.mark.anyio
+    @pytest.mark.parametrize(
+        ("method", "headers"),
+        [
+            ("POST", {}),
+            ("POST", {"Authorization": ""}),
+            ("GET", {"Authorization": "Basic dXNlcjpwYXNz"}),
+        ],
+        ids=["no-header", "empty-header", "not-mcp-post"],
+    )
+    async def test_passes_through_without_credentials(
+        self, client, seen_state, method, headers
+    ):
+        """Test requests without credentials or not posted to MCP pass through."""
+        response = await client.request(method, "/mcp", headers=headers)
+
+        assert response.status_code == 200
+        assert seen_state == {}
+
+    @pytest.mark.anyio
+    async def test_streaming_response_passes_through(self, client):
+        """Test streamed responses are forwarded unchanged."""
+        response = await client.post(
+            "/stream", headers={"Authorization": "Basic dXNlcjpwYXNz"}
+        )
+
+        assert response.status_code == 200
+        assert response.text == "event: message\ndata: {}\n\n"
 
 
 @pytest.mark.anyio
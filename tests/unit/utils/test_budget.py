@@ -0,0 +1,125 @@
+"""Tests for the response budget utilities."""
+
+import json
+
+import pytest
+
+from mcp_atlassian.utils.budget import (
+    apply_response_budget,
+    decode_cursor,
+    encode_cursor,
+    get_continuation_chunk,
+)
+
+FIELDS = ("description", "comments")
+
+
+def _size(data):
+    return len(json.dumps(data, ensure_ascii=False, separators=(",", ":")))
+
+
+@pytest.fixture
+def large_issue():
+    return {
+        "id": "10001",
+        "key": "PROJ-1",
+        "summary": "Large issue",
+        "status": {"name": "Open"},
+        "description": "d" * 5000,
+        "comments": [{"id": str(i), "body": "c" * 200} for i in range(20)],
+    }
+
+
+class TestCursor:
+    """Tests for cursor encoding and decoding."""
+
+    def test_round_trip(self):
+        assert decode_cursor(encode_cursor("metadata.content.value", 42)) == (
+            "metadata.content.value",
+            42,
+        )
+
+    @pytest.mark.parametrize("cursor", ["description", "description:abc", ":12"])
+    def test_invalid(self, cursor):
+        with pytest.raises(ValueError, match="Invalid continuation cursor"):
+            decode_cursor(cursor)
+
+
+class TestApplyResponseBudget:
+    """Tests for apply_response_budget."""
+
+    def test_no_budget_returns_input(self, large_issue):
+        assert apply_response_budget(large_issue, None, FIELDS) is large_issue
+
+    def test_fits_returns_input(self, large_issue):
+        assert apply_response_budget(large_issue, 100000, FIELDS) is large_issue
+
+    def test_truncates_within_budget(self, large_issue):
+        result = apply_response_budget(large_issue, 2000, FIELDS)
+
+        assert _size(result) <= 2000
+        # Metadata is always kept in full
+        assert result["summary"] == "Large issue"
+        assert result["status"] == {"name": "Open"}
+        # The input is not mutated
+        assert len(large_issue["description"]) == 5000
+
+        description = result["truncated_fields"]["description"]
+        assert description["returned"] == len(result["description"])
+        assert description["total"] == 5000
+        assert description["next_cursor"] == f"description:{description['returned']}"
+        assert result["truncated_fields"]["comments"]["returned"] == 0
+
+    def test_priority_order(self, large_issue):
+        result = apply_response_budget(large_issue, 3000, ("comments", "description"))
+
+        assert len(result["comments"]) > 0
+        assert result["truncated_fields"]["comments"]["returned"] == len(
+            result["comments"]
+        )
+
+    def test_nested_paths(self):
+        page = {"metadata": {"id": "1", "content": {"value": "p" * 4000}}}
+        result = apply_response_budget(page, 1000, ("metadata.content.value",))
+
+        assert _size(result) <= 1000
+        assert len(page["metadata"]["content"]["value"]) == 4000
+        assert "metadata.content.value" in result["truncated_fields"]
+
+    def test_without_truncatable_fields(self):
+        data = {"summary": "s" * 1000}
+        assert apply_response_budget(data, 500, FIELDS) is data
+
+
+class TestGetContinuationChunk:
+    """Tests for get_continuation_chunk."""
+
+    def test_string_chunks_cover_field(self, large_issue):
+        cursor = "description:0"
+        collected = ""
+        while cursor:
+            chunk = get_continuation_chunk(large_issue, cursor, 1000, FIELDS)
+            collected += chunk["value"]
+            cursor = chunk["next_cursor"]
+        assert collected == large_issue["description"]
+
+    def test_list_chunk(self, large_issue):
+        chunk = get_continuation_chunk(large_issue, "comments:5", 1000, FIELDS)
+
+        assert chunk["offset"] == 5
+        assert chunk["value"][0]["id"] == "5"
+        assert chunk["total"] == 20
+        assert chunk["next_cursor"] == f"comments:{5 + len(chunk['value'])}"
+
+    def test_list_chunk_always_progresses(self, large_issue):
+        chunk = get_continuation_chunk(large_issue, "comments:0", 10, FIELDS)
+        assert len(chunk["value"]) == 1
+
+    def test_unlimited(self, large_issue):
+        chunk = get_continuation_chunk(large_issue, "comments:18", None, FIELDS)
+        assert len(chunk["value"]) == 2
+        assert chunk["next_cursor"] is None
+
+    def test_unknown_field(self, large_issue):
+        with pytest.raises(ValueError, match="cannot be continued"):
+            get_continuation_chunk(large_issue, "summary:0", None, FIELDS)
@@ -0,0 +1,83 @@
+"""Tests for the process-wide shared caches."""
+
+from unittest.mock import MagicMock
+
+from mcp_atlassian.utils.cache import (
+    SharedCache,
+    clear_all_caches,
+    credential_fingerprint,
+    get_cache_stats,
+)
+
+
+class TestSharedCache:
+    """Tests for SharedCache."""
+
+    def test_get_set_and_stats(self):
+        cache: SharedCache[str] = SharedCache("test_get_set", ttl=60)
+
+        assert cache.get("a") is None
+        cache.set("a", "value")
+        assert cache.get("a") == "value"
+
+        assert get_cache_stats()["test_get_set"] == {
+            "size": 1,
+            "hits": 1,
+            "misses": 1,
+        }
+
+    def test_get_or_set_computes_once(self):
+        cache: SharedCache[int] = SharedCache("test_get_or_set", ttl=60)
+        factory = MagicMock(return_value=42)
+
+        assert cache.get_or_set("k", factory) == 42
+        assert cache.get_or_set("k", factory) == 42
+        factory.assert_called_once()
+
+    def test_none_is_not_cached(self):
+        cache: SharedCache[int] = SharedCache("test_none", ttl=60)
+        cache.set("k", None)
+        assert cache.stats()["size"] == 0
+
+    def test_expiry(self):
+        clock = MagicMock(return_value=1000.0)
+        cache: SharedCache[str] = SharedCache("test_expiry", ttl=10, timer=clock)
+        cache.set("k", "v")
+        clock.return_value = 1011.0
+        assert cache.get("k") is None
+
+    def test_entry_ttl(self):
+        clock = MagicMock(return_value=1000.0)
+        cache: SharedCache[str] = SharedCache("test_entry_ttl", ttl=10, timer=clock)
+        cache.set("short", "v", ttl=1)
+        cache.set("default", "v")
+        cache.set("disabled", "v", ttl=0)
+
+        clock.return_value = 1005.0
+        assert cache.get("short") is None
+        assert cache.get("default") == "v"
+        assert cache.get("disabled") is None
+
+    def test_invalidation(self):
+        cache: SharedCache[str] = SharedCache("test_invalidation", ttl=60)
+        for key in [("url1", "A"), ("url1", "B"), ("url2", "A")]:
+            cache.set(key, "v")
+
+        cache.invalidate(("url1", "A"))
+        assert cache.get(("url1", "A")) is None
+
+        cache.invalidate_matching(lambda key: key[0] == "url1")
+        assert cache.get(("url1", "B")) is None
+        assert cache.get(("url2", "A")) == "v"
+
+        clear_all_caches()
+        assert cache.get(("url2", "A")) is None
+        assert cache.hits == 0
+
+
+def test_credential_fingerprint():
+    fingerprint = credential_fingerprint("user", "secret-token")
+    assert "secret-token" not in fingerprint
+    assert fingerprint == credential_fingerprint("user", "secret-token")
+    assert fingerprint != credential_fingerprint("user", "other-token")
+    assert credential_fingerprint("a", None) != credential_fingerprint(None, "a")
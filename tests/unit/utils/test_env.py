@@ -1,6 +1,7 @@
 """Tests for environment variable utility functions."""
 
 from mcp_atlassian.utils.env import (
+    get_cache_ttls,
     is_env_extended_truthy,
     is_env_ssl_verify,
     is_env_truthy,
@@ -215,3 +216,15 @@ class TestEdgeCases:
                 assert is_env_truthy("TEST_VAR") is False
                 assert is_env_extended_truthy("TEST_VAR") is False
             assert is_env_ssl_verify("TEST_VAR") is True  # Not in false values
+
+
+class TestGetCacheTtls:
+    """Test the get_cache_ttls function."""
+
+    def test_parses_pairs(self, monkeypatch):
+        monkeypatch.setenv("TEST_TTLS", "Projects=600, versions=0,components=abc")
+        assert get_cache_ttls("TEST_TTLS") == {"projects": 600, "versions": 0}
+
+    def test_unset(self, monkeypatch):
+        monkeypatch.delenv("TEST_TTLS", raising=False)
+        assert get_cache_ttls("TEST_TTLS") == {}
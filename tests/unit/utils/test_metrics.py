@@ -0,0 +1,148 @@
+"""Tests for the in-process metrics."""
+
+import pytest
+from atlassian import Jira
+from requests import PreparedRequest, Response
+from requests.adapters import BaseAdapter
+
+from mcp_atlassian.utils import metrics
+from mcp_atlassian.utils.cache import SharedCache
+from mcp_atlassian.utils.metrics import (
+    Histogram,
+    instrument_rest_client,
+    normalize_endpoint,
+    record_tool_call,
+    render_metrics,
+)
+
+
+@pytest.fixture
+def enabled_metrics():
+    """Enable metrics with empty counters for one test."""
+    metrics.reset_metrics()
+    metrics.set_metrics_enabled(enabled=True)
+    yield
+    metrics.set_metrics_enabled(enabled=False)
+    metrics.reset_metrics()
+
+
+class _ScriptedAdapter(BaseAdapter):
+    """Transport adapter answering requests with scripted status codes."""
+
+    def __init__(self, statuses: list[int]) -> None:
+        super().__init__()
+        self.statuses = statuses
+
+    def send(self, request: PreparedRequest, **kwargs: object) -> Response:
+        response = Response()
+        response.status_code = self.statuses.pop(0)
+        response.headers["Retry-After"] = "0"
+        response._content = b"{}"
+        response.url = request.url or ""
+        response.request = request
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+@pytest.mark.parametrize(
+    ("url", "endpoint"),
+    [
+        (
+            "https://test.atlassian.net/rest/api/2/issue/PROJ-123/comment?expand=x",
+            "/rest/api/2/issue/{id}/comment",
+        ),
+        (
+            "https://test.atlassian.net/rest/agile/1.0/sprint/42/issue",
+            "/rest/agile/1.0/sprint/{id}/issue",
+        ),
+        (
+            "https://api.atlassian.com/ex/jira/0b3c-11ee/rest/api/3/search",
+            "/ex/jira/{id}/rest/api/3/search",
+        ),
+        ("https://wiki.example.com/wiki/api/v2/pages/98765", "/wiki/api/v2/pages/{id}"),
+    ],
+)
+def test_normalize_endpoint(url, endpoint):
+    """Test IDs are removed from endpoints while API versions are kept."""
+    assert normalize_endpoint(url) == endpoint
+
+
+def test_histogram_render():
+    """Test buckets are rendered cumulatively with sum and count."""
+    histogram = Histogram("test_seconds", "Test.", ("tool",), buckets=(0.1, 1.0))
+    histogram.observe(0.05, "a")
+    histogram.observe(0.5, "a")
+    histogram.observe(5, "a")
+
+    assert histogram.render() == [
+        "# HELP test_seconds Test.",
+        "# TYPE test_seconds histogram",
+        'test_seconds_bucket{tool="a",le="0.1"} 1',
+        'test_seconds_bucket{tool="a",le="1"} 2',
+        'test_seconds_bucket{tool="a",le="+Inf"} 3',
+        'test_seconds_sum{tool="a"} 5.55',
+        'test_seconds_count{tool="a"} 3',
+    ]
+
+
+def test_nothing_recorded_when_disabled():
+    """Test recording is a no-op while metrics are disabled."""
+    metrics.reset_metrics()
+    client = Jira(url="https://test.atlassian.net")
+
+    record_tool_call("jira_get_issue", 0.1)
+    instrument_rest_client(client, "jira")
+
+    assert metrics.TOOL_CALLS.value("jira_get_issue", "ok") == 0
+    assert client._session.hooks["response"] == []
+    assert "_retry_handler" not in vars(client)
+
+
+def test_record_tool_call(enabled_metrics):
+    """Test tool calls are counted by outcome and timed."""
+    record_tool_call("jira_get_issue", 0.2)
+    record_tool_call("jira_get_issue", 0.4, failed=True)
+
+    assert metrics.TOOL_CALLS.value("jira_get_issue", "ok") == 1
+    assert metrics.TOOL_CALLS.value("jira_get_issue", "error") == 1
+    assert metrics.TOOL_DURATION.count("jira_get_issue") == 2
+
+
+def test_instrument_rest_client(enabled_metrics):
+    """Test upstream requests, rate limits and retries are counted."""
+    client = Jira(url="https://test.atlassian.net")
+    client._session.mount("https://", _ScriptedAdapter([429, 200]))
+    instrument_rest_client(client, "jira")
+
+    client.get("rest/api/2/issue/PROJ-1")
+
+    endpoint = "/rest/api/2/issue/{id}"
+    assert metrics.UPSTREAM_REQUESTS.value("jira", "GET", endpoint, "429") == 1
+    assert metrics.UPSTREAM_REQUESTS.value("jira", "GET", endpoint, "200") == 1
+    assert metrics.UPSTREAM_DURATION.count("jira", "GET", endpoint) == 2
+    assert metrics.UPSTREAM_RATE_LIMITED.value("jira") == 1
+    assert metrics.UPSTREAM_RETRIES.value("jira") == 1
+
+
+def test_render_metrics_includes_cache_hit_ratio(enabled_metrics):
+    """Test cache statistics are exported with their hit ratio."""
+    cache: SharedCache[str] = SharedCache("test_metrics_cache", ttl=60)
+    cache.set("a", "value")
+    cache.get("a")
+    cache.get("a")
+    cache.get("b")
+    record_tool_call("jira_get_issue", 0.2)
+
+    output = render_metrics()
+
+    assert 'mcp_atlassian_tool_calls_total{tool="jira_get_issue",status="ok"} 1' in (
+        output
+    )
+    assert 'mcp_atlassian_cache_hits_total{cache="test_metrics_cache"} 2' in output
+    assert 'mcp_atlassian_cache_entries{cache="test_metrics_cache"} 1' in output
+    assert (
+        'mcp_atlassian_cache_hit_ratio{cache="test_metrics_cache"} 0.6666666666666666'
+        in output
+    )
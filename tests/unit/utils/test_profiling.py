@@ -0,0 +1,146 @@
+"""Tests for the slow tool call profiler."""
+
+import json
+import pstats
+from pathlib import Path
+
+import pytest
+
+from mcp_atlassian.utils.profiling import (
+    ProfilingConfig,
+    SlowCallProfiler,
+    mask_arguments,
+)
+
+
+def _busy_conversion() -> int:
+    return sum(i * i for i in range(1000))
+
+
+def _make_profiler(
+    tmp_path: Path,
+    *,
+    threshold_ms: float = 0.0,
+    sample: float = 0.0,
+    max_dumps_per_hour: int = 60,
+    timer=lambda: 0.0,  # noqa: ANN001
+) -> SlowCallProfiler:
+    config = ProfilingConfig(
+        dump_dir=tmp_path / "profiles",
+        threshold_ms=threshold_ms,
+        sample_rate=0.5,
+        max_dumps_per_hour=max_dumps_per_hour,
+    )
+    return SlowCallProfiler(config, timer=timer, sampler=lambda: sample)
+
+
+def _dumps(tmp_path: Path, suffix: str) -> list[Path]:
+    return sorted((tmp_path / "profiles").glob(f"*{suffix}"))
+
+
+def test_config_from_env(monkeypatch):
+    """Test the settings are read from the environment and clamped."""
+    monkeypatch.delenv("MCP_PROFILE_DIR", raising=False)
+    assert ProfilingConfig.from_env() is None
+
+    monkeypatch.setenv("MCP_PROFILE_DIR", "/tmp/profiles")
+    monkeypatch.setenv("MCP_PROFILE_THRESHOLD_MS", "250")
+    monkeypatch.setenv("MCP_PROFILE_SAMPLE_RATE", "2")
+    monkeypatch.setenv("MCP_PROFILE_MAX_DUMPS_PER_HOUR", "invalid")
+
+    assert ProfilingConfig.from_env() == ProfilingConfig(
+        dump_dir=Path("/tmp/profiles"),
+        threshold_ms=250.0,
+        sample_rate=1.0,
+        max_dumps_per_hour=60,
+    )
+
+
+def test_mask_arguments():
+    """Test secret-looking arguments are masked, including nested ones."""
+    assert mask_arguments(
+        {
+            "issue_key": "PROJ-1",
+            "limit": 10,
+            "additional_fields": {"api_token": "abcdefghijklmnop"},
+            "password": "short",
+        }
+    ) == {
+        "issue_key": "PROJ-1",
+        "limit": 10,
+        "additional_fields": {"api_token": "abcd********mnop"},
+        "password": "*****",
+    }
+
+
+def test_slow_call_is_dumped(tmp_path):
+    """Test a sampled slow call leaves a profile and its description."""
+    profiler = _make_profiler(tmp_path)
+
+    with profiler.profile("jira_get_issue", {"issue_key": "PROJ-1", "token": "x"}):
+        _busy_conversion()
+
+    [profile_path] = _dumps(tmp_path, ".prof")
+    [report_path] = _dumps(tmp_path, ".json")
+    assert profile_path.name.endswith("-jira_get_issue.prof")
+    report = json.loads(report_path.read_text())
+    assert report["tool"] == "jira_get_issue"
+    assert report["arguments"] == {"issue_key": "PROJ-1", "token": "*"}
+    assert report["profile"] == profile_path.name
+    assert "_busy_conversion" in report["summary"]
+    assert any(
+        function[2] == "_busy_conversion"
+        for function in pstats.Stats(str(profile_path)).stats
+    )
+
+
+def test_failed_slow_call_is_dumped(tmp_path):
+    """Test the profile is kept when the tool raises."""
+    profiler = _make_profiler(tmp_path)
+
+    with (
+        pytest.raises(ValueError, match="boom"),
+        profiler.profile("jira_get_issue", {}),
+    ):
+        raise ValueError("boom")
+
+    assert len(_dumps(tmp_path, ".prof")) == 1
+
+
+@pytest.mark.parametrize(
+    ("threshold_ms", "sample"),
+    [(60_000.0, 0.0), (0.0, 0.5)],
+    ids=["fast", "not-sampled"],
+)
+def test_call_is_not_dumped(tmp_path, threshold_ms, sample):
+    """Test fast calls and calls outside the sample are not dumped."""
+    profiler = _make_profiler(tmp_path, threshold_ms=threshold_ms, sample=sample)
+
+    with profiler.profile("jira_get_issue", {}):
+        _busy_conversion()
+
+    assert not (tmp_path / "profiles").exists()
+
+
+def test_dumps_are_rate_limited(tmp_path):
+    """Test no more than the hourly maximum of dumps is written."""
+    now = [0.0]
+    profiler = _make_profiler(tmp_path, max_dumps_per_hour=1, timer=lambda: now[0])
+
+    for elapsed in (0.0, 1800.0, 3600.0):
+        now[0] = elapsed
+        with profiler.profile("jira_get_issue", {}):
+            _busy_conversion()
+
+    assert len(_dumps(tmp_path, ".prof")) == 2
+
+
+def test_concurrent_call_is_not_profiled(tmp_path):
+    """Test only one call is profiled at a time."""
+    profiler = _make_profiler(tmp_path)
+
+    with profiler.profile("outer", {}), profiler.profile("inner", {}):
+        _busy_conversion()
+
+    [profile_path] = _dumps(tmp_path, ".prof")
+    assert profile_path.name.endswith("-outer.prof")
@@ -0,0 +1,89 @@
+"""Tests for the JSON serialization utilities."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from mcp_atlassian.utils import serialization
+from mcp_atlassian.utils.serialization import (
+    dumps_response,
+    dumps_stdlib,
+    get_json_backend,
+    get_json_format,
+)
+
+SAMPLE = {"key": "PROJ-1", "summary": "Ünïcode ✓", "labels": ["a", "b"], "n": 1}
+
+
+class TestGetJsonFormat:
+    """Tests for get_json_format."""
+
+    def test_default_is_pretty(self, monkeypatch):
+        monkeypatch.delenv("MCP_JSON_FORMAT", raising=False)
+        assert get_json_format() == "pretty"
+
+    def test_compact(self, monkeypatch):
+        monkeypatch.setenv("MCP_JSON_FORMAT", " Compact ")
+        assert get_json_format() == "compact"
+
+    def test_invalid_falls_back_to_pretty(self, monkeypatch):
+        monkeypatch.setenv("MCP_JSON_FORMAT", "yaml")
+        assert get_json_format() == "pretty"
+
+
+class TestGetJsonBackend:
+    """Tests for get_json_backend."""
+
+    def test_forced_stdlib(self, monkeypatch):
+        monkeypatch.setenv("MCP_JSON_BACKEND", "json")
+        assert get_json_backend() == "json"
+
+    def test_auto_without_orjson(self, monkeypatch):
+        monkeypatch.delenv("MCP_JSON_BACKEND", raising=False)
+        with patch.object(serialization, "orjson", None):
+            assert get_json_backend() == "json"
+
+    def test_orjson_requested_but_missing(self, monkeypatch):
+        monkeypatch.setenv("MCP_JSON_BACKEND", "orjson")
+        with patch.object(serialization, "orjson", None):
+            assert get_json_backend() == "json"
+
+
+class TestDumpsResponse:
+    """Tests for dumps_response."""
+
+    @pytest.mark.parametrize("backend", ["json", "auto"])
+    def test_pretty_matches_legacy_output(self, monkeypatch, backend):
+        monkeypatch.delenv("MCP_JSON_FORMAT", raising=False)
+        monkeypatch.setenv("MCP_JSON_BACKEND", backend)
+        assert dumps_response(SAMPLE) == json.dumps(
+            SAMPLE, indent=2, ensure_ascii=False
+        )
+
+    @pytest.mark.parametrize("backend", ["json", "auto"])
+    def test_compact_has_no_whitespace(self, monkeypatch, backend):
+        monkeypatch.setenv("MCP_JSON_FORMAT", "compact")
+        monkeypatch.setenv("MCP_JSON_BACKEND", backend)
+        result = dumps_response(SAMPLE)
+        assert "\n" not in result
+        assert ", " not in result
+        assert "✓" in result
+        assert json.loads(result) == SAMPLE
+
+    def test_explicit_compact_overrides_env(self, monkeypatch):
+        monkeypatch.setenv("MCP_JSON_FORMAT", "pretty")
+        assert dumps_response(SAMPLE, compact=True) == dumps_stdlib(
+            SAMPLE, compact=True
+        )
+
+    def test_falls_back_to_stdlib_on_orjson_error(self, monkeypatch):
+        monkeypatch.setenv("MCP_JSON_BACKEND", "auto")
+        with (
+            patch.object(serialization, "get_json_backend", return_value="orjson"),
+            patch.object(
+                serialization, "dumps_orjson", side_effect=TypeError("too big")
+            ),
+        ):
+            data = {"big": 2**70}
+            assert json.loads(dumps_response(data)) == data
@@ -0,0 +1,164 @@
+"""Tests for the optional OpenTelemetry tracing."""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+from atlassian import Jira
+from requests import PreparedRequest, Response
+from requests.adapters import BaseAdapter
+
+from mcp_atlassian.utils import tracing
+from mcp_atlassian.utils.cache import SharedCache
+from mcp_atlassian.utils.tracing import (
+    configure_tracing,
+    in_current_context,
+    instrument_methods,
+    shutdown_tracing,
+    start_span,
+    trace_rest_client,
+)
+
+
+class _Fetcher:
+    def outer(self) -> list[str]:
+        return [self.inner(), self.inner()]
+
+    def inner(self) -> str:
+        return "abc"
+
+    def pages(self):  # noqa: ANN201
+        yield 1
+
+    def _private(self) -> None:
+        pass
+
+
+class _JsonAdapter(BaseAdapter):
+    """Transport adapter answering every request with an empty JSON object."""
+
+    def send(self, request: PreparedRequest, **kwargs: object) -> Response:
+        response = Response()
+        response.status_code = 200
+        response._content = b"{}"
+        response.url = request.url or ""
+        response.request = request
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+@pytest.fixture
+def span_file(tmp_path: Path):
+    """Enable tracing with a file export and yield a reader for the spans."""
+    pytest.importorskip("opentelemetry.sdk")
+    path = tmp_path / "spans.jsonl"
+    tracing.set_tracing_enabled(enabled=True)
+    configure_tracing(str(path))
+
+    def read_spans() -> dict[str, dict]:
+        shutdown_tracing()
+        spans = [json.loads(line) for line in path.read_text().splitlines()]
+        return {span["name"]: span for span in spans}
+
+    yield read_spans
+    shutdown_tracing()
+    tracing.set_tracing_enabled(enabled=False)
+
+
+def test_nothing_instrumented_when_disabled():
+    """Test classes and clients are left untouched while tracing is disabled."""
+
+    class Fetcher(_Fetcher):
+        pass
+
+    client = Jira(url="https://test.atlassian.net")
+
+    instrument_methods(Fetcher, "test")
+    trace_rest_client(client, "jira")
+
+    assert "outer" not in vars(Fetcher)
+    assert "request" not in vars(client._session)
+    with start_span("test") as span:
+        assert span is None
+
+
+def test_instrument_methods(span_file):
+    """Test public methods get nested spans with their result size."""
+
+    class Fetcher(_Fetcher):
+        pass
+
+    instrument_methods(Fetcher, "test")
+    instrument_methods(Fetcher, "test")
+
+    assert Fetcher().outer() == ["abc", "abc"]
+    assert list(Fetcher().pages()) == [1]
+
+    assert set(vars(Fetcher)) >= {"outer", "inner"}
+    assert "pages" not in vars(Fetcher)
+    assert "_private" not in vars(Fetcher)
+    spans = span_file()
+    assert set(spans) == {"test.outer", "test.inner"}
+    assert spans["test.outer"]["attributes"] == {"mcp_atlassian.result.size": 2}
+    assert spans["test.inner"]["parent_id"] == spans["test.outer"]["context"]["span_id"]
+
+
+def test_trace_rest_client(span_file):
+    """Test HTTP requests get client spans with status and body size."""
+    client = Jira(url="https://test.atlassian.net")
+    client._session.mount("https://", _JsonAdapter())
+    trace_rest_client(client, "jira")
+
+    with start_span("tools/call jira_get_issue"):
+        client.get("rest/api/2/issue/PROJ-1")
+
+    spans = span_file()
+    span = spans["GET /rest/api/2/issue/{id}"]
+    tool_span = spans["tools/call jira_get_issue"]
+    assert span["kind"] == "SpanKind.CLIENT"
+    assert span["parent_id"] == tool_span["context"]["span_id"]
+    assert span["attributes"] == {
+        "http.request.method": "GET",
+        "url.path": "/rest/api/2/issue/{id}",
+        "server.address": "test.atlassian.net",
+        "mcp_atlassian.service": "jira",
+        "http.response.status_code": 200,
+        "http.response.body.size": 2,
+    }
+
+
+def test_pool_worker_spans_keep_their_parent(span_file):
+    """Test HTTP spans made on pool workers belong to the tool span's trace."""
+    client = Jira(url="https://test.atlassian.net")
+    client._session.mount("https://", _JsonAdapter())
+    trace_rest_client(client, "jira")
+
+    with (
+        start_span("tools/call jira_get_issue"),
+        ThreadPoolExecutor(max_workers=2) as executor,
+    ):
+        fetch = in_current_context(client.get)
+        list(executor.map(fetch, ["rest/api/2/issue/PROJ-1"] * 2))
+
+    spans = span_file()
+    span = spans["GET /rest/api/2/issue/{id}"]
+    tool_span = spans["tools/call jira_get_issue"]
+    assert span["context"]["trace_id"] == tool_span["context"]["trace_id"]
+    assert span["parent_id"] == tool_span["context"]["span_id"]
+
+
+def test_cache_lookups_are_span_events(span_file):
+    """Test shared cache hits and misses are added to the current span."""
+    cache: SharedCache[str] = SharedCache("test_tracing_cache", ttl=60)
+
+    with start_span("lookup"):
+        cache.get("a")
+        cache.set("a", "value")
+        cache.get("a")
+
+    events = span_file()["lookup"]["events"]
+    assert [event["name"] for event in events] == ["cache.miss", "cache.hit"]
+    assert events[0]["attributes"] == {"cache.name": "test_tracing_cache"}